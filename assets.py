@@ -0,0 +1,170 @@
+# assets.py
+
+import os
+import struct
+
+import pygame
+from settings import DIRT_LEVELS
+from game_log import get_logger
+
+log = get_logger("assets")
+
+# 預先縮放好的圖片包：把預先載入的所有圖片（含縮放後的版本）以原始像素保存，
+# 之後啟動時直接讀取，不必再解碼 PNG 或縮放
+BUNDLE_PATH = "./img/assets.bundle"
+BUNDLE_MAGIC = b"FARMPACK"
+BUNDLE_VERSION = 1
+# 檔頭：BUNDLE_MAGIC、版本、圖片數量
+BUNDLE_HEADER = struct.Struct("<8sHI")
+# 每張圖片：路徑長度（UTF-8 位元組）、快取 key 的寬高（原圖為 0）、是否保留透明度、
+# 實際寬高，之後接著路徑與 RGBA（不透明的圖片為 RGB）像素
+BUNDLE_ENTRY = struct.Struct("<HHHBHH")
+
+
+class AssetManager:
+    """
+    全域共用的圖片快取，以 (路徑, 尺寸, 是否保留透明度) 為 key。
+    同一張圖片只會從硬碟解碼、縮放一次，之後都回傳同一個 Surface，
+    因此拿到的 Surface 不可以直接修改（需要時請先 copy()）。
+
+    hits / misses 記錄快取命中與未命中的次數，
+    穩定運行時 misses 不應再增加（代表沒有任何硬碟 I/O）。
+    """
+
+    def __init__(self):
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, size=None, alpha=True):
+        """
+        取得圖片；size 為 (寬, 高) 時回傳縮放後的版本。
+        """
+        key = (path, size, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if size is None:
+            surface = self.convert(pygame.image.load(path), alpha)
+        else:
+            # 縮放版本由原圖產生，原圖也一併快取起來
+            original = self.surfaces.get((path, None, alpha))
+            if original is None:
+                original = self.convert(pygame.image.load(path), alpha)
+                self.surfaces[(path, None, alpha)] = original
+            surface = pygame.transform.scale(original, size)
+        self.surfaces[key] = surface
+        return surface
+
+    def convert(self, surface, alpha):
+        # 還沒建立視窗時無法轉換像素格式，直接使用原圖
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def preload(self, specs):
+        """預先載入 (路徑, 尺寸, 是否保留透明度) 清單中的圖片。"""
+        for path, size, alpha in specs:
+            self.get(path, size, alpha)
+
+    def save_bundle(self, path):
+        """把快取中的所有圖片寫入圖片包（先寫到暫存檔再取代，多個進程同時寫入也不會損壞）。"""
+        data = bytearray(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(self.surfaces)))
+        for (image_path, size, alpha), surface in self.surfaces.items():
+            encoded = image_path.encode("utf-8")
+            key_width, key_height = size if size is not None else (0, 0)
+            data += BUNDLE_ENTRY.pack(len(encoded), key_width, key_height, alpha, *surface.get_size())
+            data += encoded
+            data += pygame.image.tobytes(surface, "RGBA" if alpha else "RGB")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def load_bundle(self, path):
+        """
+        把圖片包中的圖片放進快取，回傳是否成功。
+        圖片包不存在、格式不符，或比其中任何一張來源圖片舊時不使用。
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            bundle_time = os.path.getmtime(path)
+            magic, version, count = BUNDLE_HEADER.unpack_from(data)
+            if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                return False
+
+            entries = []
+            offset = BUNDLE_HEADER.size
+            for _ in range(count):
+                length, key_width, key_height, alpha, width, height = BUNDLE_ENTRY.unpack_from(data, offset)
+                offset += BUNDLE_ENTRY.size
+                image_path = data[offset : offset + length].decode("utf-8")
+                offset += length
+                pixels = data[offset : offset + width * height * (4 if alpha else 3)]
+                offset += len(pixels)
+                size = (key_width, key_height) if key_width else None
+                entries.append((image_path, size, bool(alpha), (width, height), pixels))
+
+            # 建立圖片包之後來源圖片被修改過，就改為重新解碼
+            if any(os.path.getmtime(entry[0]) > bundle_time for entry in entries):
+                return False
+            surfaces = {
+                (image_path, size, alpha): self.convert(
+                    pygame.image.frombuffer(pixels, surface_size, "RGBA" if alpha else "RGB"), alpha
+                )
+                for image_path, size, alpha, surface_size, pixels in entries
+            }
+        except (OSError, struct.error, ValueError):
+            return False
+        self.surfaces.update(surfaces)
+        return True
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "surfaces": len(self.surfaces)}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.surfaces.clear()
+        self.reset_stats()
+
+
+# 整個程式共用的快取
+assets = AssetManager()
+
+
+def preload_game_assets(bundle_path=BUNDLE_PATH):
+    """
+    載入遊戲中會用到的背景、農夫、泥土、作物、種子與庫存圖片，需在建立視窗後呼叫。
+    有最新的圖片包時直接讀取；否則解碼、縮放後寫入圖片包，之後啟動（包含每個自動遊玩的實例）
+    都不必再處理 PNG。bundle_path 為 None 時不使用圖片包。
+    """
+    from background import BG_IMAGE, FARM_GRID_IMAGE
+    from farmer import FARMER_SPRITESHEET
+    from dirt import DIRT_IMAGE_SIZE
+    from plant import GROWTH_STAGES, PLANT_SIZE
+    from seed import SEED_TYPES, SEED_IMAGE_SIZE
+    from inventory import INVENTORY_IMAGE, NUMBER_IMAGES
+
+    specs = [(BG_IMAGE, None, False), (FARM_GRID_IMAGE, None, True), (FARMER_SPRITESHEET, None, True)]
+    specs += [(level["image"], DIRT_IMAGE_SIZE, True) for level in DIRT_LEVELS]
+    specs += [(path, PLANT_SIZE, True) for path in GROWTH_STAGES]
+    specs += [(seed_type.IMAGE_PATH, SEED_IMAGE_SIZE, True) for seed_type in SEED_TYPES.values()]
+    specs += [(INVENTORY_IMAGE, None, True)]
+    specs += [(path, None, True) for path in NUMBER_IMAGES]
+
+    loaded = bundle_path is not None and assets.load_bundle(bundle_path)
+    misses = assets.misses
+    assets.preload(specs)
+    # 沒有圖片包，或圖片包缺少某些圖片時重新寫入
+    if bundle_path is not None and (not loaded or assets.misses != misses):
+        try:
+            assets.save_bundle(bundle_path)
+        except OSError as error:
+            log.warning("無法寫入圖片包 %s：%s", bundle_path, error)
@@ -0,0 +1,230 @@
+# auto_game.py
+
+import sys
+from pathlib import Path
+
+import pygame
+
+from main_game import Game
+from game_clock import GameClock
+from game_log import get_logger
+from headless_game import HeadlessGame, episode_name
+from settings import GRID_ROWS, GRID_COLS, EPISODE_TIME, RENDER_MODES
+
+log = get_logger("auto_game")
+
+
+class AutoGame(Game):
+    """
+    自動化代理類別，繼承自 Game，直接控制農夫移動並執行動作。
+    動作、成長與數據收集交給 HeadlessGame，這裡只負責畫面。
+
+    render 決定哪些模擬步驟要繪製畫面（見 settings.RENDER_MODES），沒有繪製的步驟只執行遊戲邏輯，
+    不更新特效與攝影機、不繪製也不呼叫 display.flip()。
+    sample_times 為要截圖的遊戲時間（秒），到達時一定會繪製並把畫面存成 PNG。
+    """
+
+    def __init__(
+        self,
+        instance_id=1,
+        speed_multiplier=1,
+        fast=False,
+        seed=None,
+        rows=GRID_ROWS,
+        cols=GRID_COLS,
+        log_format="csv",
+        profile=False,
+        policy=None,
+        render="every",
+        render_every=1,
+        sample_times=(),
+    ):
+        if render not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode {render!r} (expected one of {', '.join(RENDER_MODES)})")
+        if render_every < 1:
+            raise ValueError("render_every must be at least 1")
+        # 遊戲時鐘：fast 模式使用虛擬時鐘，每次迴圈固定前進一幀的遊戲時間，
+        # 不再受 FPS 限制；一般模式則讓真實時間乘上速度倍數
+        if fast:
+            game_clock = GameClock(virtual=True)
+        else:
+            game_clock = GameClock(speed_multiplier=speed_multiplier)
+        # 這一局的紀錄、每幀耗時與截圖使用同一個名稱
+        name = episode_name(instance_id, seed)
+        # 開啟分析器時，每個實例的每幀耗時寫入各自的檔案
+        profile_path = f"log/profile_{name}.csv" if profile else None
+        super().__init__(game_clock=game_clock, rows=rows, cols=cols, profile_path=profile_path)
+
+        # 設定 FPS
+        self.FPS = 60
+
+        # 自動遊玩流程（隨機動作、數據收集），與畫面共用同一個 FarmModel
+        self.session = HeadlessGame(
+            instance_id=instance_id,
+            total_time=EPISODE_TIME,  # 總遊戲時間 60 秒
+            farm=self.farm,
+            game_clock=self.game_clock,
+            seed=seed,
+            on_move=self.move_farmer_to,
+            log_format=log_format,
+            policy=policy,
+            name=name,
+        )
+
+        # 初始化遊戲時間
+        self.game_time = 0  # in seconds
+
+        # 設定遊戲速度倍數
+        self.speed_multiplier = speed_multiplier  # 例如，10x speed
+
+        # 是否以不限速的虛擬時鐘執行
+        self.fast = fast
+
+        # 設定實例ID，用於識別不同的遊戲實例
+        self.instance_id = instance_id
+
+        # 畫面更新頻率
+        self.render_mode = render
+        self.render_every = render_every
+        self.steps = 0  # 已執行的模擬步數
+        self.frames_rendered = 0
+        # changes 模式：上一次繪製時的畫面狀態，格子改變由 FarmModel 事件通知
+        self.last_scene = None
+        self.scene_changed = True
+        self.farm.add_listener(self.on_scene_event)
+
+        # 截圖的遊戲時間（秒，由小到大）與存放的資料夾
+        self.sample_times = sorted(sample_times)
+        self.next_sample = 0
+        self.sample_dir = None
+        if self.sample_times:
+            self.sample_dir = Path(f"log/frames_{self.session.name}")
+
+    def run(self):
+        """
+        覆寫 Game.run()，加入自動化動作流程和數據收集，回傳最終金幣數。
+        """
+        profiler = self.profiler
+        while True:
+            profiler.begin_frame()
+
+            # 1. 更新遊戲時間（由遊戲時鐘統一提供）
+            if self.fast:
+                self.game_clock.advance(1000 / self.FPS)
+            self.game_time = self.game_clock.get_ticks() / 1000.0
+
+            # 2. 檢查是否超過總遊戲時間（結束時會記錄最後一秒並儲存數據）
+            if self.game_time >= self.session.total_time:
+                self.session.game_time = self.game_time
+                final_coin = self.session.finish()
+                log.debug("共 %d 步，繪製 %d 幀。", self.steps, self.frames_rendered, extra=self.session.log_extra)
+                profiler.close()
+                pygame.quit()
+                return final_coin
+
+            # 3. 處理事件
+            # 為了避免窗口無回應，仍需處理 Pygame 事件
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.session.save_game_data()
+                    profiler.close()
+                    pygame.quit()
+                    sys.exit()
+            profiler.mark("events")
+
+            # 4. 更新遊戲狀態
+            keys = pygame.key.get_pressed()
+            self.farmer.update(keys)
+            profiler.mark("farmer")
+
+            # 5. 執行到期的隨機動作、更新種子與作物成長，並每秒記錄一次遊戲狀態
+            self.session.update(self.game_time)
+            profiler.mark("session")
+
+            # 6. 決定這一步是否繪製畫面（特效依遊戲時間計算，跳過的步驟不需要更新）
+            sample = self.sample_due()
+            if sample or self.should_render():
+                # 7. 更新所有特效並繪製畫面
+                self.update_effects()
+                profiler.mark("animations")
+                self.update_camera()
+                profiler.mark("camera")
+                self.draw_frame()
+
+                pygame.display.flip()
+                profiler.mark("flip")
+                self.frames_rendered += 1
+                if sample:
+                    self.save_sample()
+                    profiler.mark("sample")
+            self.steps += 1
+
+            if not self.fast:
+                self.clock.tick(self.FPS)
+                profiler.mark("tick")
+            profiler.end_frame()
+
+    def on_scene_event(self, event, row, col):
+        self.scene_changed = True
+
+    def scene_key(self):
+        """畫面上會改變的遊戲狀態（農夫原地踏步的動畫不算）。"""
+        farmer = self.farmer
+        return (
+            self.coin.get_amount(),
+            self.seed_inventory.store.version,
+            farmer.x,
+            farmer.y,
+            farmer.direction,
+            self.timer_text(),
+        )
+
+    def should_render(self):
+        """依 render_mode 判斷這一步是否繪製畫面。"""
+        if self.render_mode == "every":
+            return self.steps % self.render_every == 0
+        if self.render_mode == "changes":
+            # 還有特效時每一步都要繪製（特效最後一次消失也要重畫一次把它擦掉）
+            key = self.scene_key()
+            if not self.scene_changed and not len(self.effects) and key == self.last_scene:
+                return False
+            self.last_scene = key
+            self.scene_changed = False
+            return True
+        return False
+
+    def sample_due(self):
+        """是否到了下一個截圖時間（同一步跨過多個截圖時間時只截一張）。"""
+        due = False
+        while self.next_sample < len(self.sample_times) and self.game_time >= self.sample_times[self.next_sample]:
+            self.next_sample += 1
+            due = True
+        return due
+
+    def save_sample(self):
+        self.sample_dir.mkdir(parents=True, exist_ok=True)
+        path = self.sample_dir / f"{round(self.game_time * 1000):06d}ms.png"
+        pygame.image.save(self.screen, str(path))
+        log.info("已儲存畫面 %s。", path, extra=self.session.log_extra)
+
+    def move_farmer_to(self, r, c):
+        """
+        直接將農夫移動至指定農地格子的中心位置。
+        """
+        # 計算目標位置的中心點座標
+        target_x = (
+            self.background.farm_grid_x
+            + c * self.farm_grid.block_width
+            + self.farm_grid.block_width // 2
+            - self.farmer.image_width // 2  # 調整農夫位置使其置中
+        )
+        target_y = (
+            self.background.farm_grid_y
+            + r * self.farm_grid.block_height
+            + self.farm_grid.block_height // 2
+            - self.farmer.image_height // 2  # 調整農夫位置使其置中
+        )
+
+        # 直接設定農夫的位置
+        self.farmer.x = target_x
+        self.farmer.y = target_y
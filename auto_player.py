@@ -1,379 +1,176 @@
 # auto_player.py
 
-import random
-import datetime
 import os
 
-import pygame
-import pandas as pd
-from pathlib import Path
+import importlib
 import multiprocessing
 import argparse
-import os
 import sys
+import csv
+import time
+import datetime
+from pathlib import Path
 
-from dirt import Dirt
-from main_game import Game
-from settings import GRID_ROWS, GRID_COLS, DIRT_LEVELS
-from plant import Plant
+from headless_game import HeadlessGame
+from farm_model import FarmModel
+from policy import POLICIES, create_policy
+from settings import GRID_ROWS, GRID_COLS, EPISODE_TIME, RENDER_MODES
+from game_log import get_logger, configure as configure_logging, start_shared_writer, LEVELS
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
+log = get_logger("auto_player")
+
+
+def run_auto_game(
+    instance_id,
+    speed_multiplier,
+    fast=False,
+    headless=False,
+    fast_forward=False,
+    rows=GRID_ROWS,
+    cols=GRID_COLS,
+    log_format="csv",
+    seed=None,
+    profile=False,
+    policy="random",
+    render="every",
+    render_every=1,
+    sample_times=(),
+):
+    """
+    啟動一個 AutoGame 實例並回傳最終金幣數；
+    headless 模式則直接驅動 FarmModel，不建立視窗也不載入圖片。
+    render、render_every 與 sample_times 決定 AutoGame 繪製畫面的頻率與截圖時間。
+    """
+    if headless or fast_forward:
+        game = HeadlessGame(
+            instance_id=instance_id,
+            total_time=EPISODE_TIME,
+            farm=FarmModel(rows=rows, cols=cols),
+            seed=seed,
+            log_format=log_format,
+            policy=create_policy(policy),
+        )
+        return game.run(fast_forward=fast_forward)
+    else:
+        # pygame 與畫面相關的模組只在需要畫面時才載入，headless 與批次模式不需要
+        from auto_game import AutoGame
+
+        game = AutoGame(
+            instance_id=instance_id,
+            speed_multiplier=speed_multiplier,
+            fast=fast,
+            seed=seed,
+            rows=rows,
+            cols=cols,
+            log_format=log_format,
+            profile=profile,
+            policy=create_policy(policy),
+            render=render,
+            render_every=render_every,
+            sample_times=sample_times,
+        )
+        return game.run()
+
 
-class AutoGame(Game):
+def preload_display_modules(headless, fast_forward):
     """
-    自動化代理類別，繼承自 Game，直接控制農夫移動並執行動作。
+    需要畫面時先在主進程載入 pygame 與畫面相關的模組，fork 出來的子進程直接沿用，
+    不必每個實例各自重新 import 一次；headless 模式則完全不載入。
     """
+    if not (headless or fast_forward):
+        importlib.import_module("auto_game")
 
-    def __init__(self, instance_id=1, speed_multiplier=1):
-        super().__init__()
-
-        # 總遊戲時間（秒，1 分鐘 = 60 秒）
-        self.total_time = 60  # 60 秒
 
-        # 設定 FPS
-        self.FPS = 60
+def run_instance(log_queue, log_level, *args):
+    """
+    多實例模式的子進程：訊息交給主進程的唯一寫入者輸出（log_queue 為 None 表示 --quiet），再執行一局。
+    """
+    configure_logging(log_level, silent=log_queue is None, log_queue=log_queue)
+    return run_auto_game(*args)
 
-        # 下一次執行隨機動作的時間點（秒）
-        self.next_action_time = 0  # 2 秒後首次動作
 
-        # 初始化數據收集結構
-        self.game_data = []  # 用於儲存每秒的遊戲狀態
-        self.last_record_second = -1  # 上一次記錄的秒數
-
-        # 紀錄遊戲開始的實際時間，用於命名檔案
-        self.game_start_datetime = datetime.datetime.now()
-        self.csv_filename = f"log/game_{self.game_start_datetime.strftime('%Y%m%d_%H%M%S')}_instance{instance_id}.csv"
-
-        # 確認是否有log資料夾，若無則建立
-        Path("log").mkdir(exist_ok=True)
-
-        # 初始化遊戲時間
-        self.game_time = 0  # in seconds
-
-        # 設定遊戲速度倍數
-        self.speed_multiplier = speed_multiplier  # 例如，10x speed
-
-        # 初始化時間追蹤
-        self.last_frame_ticks = pygame.time.get_ticks()
-
-        # 設定實例ID，用於識別不同的遊戲實例
-        self.instance_id = instance_id
-
-    def run(self):
-        """
-        覆寫 Game.run()，加入自動化動作流程和數據收集。
-        """
-        while True:
-            # 1. 更新遊戲時間
-            current_ticks = pygame.time.get_ticks()
-            delta_ticks = current_ticks - self.last_frame_ticks
-            delta_seconds = delta_ticks / 1000.0
-            self.game_time += delta_seconds * self.speed_multiplier
-            self.last_frame_ticks = current_ticks
-
-            # 2. 檢查是否超過總遊戲時間
-            if self.game_time >= self.total_time:
-                # 在遊戲結束前記錄最後一秒的狀態
-                self.record_game_state(self.game_time)
-
-                final_coin = self.coin.get_amount()
-                print(f"[Instance {self.instance_id}] Time's up! Final coin count = {final_coin}")
-
-                # 儲存數據
-                self.save_game_data()
-
-                pygame.quit()
-                return
-
-            # 3. 檢查是否需要執行下一次動作
-            if self.game_time >= self.next_action_time:
-                self.do_random_action()
-                # 設定下一次動作的時間點（隨機 2~5 秒後）
-                self.next_action_time = self.game_time + random.randint(2, 5)
-
-            # 4. 處理事件
-            # 為了避免窗口無回應，仍需處理 Pygame 事件
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.save_game_data()
-                    pygame.quit()
-                    sys.exit()
-
-            # 5. 更新遊戲狀態
-            keys = pygame.key.get_pressed()
-            self.farmer.update(keys)
-
-            # 6. 更新種子與作物成長
-            self.update_seeds()
-            self.update_plants_growth()
-
-            # 7. 更新所有金幣動畫
-            for animation in self.coin_animations[:]:
-                animation.update()
-                if animation.alpha <= 0:
-                    self.coin_animations.remove(animation)
-
-            # 8. 繪製畫面
-            self.background.draw(self.screen)
-            self.seed_inventory.draw(self.screen)
-
-            for row in self.dirt_grid:
-                for dirt in row:
-                    if dirt:
-                        dirt.draw(self.screen)
-
-            self.farmer.draw(self.screen)
-            self.draw_coins()
-            self.draw_timer()
-            self.draw_grid_lines()
-
-            for animation in self.coin_animations:
-                animation.draw(self.screen)
-
-            pygame.display.flip()
-            self.clock.tick(self.FPS)
-
-            # 9. 每秒記錄一次遊戲狀態
-            self.record_game_state(self.game_time)
-
-    def do_random_action(self):
-        """
-        執行一次隨機動作：先嘗試收穫，若無則隨機放土與種植。
-        """
-        # 先嘗試收穫
-        harvested = self.try_harvest()
-        if not harvested:
-            # 若無可收穫的作物，則隨機放土與種植
-            self.place_soil_and_plant()
-
-    def try_harvest(self):
-        """
-        檢查所有農地，若有植物已到第 5 階段，則移動農夫至該位置並收穫。
-        回傳是否有成功收穫。
-        """
-        # 收集所有成熟的作物位置
-        candidates = []
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                dirt = self.dirt_grid[r][c]
-                if dirt and dirt.plant and dirt.plant.stage == 5:
-                    candidates.append((r, c))
-        if not candidates:
-            return False
-
-        # 隨機選擇一塊成熟的作物
-        target_r, target_c = random.choice(candidates)
-        self.move_farmer_to(target_r, target_c)
-
-        # 執行收穫
-        self.harvest(target_r, target_c)
-        return True
-
-    def place_soil_and_plant(self):
-        """
-        隨機選擇一塊農地，移動農夫至該位置，放土並種植作物。
-        """
-        # 隨機選擇一塊農地
-        r = random.randint(0, GRID_ROWS - 1)
-        c = random.randint(0, GRID_COLS - 1)
-
-        # 移動農夫至該位置
-        self.move_farmer_to(r, c)
-
-        # 放置泥土
-        self.place_soil(r, c)
-
-        # 種植作物
-        self.plant_seed(r, c)
-
-    def move_farmer_to(self, r, c):
-        """
-        直接將農夫移動至指定農地格子的中心位置。
-        """
-        # 計算目標位置的中心點座標
-        target_x = (
-            self.background.farm_grid_x
-            + c * self.farm_grid.block_width
-            + self.farm_grid.block_width // 2
-            - self.farmer.image_width // 2  # 調整農夫位置使其置中
-        )
-        target_y = (
-            self.background.farm_grid_y
-            + r * self.farm_grid.block_height
-            + self.farm_grid.block_height // 2
-            - self.farmer.image_height // 2  # 調整農夫位置使其置中
+def run_episode(task):
+    """
+    批次模式的工作函數：執行一局並回傳該局的結果。
+    """
+    instance_id, seed, options = task
+    start = time.perf_counter()
+    final_coin = run_auto_game(instance_id, seed=seed, **options)
+    return {
+        "Instance ID": instance_id,
+        "Seed": "" if seed is None else seed,
+        "Final Coins": final_coin,
+        "Wall Time (s)": round(time.perf_counter() - start, 4),
+    }
+
+
+def run_batch(num_episodes, workers, base_seed=None, verbose=False, log_level="INFO", **options):
+    """
+    以固定大小的進程池執行 num_episodes 局，結果一完成就寫入同一個彙總 CSV，
+    並回報吞吐量（每秒局數、每秒模擬的遊戲秒數）。回傳所有局的結果。
+    """
+    summary_filename = f"log/batch_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    Path(summary_filename).parent.mkdir(parents=True, exist_ok=True)
+
+    tasks = [
+        (i, None if base_seed is None else base_seed + i, options)
+        for i in range(1, num_episodes + 1)
+    ]
+    # 每次交給工作進程多局，減少進程間通訊的次數
+    chunksize = max(1, num_episodes // (workers * 8))
+
+    preload_display_modules(options.get("headless"), options.get("fast_forward"))
+
+    results = []
+    start = time.perf_counter()
+    last_report = start
+    # 工作進程預設不處理任何訊息；verbose 時交給主進程的唯一寫入者輸出
+    if verbose:
+        initargs = (log_level, False, start_shared_writer(log_level))
+    else:
+        initargs = (log_level, True)
+    with multiprocessing.Pool(workers, initializer=configure_logging, initargs=initargs) as pool, open(
+        summary_filename, "w", newline="", encoding="utf-8-sig"
+    ) as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=["Instance ID", "Seed", "Final Coins", "Wall Time (s)"],
+            lineterminator="\n",
         )
-
-        # 直接設定農夫的位置
-        self.farmer.x = target_x
-        self.farmer.y = target_y
-
-    def place_soil(self, r, c):
-        """
-        在指定農地放置泥土，若該格無泥土且金幣足夠。
-        """
-        dirt = self.dirt_grid[r][c]
-        if dirt is None:
-            # 放置新的泥土，成本為50金幣
-            cost = 50
-            if self.coin.get_amount() >= cost:
-                dirt = Dirt(
-                    grid_x=c,
-                    grid_y=r,
-                    farm_grid_x=self.background.farm_grid_x,
-                    farm_grid_y=self.background.farm_grid_y,
-                    block_width=self.farm_grid.block_width,
-                    block_height=self.farm_grid.block_height,
-                    level=0,
-                )
-                self.dirt_grid[r][c] = dirt
-                self.coin.decrease(cost)
-                print(f"[Instance {self.instance_id}] Placed dirt at ({r}, {c}).")
-            else:
-                print(f"[Instance {self.instance_id}] Insufficient coins to place dirt.")
-        else:
-            # 嘗試升級泥土
-            if dirt.level < len(DIRT_LEVELS) - 1:
-                upgrade_cost = DIRT_LEVELS[dirt.level]["upgrade_cost"]
-                if self.coin.get_amount() >= upgrade_cost:
-                    self.coin.decrease(upgrade_cost)
-                    dirt.upgrade()
-                    print(
-                        f"[Instance {self.instance_id}] Upgraded dirt at ({r}, {c}) to level {dirt.level}."
-                    )
-                else:
-                    print(f"[Instance {self.instance_id}] Insufficient coins to upgrade dirt.")
-            else:
+        writer.writeheader()
+        for result in pool.imap_unordered(run_episode, tasks, chunksize):
+            writer.writerow(result)
+            results.append(result)
+
+            now = time.perf_counter()
+            if now - last_report >= 1 or len(results) == num_episodes:
+                last_report = now
+                f.flush()
+                elapsed = now - start
                 print(
-                    f"[Instance {self.instance_id}] Dirt at ({r}, {c}) is already at maximum level."
+                    f"已完成 {len(results)}/{num_episodes} 局，"
+                    f"{len(results) / elapsed:.1f} 局/秒，"
+                    f"{len(results) * EPISODE_TIME / elapsed:.0f} 遊戲秒/秒。"
                 )
 
-    def plant_seed(self, r, c):
-        """
-        在指定農地種植作物，若該格有泥土且無作物且有種子。
-        """
-        dirt = self.dirt_grid[r][c]
-        if dirt and dirt.plant is None:
-            # 選擇一種種子（隨機選擇）
-            available_seeds = [item for item in self.seed_inventory.items if item]
-            if available_seeds:
-                seed = random.choice(available_seeds)
-                # 找出種子的索引
-                seed_index = self.seed_inventory.items.index(seed)
-                # 種植作物
-                plant_image_path = "./img/CropSeed2.png"  # 可以根據種子種類調整
-                plant = Plant(image_path=plant_image_path, scale=(64, 64))
-                dirt.plant_seed(plant)
-                # 庫存減1
-                self.seed_inventory.quantities[seed_index] -= 1
-                if self.seed_inventory.quantities[seed_index] == 0:
-                    self.seed_inventory.items[seed_index] = None
-                print(f"[Instance {self.instance_id}] Planted {seed.name} at ({r}, {c}).")
-            else:
-                print(f"[Instance {self.instance_id}] No seeds available to plant.")
-        else:
-            print(
-                f"[Instance {self.instance_id}] Cannot plant at ({r}, {c}). Either no dirt or already has a plant."
-            )
-
-    def harvest(self, r, c):
-        """
-        收穫指定農地的作物，若該作物已到達第5階段。
-        """
-        dirt = self.dirt_grid[r][c]
-        if dirt and dirt.plant and dirt.plant.stage == 5:
-            # 增加金幣
-            self.coin.increase(50)
-            print(
-                f"[Instance {self.instance_id}] Harvested plant at ({r}, {c}) and gained 50 coins."
-            )
-            # 移除作物
-            dirt.plant = None
-
-            # 創建收穫動畫
-            coin_text = f"金幣：{self.coin.get_amount()}"
-            coin_text_width, _ = self.font.size(coin_text)
-
-            anim_x = 10 + coin_text_width + 10
-            anim_y = 10
-
-            animation = self.create_coin_animation(
-                x=anim_x,
-                y=anim_y,
-                text="+50",
-                color="#FF3E3E",
-                duration=2000,
-            )
-            self.coin_animations.append(animation)
-        else:
-            print(f"[Instance {self.instance_id}] No mature plant to harvest at ({r}, {c}).")
-
-    def record_game_state(self, game_time):
-        """
-        每秒記錄一次遊戲狀態。
-        包括每個土壤位置的資訊（座標、土壤等級、植物等級）、時間（秒數）、金幣數量。
-        """
-        # 計算經過的秒數
-        elapsed_seconds = int(game_time)
-
-        # 確保每秒只記錄一次
-        if elapsed_seconds > self.last_record_second:
-            self.last_record_second = elapsed_seconds
-
-            # 收集每個土壤位置的資訊
-            for r in range(GRID_ROWS):
-                for c in range(GRID_COLS):
-                    dirt = self.dirt_grid[r][c]
-                    if dirt is None:
-                        soil_level = 0  # 沒有土壤
-                        plant_level = 0  # 沒有植物
-                        soil_x = 0
-                        soil_y = 0
-                    else:
-                        soil_level = dirt.level + 1  # 1~4，根據 DIRT_LEVELS
-                        plant_level = dirt.plant.stage if dirt.plant else 0  # 1~5 或 0
-
-                        # 取得土壤圖片的座標（左上角）
-                        soil_x = dirt.farm_grid_x + c * dirt.block_width
-                        soil_y = dirt.farm_grid_y + r * dirt.block_height
-
-                    # 構建數據字典
-                    data_entry = {
-                        "Time (s)": elapsed_seconds,
-                        "Grid Row": r,
-                        "Grid Column": c,
-                        "Soil Level": soil_level,
-                        "Plant Level": plant_level,
-                        "Coins": self.coin.get_amount(),
-                        "Instance ID": self.instance_id,
-                    }
-
-                    self.game_data.append(data_entry)
-
-    def save_game_data(self):
-        """
-        將收集到的遊戲數據儲存為 .csv 檔案。
-        檔名包含遊戲開始時的時間和實例ID。
-        """
-        if not self.game_data:
-            print(f"[Instance {self.instance_id}] No game data to save.")
-            return
-
-        # 創建 DataFrame
-        df = pd.DataFrame(self.game_data)
-
-        # 儲存為 .csv 檔案
-        df.to_csv(self.csv_filename, index=False, encoding='utf-8-sig')
-        print(f"[Instance {self.instance_id}] Game data saved to {self.csv_filename}.")
-
-
-def run_auto_game(instance_id, speed_multiplier):
-    """
-    啟動一個 AutoGame 實例。
-    """
-    game = AutoGame(instance_id=instance_id, speed_multiplier=speed_multiplier)
-    game.run()
+    elapsed = time.perf_counter() - start
+    coins = [result["Final Coins"] for result in results]
+    print(
+        f"批次完成：{num_episodes} 局，{workers} 個進程，耗時 {elapsed:.2f} 秒"
+        f"（{num_episodes / elapsed:.1f} 局/秒，{num_episodes * EPISODE_TIME / elapsed:.0f} 遊戲秒/秒）。"
+    )
+    print(f"平均最終金幣 {sum(coins) / len(coins):.1f}，結果已儲存至 {summary_filename}。")
+    return results
+
+
+def parse_times(text):
+    """解析以逗號分隔的秒數（--sample_frames）。"""
+    try:
+        return tuple(float(part) for part in text.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"無效的時間列表：{text}")
 
 
 def main():
@@ -395,6 +192,96 @@ def main():
         default=1.0,
         help="遊戲速度倍數（預設為 1.0）。",
     )
+    parser.add_argument(
+        "-f",
+        "--fast",
+        action="store_true",
+        help="使用虛擬時鐘、不限 FPS，盡可能快速完成模擬（會忽略速度倍數）。",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="不使用 pygame，直接以 FarmModel 模擬（隱含 --fast）。",
+    )
+    parser.add_argument(
+        "--fast_forward",
+        action="store_true",
+        help="headless 模擬時直接跳到下一個事件，而不是逐幀前進（隱含 --headless）。",
+    )
+    parser.add_argument(
+        "--render",
+        choices=RENDER_MODES,
+        default="every",
+        help="AutoGame 繪製畫面的時機：every 每 --render_every 步一次（預設）、"
+        "changes 只在畫面上的遊戲狀態改變時、none 完全不繪製。",
+    )
+    parser.add_argument(
+        "--render_every",
+        type=int,
+        default=1,
+        help="render 為 every 時，每幾個模擬步驟繪製一次畫面（預設為 1）。",
+    )
+    parser.add_argument(
+        "--sample_frames",
+        type=parse_times,
+        default=(),
+        help="在這些遊戲時間（秒，以逗號分隔，例如 10,30,59）截圖，存到 log/frames_*/。",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=GRID_ROWS,
+        help=f"農場列數（預設為 {GRID_ROWS}）。",
+    )
+    parser.add_argument(
+        "--cols",
+        type=int,
+        default=GRID_COLS,
+        help=f"農場行數（預設為 {GRID_COLS}）。",
+    )
+    parser.add_argument(
+        "--log_format",
+        choices=["csv", "binary", "delta", "none"],
+        default=None,
+        help="遊戲數據的紀錄格式：csv（預設）、精簡的二進位格式 binary、只記錄變化的 delta，"
+        "或不記錄 none（--batch 的預設）。",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="批次模式：以固定大小的進程池執行 num_instances 局，並把結果彙總到同一個 CSV。",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="批次模式的進程數量（預設為 CPU 核心數）。",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="亂數種子；第 i 局使用 seed + i，可重現整批結果。",
+    )
+    parser.add_argument(
+        "--policy",
+        default="random",
+        help=f"自動遊玩的策略：{', '.join(POLICIES)}（預設為 random），或以 模組:類別 指定自訂策略。",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="量測 AutoGame 每幀各階段的耗時，寫入 log/profile_*.csv 並在結束時印出百分位數。",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="批次模式下仍輸出每個動作的訊息。",
+    )
+    parser.add_argument("--log_level", choices=LEVELS, default="INFO", help="輸出訊息的最低等級（預設為 INFO）。")
+    parser.add_argument("-q", "--quiet", action="store_true", help="不輸出任何遊戲訊息（只保留彙總結果）。")
     args = parser.parse_args()
 
     num_instances = args.num_instances
@@ -403,14 +290,76 @@ def main():
     if num_instances < 1:
         print("實例數量必須大於等於 1。")
         sys.exit(1)
+    if args.render_every < 1:
+        print("--render_every 必須大於等於 1。")
+        sys.exit(1)
+
+    if args.batch:
+        run_batch(
+            num_instances,
+            max(1, args.workers),
+            base_seed=args.seed,
+            verbose=args.verbose and not args.quiet,
+            log_level=args.log_level,
+            speed_multiplier=speed_multiplier,
+            fast=True,  # 批次模式一律使用不限速的虛擬時鐘
+            headless=args.headless,
+            fast_forward=args.fast_forward,
+            rows=args.rows,
+            cols=args.cols,
+            log_format=args.log_format or "none",
+            profile=args.profile,
+            policy=args.policy,
+            render=args.render,
+            render_every=args.render_every,
+            sample_times=args.sample_frames,
+        )
+        return
+    log_format = args.log_format or "csv"
+
+    # 所有實例的訊息經由同一個佇列，由主進程的唯一寫入者依序輸出
+    if args.quiet:
+        configure_logging(silent=True)
+        log_queue = None
+    else:
+        log_queue = start_shared_writer(args.log_level)
+
+    preload_display_modules(args.headless, args.fast_forward)
 
     # 創建多個進程
     processes = []
     for i in range(1, num_instances + 1):
-        p = multiprocessing.Process(target=run_auto_game, args=(i, speed_multiplier))
+        p = multiprocessing.Process(
+            target=run_instance,
+            args=(
+                log_queue,
+                args.log_level,
+                i,
+                speed_multiplier,
+                args.fast,
+                args.headless,
+                args.fast_forward,
+                args.rows,
+                args.cols,
+                log_format,
+                None if args.seed is None else args.seed + i,
+                args.profile,
+                args.policy,
+                args.render,
+                args.render_every,
+                args.sample_frames,
+            ),
+        )
         p.start()
         processes.append(p)
-        print(f"啟動 AutoGame 實例 {i}，速度倍數 {speed_multiplier}x。")
+        if args.fast_forward:
+            log.info("啟動 AutoGame 實例 %d，headless 事件跳躍模式。", i)
+        elif args.headless:
+            log.info("啟動 AutoGame 實例 %d，headless 模式。", i)
+        elif args.fast:
+            log.info("啟動 AutoGame 實例 %d，不限速模式。", i)
+        else:
+            log.info("啟動 AutoGame 實例 %d，速度倍數 %sx。", i, speed_multiplier)
 
     # 等待所有進程結束
     for p in processes:
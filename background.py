@@ -1,18 +1,79 @@
 # background.py
 import pygame
+from assets import assets
+
+BG_IMAGE = "./img/FarmBG.png"
+FARM_GRID_IMAGE = "./img/FarmGrid.png"
 
 
 class Background:
     def __init__(self):
-        # 載入背景圖片
-        self.bg_image = pygame.image.load("./img/FarmBG.png")
+        # 載入背景圖片（不透明，轉換成顯示器的像素格式）
+        self.bg_image = assets.get(BG_IMAGE, alpha=False)
         # 載入 Farm Grid 圖片
-        self.farm_grid = pygame.image.load("./img/FarmGrid.png")
+        self.farm_grid = assets.get(FARM_GRID_IMAGE)
         # 調整圖片位置，微調使其對齊
         self.farm_grid_x = (1440 - self.farm_grid.get_width()) // 2
         self.farm_grid_y = int((810 - self.farm_grid.get_height()) / 1.15)  # 可以微調數值
 
-    def draw(self, screen):
-        # 繪製背景和 Farm Grid 圖片
+        # 預先鋪好 Farm Grid 圖片的圖層（比畫面多一張圖片大小，可依攝影機位置平移），
+        # 只在農場大小或畫面大小改變時重建
+        self.static_layer = None
+        self.static_layout = None
+
+    def draw(self, screen, farm_grid=None, camera=None):
+        if farm_grid is None or camera is None:
+            # 繪製背景和 Farm Grid 圖片
+            screen.blit(self.bg_image, (0, 0))
+            screen.blit(self.farm_grid, (self.farm_grid_x, self.farm_grid_y))
+            return
+
         screen.blit(self.bg_image, (0, 0))
-        screen.blit(self.farm_grid, (self.farm_grid_x, self.farm_grid_y))
+        # 大型農場：Farm Grid 圖片依預設大小重複鋪滿，只畫出與畫面重疊的部分
+        visible = farm_grid.visible_range(camera)
+        if visible is None:
+            return
+        layout = (farm_grid.rows, farm_grid.cols, screen.get_size())
+        if layout != self.static_layout:
+            self.static_layer = self.bake(screen.get_size())
+            self.static_layout = layout
+
+        # 可見格子所在的 Farm Grid 圖片範圍（畫面座標）
+        first_row, last_row, first_col, last_col = visible
+        tile_width = self.farm_grid.get_width()
+        tile_height = self.farm_grid.get_height()
+        rows_per_tile = tile_height // farm_grid.block_height
+        cols_per_tile = tile_width // farm_grid.block_width
+        left = self.farm_grid_x + first_col // cols_per_tile * tile_width - camera.x
+        top = self.farm_grid_y + first_row // rows_per_tile * tile_height - camera.y
+        right = self.farm_grid_x + (last_col // cols_per_tile + 1) * tile_width - camera.x
+        bottom = self.farm_grid_y + (last_row // rows_per_tile + 1) * tile_height - camera.y
+        rect = pygame.Rect(left, top, right - left, bottom - top).clip(screen.get_rect())
+
+        # 圖層左上角對齊到某張 Farm Grid 圖片的左上角（位於畫面左上方一張圖片的範圍內）
+        origin_x = (self.farm_grid_x - camera.x) % tile_width - tile_width
+        origin_y = (self.farm_grid_y - camera.y) % tile_height - tile_height
+        screen.blit(self.static_layer, rect.topleft, rect.move(-origin_x, -origin_y))
+
+    def bake(self, size):
+        """把 Farm Grid 圖片重複鋪滿一張比畫面多一張圖片大小的圖層。"""
+        tile_width, tile_height = self.farm_grid.get_size()
+        columns = -(-size[0] // tile_width) + 1
+        rows = -(-size[1] // tile_height) + 1
+        layer_size = (columns * tile_width, rows * tile_height)
+        # 完全不透明（每個像素的 alpha 都是 255）的圖片可以直接鋪在不透明圖層上
+        opaque = pygame.mask.from_surface(self.farm_grid, 254).count() == tile_width * tile_height
+        if self.farm_grid.get_flags() & pygame.SRCALPHA and not opaque:
+            # 圖片互不重疊，以 BLEND_RGBA_MAX 貼到全透明的圖層上等於原封不動地複製像素，
+            # 之後貼到畫面上的結果與直接貼圖片相同
+            layer = pygame.Surface(layer_size, pygame.SRCALPHA)
+            flags = pygame.BLEND_RGBA_MAX
+        else:
+            layer = pygame.Surface(layer_size)
+            flags = 0
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert_alpha() if flags else layer.convert()
+        for row in range(rows):
+            for col in range(columns):
+                layer.blit(self.farm_grid, (col * tile_width, row * tile_height), special_flags=flags)
+        return layer
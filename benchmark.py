@@ -0,0 +1,440 @@
+# benchmark.py
+
+import os
+
+# 不開啟實際視窗，讓效能測試可以在沒有螢幕的環境執行
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from settings import FPS, GRID_ROWS, GRID_COLS, DIRT_LEVELS, WHEAT_SEED_NAME
+from game_clock import GameClock
+from farm_model import CROP_IDS, FarmModel
+from headless_game import HeadlessGame
+from dirt import dirt_sprite
+from plant import plant_sprite
+from seed import WheatSeed
+from game_log import quiet
+
+# 固定的亂數種子，讓每次測量的工作量相同
+SEED = 12345
+# 預設的結果與基準檔位置
+RESULTS_DIR = Path("benchmarks")
+BASELINE_PATH = RESULTS_DIR / "baseline.json"
+# 中位數比基準慢超過這個倍數就視為效能退步
+DEFAULT_THRESHOLD = 1.25
+
+# 數據收集測試寫入檔案用的暫存資料夾，由 main() 建立並在結束時刪除
+WORK_DIR = None
+
+# 所有測試項目：名稱 -> (建立函數, 每輪呼叫次數, 是否為耗時的整局測試)
+BENCHMARKS = {}
+
+
+def benchmark(name, number, slow=False):
+    """
+    註冊一個測試項目。被裝飾的函數每一輪都會被呼叫一次來重新建立狀態，
+    回傳要計時的無參數函數，該函數會被連續呼叫 number 次。
+    """
+
+    def decorator(setup):
+        BENCHMARKS[name] = (setup, number, slow)
+        return setup
+
+    return decorator
+
+
+# === 測試用的狀態 ===
+def full_farm(rows, cols, start_time=0):
+    """建立每一格都已放土並種下作物的 FarmModel。"""
+    farm = FarmModel(rows=rows, cols=cols, initial_coins=50 * rows * cols, start_time=start_time)
+    farm.seeds.add(WHEAT_SEED_NAME, rows * cols)
+    for r in range(rows):
+        for c in range(cols):
+            farm.place_or_upgrade(r, c)
+            farm.plant(r, c, 0, start_time)
+    return farm
+
+
+_game = None
+
+
+def shared_game():
+    """所有畫面相關的測試共用同一個 Game（只建立一次視窗與圖片）。"""
+    global _game
+    if _game is None:
+        from main_game import Game
+
+        _game = Game(game_clock=GameClock(virtual=True))
+    return _game
+
+
+def populated_game():
+    """取得共用的 Game，並讓農場每一格都有泥土與作物。"""
+    game = shared_game()
+    farm = game.farm
+    farm.coin.amount = 100000
+    farm.seeds.add(WHEAT_SEED_NAME, farm.rows * farm.cols)
+    now = game.game_clock.get_ticks()
+    for r in range(farm.rows):
+        for c in range(farm.cols):
+            if not farm.tiles.has_dirt(r, c):
+                farm.place_or_upgrade(r, c)
+            if not farm.tiles.stage(r, c):
+                farm.plant(r, c, farm.seeds.available_slots()[0], now)
+    return game
+
+
+# === Game.run 的單幀 ===
+@benchmark("frame_update", number=600)
+def bench_frame_update():
+    game = populated_game()
+    frame_time = 1000 / FPS
+
+    def frame():
+        game.game_clock.advance(frame_time)
+        game.event_handler.handle_events()
+        game.farmer.update(pygame.key.get_pressed())
+        game.update_farm()
+        game.update_effects()
+        game.update_camera()
+
+    return frame
+
+
+@benchmark("frame_draw", number=300)
+def bench_frame_draw():
+    game = populated_game()
+
+    def frame():
+        game.draw_frame()
+        pygame.display.flip()
+
+    return frame
+
+
+@benchmark("farm_draw", number=2000)
+def bench_farm_draw():
+    # 只繪製泥土與作物（每一層一次 Surface.blits）
+    game = populated_game()
+    visible = game.farm_grid.visible_range(game.camera)
+    return lambda: game.tile_batch.draw(game.screen, visible, game.camera.offset)
+
+
+@benchmark("effects_burst", number=600)
+def bench_effects_burst():
+    # 每幀 10 個收穫特效，持續 2 秒，同時約有數百個 +50 浮動文字
+    from particles import ParticlePool
+
+    game = shared_game()
+    effects = ParticlePool()
+    sprite = effects.text_sprite(game.font, "+50", "#FF3E3E")
+    clock = GameClock(virtual=True)
+    frame_time = 1000 / FPS
+
+    def frame():
+        now = clock.advance(frame_time)
+        for i in range(10):
+            effects.emit(sprite, 20 * i, 400, now, 2000)
+        effects.update(now)
+        effects.draw(game.screen)
+
+    return frame
+
+
+# === 作物成長 ===
+@benchmark("update_plants_growth_full_grid", number=600)
+def bench_growth_full_grid():
+    # 一個 50x50 全部種滿的農場，每次前進一幀，涵蓋完整的成長週期
+    farm = full_farm(50, 50)
+    clock = GameClock(virtual=True)
+    frame_time = 1000 / FPS
+
+    def frame():
+        farm.update(clock.advance(frame_time))
+
+    return frame
+
+
+# === 庫存 ===
+@benchmark("inventory_add_item", number=5000)
+def bench_inventory_add_item():
+    from inventory import Inventory
+
+    game = shared_game()
+    inventory = Inventory(50, 5, game.quantity_font)
+    seed = WheatSeed()
+    return lambda: inventory.add_item(seed)
+
+
+@benchmark("inventory_draw", number=2000)
+def bench_inventory_draw():
+    game = populated_game()
+    inventory = game.seed_inventory
+    inventory.show_numbers = True
+    return lambda: inventory.draw(game.screen)
+
+
+# === 作物與泥土圖片 ===
+@benchmark("plant_grow", number=5000)
+def bench_plant_grow():
+    shared_game()
+    crop = CROP_IDS[WHEAT_SEED_NAME]
+
+    def grow():
+        # 從第 2 階段長到第 5 階段，每一階段取得共用的圖片
+        for stage in range(2, 6):
+            plant_sprite(crop, stage)
+
+    return grow
+
+
+@benchmark("dirt_upgrade", number=5000)
+def bench_dirt_upgrade():
+    shared_game()
+    levels = range(len(DIRT_LEVELS))
+
+    def upgrade():
+        # 依序取得每一等級共用的泥土圖片
+        for level in levels:
+            dirt_sprite(level)
+
+    return upgrade
+
+
+# === 數據收集 ===
+@benchmark("record_game_state", number=600)
+def bench_record_game_state():
+    session = HeadlessGame(farm=full_farm(GRID_ROWS, GRID_COLS), seed=SEED)
+    session.recorder.path = WORK_DIR / "record.csv"
+    seconds = iter(range(10**9))
+    return lambda: session.record_game_state(next(seconds))
+
+
+@benchmark("record_game_state_200x200", number=20)
+def bench_record_game_state_large():
+    session = HeadlessGame(farm=full_farm(200, 200), seed=SEED)
+    session.recorder.path = WORK_DIR / "record_large.csv"
+    seconds = iter(range(10**9))
+    return lambda: session.record_game_state(next(seconds))
+
+
+@benchmark("save_game_data", number=20)
+def bench_save_game_data():
+    count = iter(range(10**9))
+
+    def save():
+        # 記錄一分鐘的狀態後寫入檔案
+        session = HeadlessGame(farm=full_farm(GRID_ROWS, GRID_COLS), seed=SEED)
+        session.recorder.path = WORK_DIR / f"save_{next(count)}.csv"
+        for second in range(61):
+            session.record_game_state(second)
+        session.save_game_data()
+
+    return save
+
+
+# === 整局 ===
+@benchmark("episode_headless", number=20)
+def bench_episode_headless():
+    seeds = iter(range(SEED, SEED + 10**9))
+    return lambda: HeadlessGame(seed=next(seeds), log_format="none").run()
+
+
+@benchmark("episode_headless_fast_forward", number=100)
+def bench_episode_fast_forward():
+    seeds = iter(range(SEED, SEED + 10**9))
+    return lambda: HeadlessGame(seed=next(seeds), log_format="none").run(fast_forward=True)
+
+
+def auto_game_episode(**options):
+    from auto_game import AutoGame
+
+    def episode():
+        game = AutoGame(fast=True, seed=SEED, log_format="none", **options)
+        game.run()
+        # AutoGame 結束時會關閉 pygame，之後的測試需要重新建立 Game
+        global _game
+        _game = None
+
+    return episode
+
+
+@benchmark("episode_auto_game", number=1, slow=True)
+def bench_episode_auto_game():
+    return auto_game_episode()
+
+
+@benchmark("episode_auto_game_render_every_10", number=1, slow=True)
+def bench_episode_auto_game_render_every_10():
+    return auto_game_episode(render="every", render_every=10)
+
+
+@benchmark("episode_auto_game_render_none", number=1, slow=True)
+def bench_episode_auto_game_render_none():
+    # 完全不繪製：只剩遊戲邏輯與事件處理
+    return auto_game_episode(render="none")
+
+
+# === 冷啟動 ===
+# 在新的 Python 進程中執行，包含 import、建立視窗與載入圖片的完整成本
+COLD_START_GAME = """
+import pygame
+from main_game import Game
+from game_clock import GameClock
+game = Game(game_clock=GameClock(virtual=True))
+game.draw_frame()
+pygame.display.flip()
+"""
+COLD_START_HEADLESS = """
+from auto_player import run_auto_game
+run_auto_game(1, 1, headless=True, fast_forward=True, log_format="none")
+"""
+
+
+def run_python(code):
+    subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+
+
+@benchmark("cold_start_first_frame", number=1)
+def bench_cold_start_first_frame():
+    # 先確保圖片包已建立，量測的是一般啟動（而不是第一次啟動）的成本
+    shared_game()
+    return lambda: run_python(COLD_START_GAME)
+
+
+@benchmark("cold_start_headless_episode", number=1)
+def bench_cold_start_headless():
+    return lambda: run_python(COLD_START_HEADLESS)
+
+
+def run_benchmark(name, repeat):
+    """執行一個測試項目 repeat 輪，回傳每次呼叫的平均秒數等統計。"""
+    setup, number, _ = BENCHMARKS[name]
+    timings = []
+    random.seed(SEED)
+    np.random.seed(SEED)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), quiet():
+        for _ in range(repeat):
+            func = setup()
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+    median = statistics.median(timings)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "median": median,
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "per_second": 1 / median if median > 0 else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """與基準比較中位數，回傳效能退步的項目名稱。"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"  {name:<34} 基準中沒有這個項目")
+            continue
+        ratio = result["median"] / base["median"]
+        status = "退步" if ratio > threshold else ("進步" if ratio < 1 / threshold else "持平")
+        print(f"  {name:<34} {ratio:6.2f}x  {status}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def format_time(seconds):
+    if seconds >= 1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.3f} us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="量測遊戲迴圈與模擬的效能，並與基準比較。")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="每個項目執行的輪數（預設為 5）。")
+    parser.add_argument("-k", "--filter", default=None, help="只執行名稱包含此字串的項目。")
+    parser.add_argument("--quick", action="store_true", help="略過耗時的整局 AutoGame 測試。")
+    parser.add_argument("-o", "--output", default=None, help="結果 JSON 的路徑（預設為 benchmarks/results_<時間>.json）。")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="比較用的基準 JSON。")
+    parser.add_argument("--save_baseline", action="store_true", help="把這次的結果存為新的基準。")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"中位數比基準慢幾倍視為退步（預設為 {DEFAULT_THRESHOLD}）。",
+    )
+    args = parser.parse_args()
+
+    names = [
+        name
+        for name, (_, _, slow) in BENCHMARKS.items()
+        if (args.filter is None or args.filter in name) and not (slow and args.quick)
+    ]
+
+    global WORK_DIR
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="farm_benchmark_") as work_dir:
+        WORK_DIR = Path(work_dir)
+        for name in names:
+            result = run_benchmark(name, 1 if BENCHMARKS[name][2] else args.repeat)
+            results[name] = result
+            print(
+                f"{name:<34} 中位數 {format_time(result['median'])}  "
+                f"最快 {format_time(result['min'])}  ({result['per_second']:.1f} 次/秒)"
+            )
+    pygame.quit()
+
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "seed": SEED,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "results": results,
+    }
+    output = Path(args.output or RESULTS_DIR / f"results_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"結果已儲存至 {output}。")
+
+    if args.save_baseline:
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.baseline).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"已更新基準 {args.baseline}。")
+        return
+
+    if Path(args.baseline).exists():
+        print(f"與基準 {args.baseline} 比較：")
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"效能退步：{', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# camera.py
+
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+
+class Camera:
+    """
+    捲動攝影機：記錄畫面左上角在世界座標中的位置。
+    農場比視窗小時，攝影機固定在 (0, 0)，畫面與原本完全相同。
+    """
+
+    def __init__(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT):
+        self.x = 0
+        self.y = 0
+        self.width = width
+        self.height = height
+        self.max_x = 0
+        self.max_y = 0
+
+    def set_world_size(self, world_width, world_height):
+        # 攝影機最多只能捲動到世界的邊緣
+        self.max_x = max(0, world_width - self.width)
+        self.max_y = max(0, world_height - self.height)
+        self.follow(self.x + self.width // 2, self.y + self.height // 2)
+
+    def follow(self, target_x, target_y):
+        """讓目標（世界座標）位於畫面中央，並限制在世界範圍內。"""
+        self.x = min(max(target_x - self.width // 2, 0), self.max_x)
+        self.y = min(max(target_y - self.height // 2, 0), self.max_y)
+
+    @property
+    def offset(self):
+        # 世界座標加上 offset 即為畫面座標
+        return -self.x, -self.y
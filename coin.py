@@ -1,5 +1,9 @@
 # coin.py
 
+from game_log import get_logger
+
+log = get_logger("coin")
+
 
 class Coin:
     def __init__(self, initial_amount=0):
@@ -13,7 +17,7 @@ class Coin:
             self.amount -= value
         else:
             # 如果金幣不足，可以選擇引發錯誤或處理不足的情況
-            print("金幣不足，無法扣除！")
+            log.warning("金幣不足，無法扣除！")
 
     def get_amount(self):
         return self.amount
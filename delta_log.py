@@ -0,0 +1,215 @@
+# delta_log.py
+
+import argparse
+import csv
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from recorder import COLUMNS, RECORD_DTYPE
+
+# 檔頭：DELTA_MAGIC 之後接著實例ID、列數、行數、關鍵影格間隔（秒）
+DELTA_MAGIC = b"FARMDLT1"
+HEADER = struct.Struct("<iIII")
+
+# 每一秒一個影格：種類、時間（秒）、金幣（關鍵影格為總數，其餘為變化量）、變化格數
+FRAME = struct.Struct("<ciiI")
+KEYFRAME = b"K"
+DELTA = b"D"
+# 變化的格子：列、行、土壤等級、植物等級
+CHANGE_DTYPE = np.dtype([("row", "<u2"), ("col", "<u2"), ("soil", "i1"), ("plant", "i1")])
+
+# 每隔幾秒寫入一次完整的網格
+DEFAULT_KEYFRAME_INTERVAL = 30
+# 緩衝區超過這個大小就寫入檔案
+FLUSH_BYTES = 64 * 1024
+
+
+class DeltaLogWriter:
+    """
+    變化紀錄檔：每秒只寫入這一秒有變化的格子（放土、升級、種植、成長、收穫）
+    與金幣的變化量，每隔 keyframe_interval 秒寫入一次完整的網格（關鍵影格），
+    讀取時由最近的關鍵影格往後套用變化即可還原任一秒的狀態。
+
+    每次寫入關鍵影格時會把緩衝區寫入檔案，中斷時最多只遺失最後一段。
+    """
+
+    def __init__(
+        self,
+        path,
+        rows,
+        cols,
+        instance_id=1,
+        keyframe_interval=DEFAULT_KEYFRAME_INTERVAL,
+    ):
+        self.path = Path(path)
+        self.rows = rows
+        self.cols = cols
+        self.instance_id = instance_id
+        self.keyframe_interval = keyframe_interval
+
+        self.buffer = bytearray()
+        self.file = None
+        self.frames = 0  # 已記錄的秒數
+        self.last_keyframe = None  # 上一個關鍵影格的時間（秒）
+        self.coins = 0  # 上一個影格的金幣數
+
+    def __len__(self):
+        return self.frames
+
+    def keyframe_due(self, time):
+        """是否該在 time 寫入關鍵影格（第一個影格一定是關鍵影格）。"""
+        return self.last_keyframe is None or time - self.last_keyframe >= self.keyframe_interval
+
+    def record_keyframe(self, time, soil_levels, plant_levels, coins):
+        """寫入完整的網格，soil_levels 與 plant_levels 為依列優先排列的每格數值。"""
+        soil_levels = np.asarray(soil_levels, dtype=np.int8).ravel()
+        plant_levels = np.asarray(plant_levels, dtype=np.int8).ravel()
+        self.buffer += FRAME.pack(KEYFRAME, time, coins, len(soil_levels))
+        self.buffer += soil_levels.tobytes()
+        self.buffer += plant_levels.tobytes()
+        self.last_keyframe = time
+        self.coins = coins
+        self.frames += 1
+        self.flush()
+
+    def record_changes(self, time, changes, coins):
+        """寫入這一秒變化的格子，changes 為 (row, col, soil, plant) 的序列。"""
+        changes = np.array(changes, dtype=CHANGE_DTYPE)
+        self.buffer += FRAME.pack(DELTA, time, coins - self.coins, len(changes))
+        self.buffer += changes.tobytes()
+        self.coins = coins
+        self.frames += 1
+        if len(self.buffer) >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.path, "wb")
+            self.file.write(DELTA_MAGIC)
+            self.file.write(HEADER.pack(self.instance_id, self.rows, self.cols, self.keyframe_interval))
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer.clear()
+
+    def close(self):
+        """寫入剩餘的影格並關閉檔案，回傳總影格數。"""
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        return self.frames
+
+
+class DeltaLogReader:
+    """
+    讀取 DeltaLogWriter 的紀錄檔。開檔時只掃描每個影格的標頭建立索引，
+    snapshot() 從最近的關鍵影格往後套用變化，還原指定秒數的網格。
+    檔案尾端不完整的影格（例如寫入途中被中斷）會被忽略。
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if f.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+                raise ValueError(f"{path} is not a delta log file")
+            self.instance_id, self.rows, self.cols, self.keyframe_interval = HEADER.unpack(
+                f.read(HEADER.size)
+            )
+            self.data = f.read()
+
+        # 影格索引：(種類, 時間, 金幣, 變化格數, 資料起點)
+        self.frames = []
+        self.times = {}  # 時間 -> 影格索引
+        offset = 0
+        while offset + FRAME.size <= len(self.data):
+            kind, time, coins, count = FRAME.unpack_from(self.data, offset)
+            start = offset + FRAME.size
+            size = count * 2 if kind == KEYFRAME else count * CHANGE_DTYPE.itemsize
+            if start + size > len(self.data):
+                break
+            self.times[time] = len(self.frames)
+            self.frames.append((kind, time, coins, count, start))
+            offset = start + size
+
+    def __len__(self):
+        return len(self.frames)
+
+    def seconds(self):
+        return [frame[1] for frame in self.frames]
+
+    def iter_snapshots(self, start=0, stop=None):
+        """
+        依序產生每一秒的 (時間, 土壤等級網格, 植物等級網格, 金幣)。
+        start 必須是關鍵影格的索引；產生的網格會在下一個影格被修改，需要保留時請 copy()。
+        """
+        soil = np.zeros((self.rows, self.cols), dtype=np.int8)
+        plant = np.zeros((self.rows, self.cols), dtype=np.int8)
+        coins = 0
+        shape = (self.rows, self.cols)
+        cells = self.rows * self.cols
+        for kind, time, coin_value, count, offset in self.frames[start:stop]:
+            if kind == KEYFRAME:
+                soil = np.frombuffer(self.data, np.int8, cells, offset).reshape(shape).copy()
+                plant = np.frombuffer(self.data, np.int8, cells, offset + cells).reshape(shape).copy()
+                coins = coin_value
+            else:
+                changes = np.frombuffer(self.data, CHANGE_DTYPE, count, offset)
+                soil[changes["row"], changes["col"]] = changes["soil"]
+                plant[changes["row"], changes["col"]] = changes["plant"]
+                coins += coin_value
+            yield time, soil, plant, coins
+
+    def snapshot(self, time):
+        """還原指定秒數的 (土壤等級網格, 植物等級網格, 金幣)。"""
+        index = self.times[time]
+        keyframe = index
+        while self.frames[keyframe][0] != KEYFRAME:
+            keyframe -= 1
+
+        for _, soil, plant, coins in self.iter_snapshots(keyframe, index + 1):
+            pass
+        return soil.copy(), plant.copy(), coins
+
+    def to_records(self):
+        """展開成與 CSV 相同欄位的 RECORD_DTYPE 結構化陣列（每秒每格一筆）。"""
+        cells = self.rows * self.cols
+        records = np.empty(len(self.frames) * cells, dtype=RECORD_DTYPE)
+        grid_rows, grid_cols = np.divmod(np.arange(cells), self.cols)
+        for i, (time, soil, plant, coins) in enumerate(self.iter_snapshots()):
+            block = records[i * cells : (i + 1) * cells]
+            block["Time (s)"] = time
+            block["Grid Row"] = grid_rows
+            block["Grid Column"] = grid_cols
+            block["Soil Level"] = soil.ravel()
+            block["Plant Level"] = plant.ravel()
+            block["Coins"] = coins
+        records["Instance ID"] = self.instance_id
+        return records
+
+    def to_csv(self, path):
+        """輸出成與原本相同格式的 utf-8-sig CSV。"""
+        records = self.to_records()
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow([name for name, _ in COLUMNS])
+            writer.writerows(zip(*(records[name].tolist() for name, _ in COLUMNS)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把變化紀錄檔 (.delta) 轉換成每秒完整網格的 CSV。")
+    parser.add_argument("path", help="變化紀錄檔路徑。")
+    parser.add_argument("-o", "--output", help="輸出的 CSV 路徑（預設為同名的 .csv）。")
+    args = parser.parse_args()
+
+    reader = DeltaLogReader(args.path)
+    output = args.output or str(Path(args.path).with_suffix(".csv"))
+    reader.to_csv(output)
+    print(f"已輸出 {len(reader)} 秒的紀錄至 {output}。")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,89 @@
 # dirt.py
 
-import pygame
+from assets import assets
+from farm_model import EMPTY
+from plant import plant_sprite
 from settings import DIRT_LEVELS
-from plant import Plant  # 新增這一行
-
-
-class Dirt:
-    def __init__(
-        self,
-        grid_x,
-        grid_y,
-        farm_grid_x,
-        farm_grid_y,
-        block_width,
-        block_height,
-        level=0,
-    ):
-        # 初始化泥土屬性
-        self.level = level  # 初始等級為 0（Normal）
-        self.grid_x = grid_x
-        self.grid_y = grid_y
-        self.farm_grid_x = farm_grid_x
-        self.farm_grid_y = farm_grid_y
-        self.block_width = block_width
-        self.block_height = block_height
-
-        # 載入圖片和計算位置
-        self.load_image()
-        self.calculate_position()
-
-        # 成長速度加成（對應 settings.py 裏 DIRT_LEVELS[self.level]["growth_speed_bonus"]）
-        self.growth_speed_bonus = DIRT_LEVELS[self.level]["growth_speed_bonus"]
-
-        # 初始化植物
-        self.plant = None  # 初始沒有植物
-
-        # 新增：紀錄最後一次成長時間（毫秒）
-        self.last_growth_time = 0
-
-    def load_image(self):
-        # 根據等級載入對應的圖片
-        image_path = DIRT_LEVELS[self.level]["image"]
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (170, 170))
-
-    def calculate_position(self):
-        # 計算泥土圖片的繪製位置，使其在格子中置中
-        x = self.farm_grid_x + self.grid_x * self.block_width
-        y = self.farm_grid_y + self.grid_y * self.block_height
-        # 計算置中偏移
-        offset_x = (self.block_width - self.image.get_width()) // 2
-        offset_y = (self.block_height - self.image.get_height()) // 2
-        self.position = (x + offset_x, y + offset_y)
-
-    def upgrade(self):
-        # 升級泥土等級
-        if self.level < len(DIRT_LEVELS) - 1:
-            self.level += 1
-            self.load_image()
-            self.growth_speed_bonus = DIRT_LEVELS[self.level]["growth_speed_bonus"]
-            print(f"泥土升級到 {DIRT_LEVELS[self.level]['name']} 等級！")
-        else:
-            print("泥土已達最高等級，無法升級！")
-
-    def plant_seed(self, plant):
-        if self.plant is None:
-            self.plant = plant
-            print(f"種下了 {plant.__class__.__name__}！")
-            # 初始化 last_growth_time，在第一次種下時設定
-            self.last_growth_time = pygame.time.get_ticks()
-        else:
-            print("這塊泥土已經有植物了！")
-
-    def draw(self, screen):
-        # 將泥土圖片繪製在計算好的位置
-        screen.blit(self.image, self.position)
-        # 如果有植物，繪製植物圖片
-        if self.plant:
-            plant_x = self.position[0] + (self.block_width - self.plant.image.get_width()) // 2 - 10
-            plant_y = (
-                self.position[1] + (self.block_height - self.plant.image.get_height()) // 2 - 10
-            )
-            screen.blit(self.plant.image, (plant_x, plant_y))
+
+# 泥土圖片縮放後的大小
+DIRT_IMAGE_SIZE = (170, 170)
+# 各等級的圖片路徑（以等級為索引）
+DIRT_IMAGES = tuple(level["image"] for level in DIRT_LEVELS)
+
+
+def dirt_sprite(level):
+    """某一等級的泥土圖片：同一等級的所有格子共用 AssetManager 中同一個縮放後的 Surface。"""
+    return assets.get(DIRT_IMAGES[level], DIRT_IMAGE_SIZE)
+
+
+def tile_position(grid, row, col):
+    """泥土圖片在世界座標中的繪製位置（在格子中置中，圖片一律縮放成 DIRT_IMAGE_SIZE）。"""
+    x = grid.farm_grid_x + col * grid.block_width + (grid.block_width - DIRT_IMAGE_SIZE[0]) // 2
+    y = grid.farm_grid_y + row * grid.block_height + (grid.block_height - DIRT_IMAGE_SIZE[1]) // 2
+    return x, y
+
+
+def plant_position(grid, x, y, image):
+    # 作物相對泥土圖片置中再往左上偏移 10px
+    return (
+        x + (grid.block_width - image.get_width()) // 2 - 10,
+        y + (grid.block_height - image.get_height()) // 2 - 10,
+    )
+
+
+class TileBatch:
+    """
+    農場的繪製：把可見範圍內的泥土與作物整理成 (Surface, 位置) 清單，
+    泥土一層、作物一層，每一層只呼叫一次 Surface.blits。
+    格子之間不重疊，先畫完所有泥土再畫作物的結果與逐格繪製相同。
+    清單只在格子改變（FarmModel 事件）或可見範圍、攝影機改變時才重建。
+    """
+
+    def __init__(self, farm, grid):
+        self.farm = farm
+        self.grid = grid
+        self.dirt_layer = []
+        self.plant_layer = []
+        self.key = None  # 目前清單對應的 (可見範圍, 攝影機位移)
+        farm.add_listener(self.on_farm_event)
+
+    def on_farm_event(self, event, row, col):
+        self.invalidate()
+
+    def invalidate(self):
+        """下次繪製時重建清單（例如讀取存檔後）。"""
+        self.key = None
+
+    def build(self, visible, offset):
+        """依列、行順序收集 visible 範圍內有泥土的格子，直接讀取 TileStore 的陣列。"""
+        tiles = self.farm.tiles
+        grid = self.grid
+        first_row, last_row, first_col, last_col = visible
+        levels, stages, crops = tiles.levels, tiles.stages, tiles.crops
+        dirt_layer = []
+        plant_layer = []
+        for row in range(first_row, last_row + 1):
+            base = row * tiles.cols
+            for col in range(first_col, last_col + 1):
+                i = base + col
+                level = levels[i]
+                if level == EMPTY:
+                    continue
+                x, y = tile_position(grid, row, col)
+                x += offset[0]
+                y += offset[1]
+                dirt_layer.append((dirt_sprite(level), (x, y)))
+                if stages[i]:
+                    image = plant_sprite(crops[i], stages[i])
+                    plant_layer.append((image, plant_position(grid, x, y, image)))
+        self.dirt_layer = dirt_layer
+        self.plant_layer = plant_layer
+
+    def draw(self, screen, visible, offset=(0, 0)):
+        key = (visible, offset)
+        if key != self.key:
+            self.build(visible, offset)
+            self.key = key
+        screen.blits(self.dirt_layer, doreturn=False)
+        screen.blits(self.plant_layer, doreturn=False)
+
@@ -0,0 +1,138 @@
+# evaluate_policy.py
+
+import argparse
+import math
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+from farm_model import FarmModel
+from headless_game import HeadlessGame
+from policy import POLICIES, create_policy
+from settings import GRID_ROWS, GRID_COLS, EPISODE_TIME
+from game_log import configure as configure_logging
+
+
+def silence_worker():
+    # 工作進程不處理每個動作的訊息
+    configure_logging(silent=True)
+
+
+def run_policy_episode(task):
+    """執行一局並回傳最終金幣數。"""
+    policy_name, seed, rows, cols, fast_forward = task
+    game = HeadlessGame(
+        instance_id=seed,
+        total_time=EPISODE_TIME,
+        farm=FarmModel(rows=rows, cols=cols),
+        seed=seed,
+        log_format="none",
+        policy=create_policy(policy_name),
+    )
+    return game.run(fast_forward=fast_forward)
+
+
+def evaluate(
+    policy_name,
+    episodes,
+    pool,
+    workers,
+    base_seed=0,
+    rows=GRID_ROWS,
+    cols=GRID_COLS,
+    fast_forward=True,
+):
+    """
+    以 seed = base_seed ~ base_seed + episodes - 1 各執行一局，
+    回傳最終金幣的平均、95% 信賴區間、百分位數與吞吐量。
+    不同策略使用相同的 seed，比較時可以減少隨機誤差。
+    """
+    tasks = [(policy_name, base_seed + i, rows, cols, fast_forward) for i in range(episodes)]
+    chunksize = max(1, episodes // (workers * 8))
+    start = time.perf_counter()
+    coins = pool.map(run_policy_episode, tasks, chunksize)
+    elapsed = time.perf_counter() - start
+
+    mean = statistics.fmean(coins)
+    stdev = statistics.stdev(coins) if episodes > 1 else 0.0
+    quartiles = statistics.quantiles(coins, n=4) if episodes > 1 else [coins[0]] * 3
+    return {
+        "policy": policy_name,
+        "episodes": episodes,
+        "mean": mean,
+        "stdev": stdev,
+        "ci95": 1.96 * stdev / math.sqrt(episodes),
+        "min": min(coins),
+        "p25": quartiles[0],
+        "median": quartiles[1],
+        "p75": quartiles[2],
+        "max": max(coins),
+        "seconds": elapsed,
+        "episodes_per_second": episodes / elapsed,
+        "game_seconds_per_second": episodes * EPISODE_TIME / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="以多個 seed 平行評估自動遊玩策略的最終金幣。")
+    parser.add_argument(
+        "policies",
+        nargs="*",
+        default=list(POLICIES),
+        help=f"要評估的策略名稱（{', '.join(POLICIES)}）或 模組:類別；預設評估全部內建策略。",
+    )
+    parser.add_argument("-n", "--episodes", type=int, default=1000, help="每個策略的局數（預設為 1000）。")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="進程數量（預設為 CPU 核心數）。")
+    parser.add_argument("--seed", type=int, default=0, help="第一局的亂數種子（預設為 0）。")
+    parser.add_argument("--rows", type=int, default=GRID_ROWS, help=f"農場列數（預設為 {GRID_ROWS}）。")
+    parser.add_argument("--cols", type=int, default=GRID_COLS, help=f"農場行數（預設為 {GRID_COLS}）。")
+    parser.add_argument(
+        "--frame_step",
+        action="store_true",
+        help="逐幀前進（與 AutoGame 相同），而不是直接跳到下一個事件。",
+    )
+    parser.add_argument(
+        "--bound",
+        action="store_true",
+        help="先用 planner.py 搜尋一個排程作為參考基準（最佳解的下界），並列出每個策略達到的比例。",
+    )
+    args = parser.parse_args()
+
+    if args.episodes < 1:
+        print("局數必須大於等於 1。")
+        sys.exit(1)
+
+    bound = None
+    if args.bound:
+        from planner import FarmPlanner
+
+        bound, _ = FarmPlanner(args.rows, args.cols).search()
+        print(f"{'planner':<12} 最終金幣 {bound:8d}（planner 排程，最佳解的下界）")
+
+    workers = max(1, args.workers)
+    with multiprocessing.Pool(workers, initializer=silence_worker) as pool:
+        for name in args.policies:
+            result = evaluate(
+                name,
+                args.episodes,
+                pool,
+                workers,
+                base_seed=args.seed,
+                rows=args.rows,
+                cols=args.cols,
+                fast_forward=not args.frame_step,
+            )
+            print(
+                f"{result['policy']:<12} 最終金幣 {result['mean']:8.2f} ± {result['ci95']:.2f} (95% CI)"
+                f"  標準差 {result['stdev']:.2f}"
+                f"  中位數 {result['median']:.0f} [{result['min']}, {result['max']}]"
+                f"  {result['episodes_per_second']:.0f} 局/秒"
+                f"（{result['game_seconds_per_second']:.0f} 遊戲秒/秒）"
+                + (f"  planner 排程的 {result['mean'] / bound:.1%}" if bound else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,10 @@
 
 import pygame
 import sys
-from dirt import Dirt
-from settings import DIRT_LEVELS
-from plant import Plant  # 新增這一行
-from seed import WheatSeed  # 確保已導入 Seed 類別
+from farm_model import HARVESTED, NOT_ENOUGH_COINS, MAX_LEVEL, NO_DIRT, OCCUPIED, NOT_MATURE
+from game_log import get_logger
+
+log = get_logger("input")
 
 
 class EventHandler:
@@ -15,55 +15,50 @@ class EventHandler:
     def handle_events(self):
         farmer = self.game.farmer
         farm_grid = self.game.farm_grid
-        dirt_grid = self.game.dirt_grid
-        background = self.game.background
+        farm = self.game.farm  # 農場狀態與規則
         seed_inventory = self.game.seed_inventory
         # [註解開始] right_inventory (tool_inventory) 暫時註解掉
         # tool_inventory = self.game.tool_inventory
         # [註解結束]
-        coin = self.game.coin  # 獲取金幣對象
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self.game.close()
                 pygame.quit()
                 sys.exit()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 視窗需要重畫時，髒矩形模式也要整個畫面重畫一次
+                if self.game.renderer is not None:
+                    self.game.renderer.mark_all()
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_q:
+                if event.key == pygame.K_F3:
+                    # 切換每幀耗時的覆蓋層
+                    self.game.profiler.toggle_overlay()
+                    if self.game.renderer is not None:
+                        self.game.renderer.mark_all()
+
+                elif event.key == pygame.K_F5:
+                    # 立即存檔（在背景執行緒寫入）
+                    if self.game.autosaver is not None:
+                        self.game.autosaver.submit(self.game.snapshot(), self.game.game_clock.get_ticks())
+                        log.info("已存檔！")
+
+                elif event.key == pygame.K_q:
                     # 處理按下 'q' 鍵的事件
                     farmer_center_x = farmer.x + farmer.image_width // 2
                     farmer_bottom_y = farmer.y + farmer.image_height
                     grid_position = farm_grid.get_grid_position(farmer_center_x, farmer_bottom_y)
                     if grid_position:
                         grid_x, grid_y = grid_position
-                        dirt = dirt_grid[grid_y][grid_x]
-                        if dirt is None:
-                            # 放置新的泥土，成本為50金幣
-                            cost = 50
-                            if coin.get_amount() >= cost:
-                                dirt = Dirt(
-                                    grid_x=grid_x,
-                                    grid_y=grid_y,
-                                    farm_grid_x=background.farm_grid_x,
-                                    farm_grid_y=background.farm_grid_y,
-                                    block_width=farm_grid.block_width,
-                                    block_height=farm_grid.block_height,
-                                    level=0,
-                                )
-                                dirt_grid[grid_y][grid_x] = dirt
-                                coin.decrease(cost)
-                            else:
-                                print("金幣不足，無法放置泥土！")
-                        else:
-                            # 嘗試升級泥土
-                            if dirt.level < len(DIRT_LEVELS) - 1:
-                                upgrade_cost = DIRT_LEVELS[dirt.level]["upgrade_cost"]
-                                if coin.get_amount() >= upgrade_cost:
-                                    coin.decrease(upgrade_cost)
-                                    dirt.upgrade()
-                                else:
-                                    print("金幣不足，無法升級泥土！")
+                        # 空地放置泥土（50 金幣），已有泥土則嘗試升級
+                        result = farm.place_or_upgrade(grid_y, grid_x)
+                        if result == NOT_ENOUGH_COINS:
+                            if not farm.tiles.has_dirt(grid_y, grid_x):
+                                log.info("金幣不足，無法放置泥土！")
                             else:
-                                print("泥土已達最高等級！")
+                                log.info("金幣不足，無法升級泥土！")
+                        elif result == MAX_LEVEL:
+                            log.info("泥土已達最高等級！")
 
                 elif event.key == pygame.K_w:
                     # 處理按下 'w' 鍵的事件，切換種子庫存的數字顯示狀態
@@ -102,23 +97,17 @@ class EventHandler:
                                 )
                                 if grid_position:
                                     grid_x, grid_y = grid_position
-                                    dirt = dirt_grid[grid_y][grid_x]
-                                    if dirt:
-                                        if dirt.plant is None:
-                                            # 種植植物
-                                            plant_image_path = "./img/CropSeed2.png"
-                                            plant = Plant(
-                                                image_path=plant_image_path, scale=(64, 64)
-                                            )
-                                            dirt.plant_seed(plant)
-                                            # 庫存減1
-                                            seed_inventory.quantities[slot_number] -= 1
-                                            if seed_inventory.quantities[slot_number] == 0:
-                                                seed_inventory.items[slot_number] = None
-                                        else:
-                                            print("這塊泥土已經有植物了！")
-                                    else:
-                                        print("這塊泥土尚未被初始化！")
+                                    # 種植植物，庫存減 1
+                                    result = farm.plant(
+                                        grid_y,
+                                        grid_x,
+                                        slot_number,
+                                        self.game.game_clock.get_ticks(),
+                                    )
+                                    if result == OCCUPIED:
+                                        log.info("這塊泥土已經有植物了！")
+                                    elif result == NO_DIRT:
+                                        log.info("這塊泥土尚未被初始化！")
 
                 elif event.key == pygame.K_SPACE:
                     # 收穫植物的功能：若植物已到第 5 階，可收穫並獲得 50 金幣
@@ -127,32 +116,9 @@ class EventHandler:
                     grid_position = farm_grid.get_grid_position(farmer_center_x, farmer_bottom_y)
                     if grid_position:
                         grid_x, grid_y = grid_position
-                        dirt = dirt_grid[grid_y][grid_x]
-                        if dirt and dirt.plant:
-                            # 若植物已經是第 5 階段，則可以收穫
-                            if dirt.plant.stage == 5:
-                                coin.increase(50)
-                                print("收穫成功，獲得 50 金幣！")
-                                # 收穫後移除植物
-                                dirt.plant = None
-
-                                # === 新增動畫邏輯 ===
-                                coin_text = f"金幣：{coin.get_amount()}"
-                                coin_text_width, _ = self.game.font.size(coin_text)
-
-                                # x 座標略靠右（在金幣數字後面 10px）
-                                anim_x = 10 + coin_text_width + 10
-                                anim_y = 10  # 與金幣顯示同高度
-
-                                animation = self.game.create_coin_animation(
-                                    x=anim_x,
-                                    y=anim_y,
-                                    text="+50",
-                                    color="#FF3E3E",
-                                    duration=2000,  # 可改 2000 或更久，以免太快消失
-                                )
-                                self.game.coin_animations.append(animation)
-                                # === 動畫邏輯結束 ===
-
-                            else:
-                                print("此植物尚未成熟，無法收穫！")
+                        # 收穫後的 +50 浮動動畫由 Game.on_farm_event 產生
+                        result = farm.harvest(grid_y, grid_x)
+                        if result == HARVESTED:
+                            log.info("收穫成功，獲得 50 金幣！")
+                        elif result == NOT_MATURE and farm.tiles.stage(grid_y, grid_x):
+                            log.info("此植物尚未成熟，無法收穫！")
@@ -4,21 +4,42 @@ from settings import GRID_ROWS, GRID_COLS
 
 
 class FarmGrid:
-    def __init__(self, background):
+    def __init__(self, background, rows=GRID_ROWS, cols=GRID_COLS):
         # 設定圖片位置，從 background 中取得農地圖片的起始位置和大小
         self.farm_grid_x = background.farm_grid_x
         self.farm_grid_y = background.farm_grid_y
+        # FarmGrid.png 對應預設的 GRID_ROWS x GRID_COLS 格，以此決定每格大小
         self.block_width = background.farm_grid.get_width() // GRID_COLS
         self.block_height = background.farm_grid.get_height() // GRID_ROWS
+        # 農場實際的列數與行數（可大於預設值，超出畫面的部分由攝影機捲動）
+        self.rows = rows
+        self.cols = cols
+        self.width = cols * self.block_width
+        self.height = rows * self.block_height
 
     def get_grid_position(self, x, y):
-        # 計算農夫相對於網格的位移
+        # 計算農夫相對於網格的位移（世界座標）
         relative_x = x - self.farm_grid_x
         relative_y = y - self.farm_grid_y
         grid_x = int(relative_x // self.block_width)
         grid_y = int(relative_y // self.block_height)
 
         # 檢查位置是否在網格範圍內
-        if 0 <= grid_x < GRID_COLS and 0 <= grid_y < GRID_ROWS:
+        if 0 <= grid_x < self.cols and 0 <= grid_y < self.rows:
             return grid_x, grid_y
         return None
+
+    def visible_range(self, camera):
+        """
+        回傳畫面中可見的格子範圍 (first_row, last_row, first_col, last_col)，
+        沒有任何可見格子時回傳 None。
+        """
+        first_col = max(0, (camera.x - self.farm_grid_x) // self.block_width)
+        last_col = min(self.cols - 1, (camera.x + camera.width - self.farm_grid_x) // self.block_width)
+        first_row = max(0, (camera.y - self.farm_grid_y) // self.block_height)
+        last_row = min(
+            self.rows - 1, (camera.y + camera.height - self.farm_grid_y) // self.block_height
+        )
+        if first_col > last_col or first_row > last_row:
+            return None
+        return first_row, last_row, first_col, last_col
@@ -0,0 +1,369 @@
+# farm_model.py
+
+from array import array
+
+from coin import Coin
+from game_log import get_logger
+from scheduler import EventScheduler
+from settings import (
+    GRID_ROWS,
+    GRID_COLS,
+    DIRT_LEVELS,
+    INITIAL_COINS,
+    PLACE_DIRT_COST,
+    HARVEST_REWARD,
+    BASE_GROW_TIME,
+    SEED_INTERVAL,
+    PLANT_START_STAGE,
+    MAX_PLANT_STAGE,
+    WHEAT_SEED_NAME,
+)
+
+log = get_logger("farm")
+
+# 農場事件（成功時會通知所有 listener）
+PLACED = "placed"
+UPGRADED = "upgraded"
+PLANTED = "planted"
+GREW = "grew"
+HARVESTED = "harvested"
+
+# 排程器中代表「下一次生成種子」的 key（作物成長則以 (row, col) 為 key）
+SEED_SPAWN = "seed_spawn"
+
+# 動作失敗的原因
+NOT_ENOUGH_COINS = "not_enough_coins"
+MAX_LEVEL = "max_level"
+NO_DIRT = "no_dirt"
+OCCUPIED = "occupied"
+NO_SEEDS = "no_seeds"
+NOT_MATURE = "not_mature"
+
+
+# 沒有泥土的格子在 TileStore.levels 中的值
+EMPTY = -1
+# 作物種類：TileStore.crops 存放這個 tuple 的索引，0 表示沒有作物
+CROP_TYPES = (None, WHEAT_SEED_NAME)
+CROP_IDS = {name: crop for crop, name in enumerate(CROP_TYPES) if name is not None}
+# 還沒有排程成長的格子的 next_growth
+NO_GROWTH = float("inf")
+# 各泥土等級的成長間隔（毫秒）：基準成長時間 * (1 - growth_speed_bonus)
+GROW_INTERVALS = tuple(BASE_GROW_TIME * (1 - level["growth_speed_bonus"]) for level in DIRT_LEVELS)
+
+
+class TileStore:
+    """
+    整個網格的狀態以平行的 array 保存（struct of arrays），第 row 列第 col 行的索引為
+    row * cols + col：
+    - levels：泥土等級，EMPTY 表示沒有泥土
+    - stages：作物階段，0 表示沒有作物
+    - crops：作物種類（CROP_TYPES 的索引）
+    - last_growth / next_growth：最後一次與下一次成長的時間（毫秒）
+    每格只佔 19 bytes，圖片則由 dirt.py / plant.py 依等級與階段共用；
+    NumPy 可用 np.frombuffer() 不複製地讀取整個陣列。
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        size = rows * cols
+        self.levels = array("b", [EMPTY]) * size
+        self.stages = array("b", bytes(size))
+        self.crops = array("B", bytes(size))
+        self.last_growth = array("d", bytes(8 * size))
+        self.next_growth = array("d", [NO_GROWTH]) * size
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def has_dirt(self, row, col):
+        return self.levels[row * self.cols + col] != EMPTY
+
+    def level(self, row, col):
+        return self.levels[row * self.cols + col]
+
+    def stage(self, row, col):
+        return self.stages[row * self.cols + col]
+
+    def last_growth_time(self, row, col):
+        return self.last_growth[row * self.cols + col]
+
+    def dirt_tiles(self):
+        """有泥土的格子的 (row, col, 泥土等級, 作物階段, 最後成長時間)，依列、行排序。"""
+        cols = self.cols
+        return [
+            (i // cols, i % cols, level, self.stages[i], self.last_growth[i])
+            for i, level in enumerate(self.levels)
+            if level != EMPTY
+        ]
+
+
+class SeedStore:
+    """
+    種子庫存的資料部分（不含任何繪圖）。
+
+    - items / quantities 為平行陣列：每個格子的種子名稱與數量，
+      quantities 使用 array，snapshot() 只需複製一段連續記憶體；
+    - slot_of 為「種子名稱 -> 格子」的索引，同一種種子一律疊在同一格，
+      加入、移除與查詢數量都不必掃描格子；
+    - 空格與已使用的格子以位元遮罩記錄，最小的空格可以直接算出。
+    所有操作（包含批次的 add_many / remove_many）每種種子都是常數時間。
+    """
+
+    def __init__(self, slot_count):
+        self.slot_count = slot_count
+        self.items = [None] * slot_count  # 每個格子存放的種子名稱
+        self.quantities = array("q", bytes(8 * slot_count))  # 每個格子的數量
+        self.slot_of = {}  # 種子名稱 -> 格子
+        self.free_mask = (1 << slot_count) - 1  # 空格子的位元
+        self.version = 0  # 內容改變時遞增（畫面可以只比對這個數字）
+
+    def __contains__(self, name):
+        return name in self.slot_of
+
+    def count(self, name):
+        """某種種子的數量。"""
+        slot = self.slot_of.get(name)
+        return 0 if slot is None else self.quantities[slot]
+
+    def add(self, name, quantity=1):
+        slot = self.slot_of.get(name)
+        if slot is None:
+            if not self.free_mask:
+                # 如果庫存已滿，無法添加
+                log.warning("庫存已滿，無法添加物品！")
+                return False
+            # 使用編號最小的空格子
+            slot = (self.free_mask & -self.free_mask).bit_length() - 1
+            self.free_mask &= ~(1 << slot)
+            self.items[slot] = name
+            self.slot_of[name] = slot
+        self.quantities[slot] += quantity
+        self.version += 1
+        return True
+
+    def add_many(self, items):
+        """
+        批次加入 {名稱: 數量}（或 (名稱, 數量) 序列）：空格子不夠放下所有新的種子時整批都不加入，回傳是否成功。
+        """
+        pairs = list(items.items() if isinstance(items, dict) else items)
+        new_names = {name for name, _ in pairs if name not in self.slot_of}
+        if len(new_names) > self.free_mask.bit_count():
+            log.warning("庫存已滿，無法添加物品！")
+            return False
+        for name, quantity in pairs:
+            self.add(name, quantity)
+        return True
+
+    def remove(self, slot, quantity=1):
+        """從指定格子扣除數量，數量歸零時清空該格子。"""
+        name = self.items[slot]
+        if name is None or self.quantities[slot] < quantity:
+            return False
+        self.quantities[slot] -= quantity
+        if self.quantities[slot] == 0:
+            self.items[slot] = None
+            del self.slot_of[name]
+            self.free_mask |= 1 << slot
+        self.version += 1
+        return True
+
+    def remove_item(self, name, quantity=1):
+        """依名稱扣除數量。"""
+        slot = self.slot_of.get(name)
+        return slot is not None and self.remove(slot, quantity)
+
+    def remove_many(self, items):
+        """
+        批次扣除 {名稱: 數量}：任何一種不足時整批都不扣除，回傳是否成功。
+        """
+        pairs = list(items.items() if isinstance(items, dict) else items)
+        if any(self.count(name) < quantity for name, quantity in pairs):
+            return False
+        for name, quantity in pairs:
+            self.remove_item(name, quantity)
+        return True
+
+    def available_slots(self):
+        """有種子的格子，依編號排序。"""
+        slots = []
+        used = ~self.free_mask & ((1 << self.slot_count) - 1)
+        while used:
+            lowest = used & -used
+            slots.append(lowest.bit_length() - 1)
+            used ^= lowest
+        return slots
+
+    def snapshot(self):
+        """回傳 (名稱 tuple, 數量 array 的複本)，可安全地交給其他執行緒。"""
+        return tuple(self.items), array("q", self.quantities)
+
+    def restore(self, slots):
+        """以 (名稱, 數量) 序列重建庫存（例如讀取存檔）。"""
+        self.items = [None] * self.slot_count
+        self.quantities = array("q", bytes(8 * self.slot_count))
+        self.slot_of = {}
+        self.free_mask = (1 << self.slot_count) - 1
+        for slot, (name, quantity) in enumerate(slots[: self.slot_count]):
+            if name is None or not quantity:
+                continue
+            if name in self.slot_of:
+                # 舊存檔中同一種種子可能分在兩格，合併到第一格
+                self.quantities[self.slot_of[name]] += quantity
+                continue
+            self.items[slot] = name
+            self.quantities[slot] = quantity
+            self.slot_of[name] = slot
+            self.free_mask &= ~(1 << slot)
+        self.version += 1
+
+
+class FarmModel:
+    """
+    不依賴 pygame 的農場模型：網格上的泥土與作物、種子庫存與金幣。
+    所有規則（放置、升級、種植、成長、收穫）都在這裡，
+    Game 只負責把狀態畫出來，批次模擬則可直接驅動它。
+
+    時間一律由呼叫方以毫秒傳入（通常來自 GameClock）。
+    狀態改變時會呼叫 listener(event, row, col)，event 為 PLACED 等常數。
+
+    每株作物的下一次成長與下一次生成種子的時間都放在 EventScheduler 中，
+    update() 只處理已到期的事件，不必每幀掃描整個網格；
+    next_event_time() 則讓無畫面的模擬可以直接跳到下一個事件。
+    """
+
+    def __init__(
+        self,
+        rows=GRID_ROWS,
+        cols=GRID_COLS,
+        initial_coins=INITIAL_COINS,
+        seed_slots=5,
+        start_time=0,
+    ):
+        self.rows = rows
+        self.cols = cols
+        # 網格狀態（泥土等級、作物階段與種類、成長時間）以 typed array 保存
+        self.tiles = TileStore(rows, cols)
+        self.coin = Coin(initial_amount=initial_coins)
+        self.seeds = SeedStore(seed_slots)
+        self.seed_timer = start_time
+        self.listeners = []
+        # 已成熟、可收穫的格子
+        self.mature = set()
+
+        # 作物成長與種子生成的排程
+        self.scheduler = EventScheduler()
+        self.scheduler.schedule(SEED_SPAWN, start_time + SEED_INTERVAL)
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def notify(self, event, row, col):
+        for listener in self.listeners:
+            listener(event, row, col)
+
+    # === 玩家動作 ===
+    def place_or_upgrade(self, row, col):
+        """
+        空地上放置泥土，已有泥土則嘗試升級。
+        成功回傳 PLACED / UPGRADED，失敗回傳原因。
+        """
+        tiles = self.tiles
+        i = tiles.index(row, col)
+        level = tiles.levels[i]
+        if level == EMPTY:
+            if self.coin.get_amount() < PLACE_DIRT_COST:
+                return NOT_ENOUGH_COINS
+            self.coin.decrease(PLACE_DIRT_COST)
+            tiles.levels[i] = 0
+            self.notify(PLACED, row, col)
+            return PLACED
+
+        if level >= len(DIRT_LEVELS) - 1:
+            return MAX_LEVEL
+        upgrade_cost = DIRT_LEVELS[level]["upgrade_cost"]
+        if self.coin.get_amount() < upgrade_cost:
+            return NOT_ENOUGH_COINS
+        self.coin.decrease(upgrade_cost)
+        tiles.levels[i] = level + 1
+        # 成長中的作物依新的成長間隔重新排程
+        if (row, col) in self.scheduler:
+            self.schedule_growth(row, col)
+        self.notify(UPGRADED, row, col)
+        return UPGRADED
+
+    def plant(self, row, col, slot, current_time):
+        """用庫存第 slot 格的種子在指定農地種植。"""
+        tiles = self.tiles
+        i = tiles.index(row, col)
+        if tiles.levels[i] == EMPTY:
+            return NO_DIRT
+        if tiles.stages[i]:
+            return OCCUPIED
+        name = self.seeds.items[slot]
+        if not self.seeds.remove(slot):
+            return NO_SEEDS
+        tiles.stages[i] = PLANT_START_STAGE
+        tiles.crops[i] = CROP_IDS.get(name, CROP_IDS[WHEAT_SEED_NAME])
+        tiles.last_growth[i] = current_time
+        self.schedule_growth(row, col)
+        self.notify(PLANTED, row, col)
+        return PLANTED
+
+    def harvest(self, row, col):
+        """收穫已成熟的作物並獲得金幣。"""
+        tiles = self.tiles
+        i = tiles.index(row, col)
+        if tiles.levels[i] == EMPTY:
+            return NO_DIRT
+        if tiles.stages[i] < MAX_PLANT_STAGE:
+            return NOT_MATURE
+        self.coin.increase(HARVEST_REWARD)
+        tiles.stages[i] = 0
+        tiles.crops[i] = 0
+        self.mature.discard((row, col))
+        self.notify(HARVESTED, row, col)
+        return HARVESTED
+
+    # === 隨時間變化 ===
+    def schedule_growth(self, row, col):
+        """
+        排程下一次成長：最後一次成長後再經過
+        『基準成長時間 * (1 - growth_speed_bonus)』。
+        """
+        tiles = self.tiles
+        i = tiles.index(row, col)
+        due = tiles.last_growth[i] + GROW_INTERVALS[tiles.levels[i]]
+        tiles.next_growth[i] = due
+        self.scheduler.schedule((row, col), due)
+
+    def update(self, current_time):
+        """處理所有在 current_time 之前到期的種子生成與作物成長。"""
+        tiles = self.tiles
+        for key in self.scheduler.pop_due(current_time):
+            if key == SEED_SPAWN:
+                # 每 SEED_INTERVAL 毫秒增加一顆小麥種子
+                self.seed_timer = current_time
+                self.seeds.add(WHEAT_SEED_NAME, 1)
+                self.scheduler.schedule(SEED_SPAWN, current_time + SEED_INTERVAL)
+            else:
+                row, col = key
+                i = tiles.index(row, col)
+                stage = tiles.stages[i] + 1
+                tiles.stages[i] = stage
+                tiles.last_growth[i] = current_time
+                if stage < MAX_PLANT_STAGE:
+                    self.schedule_growth(row, col)
+                else:
+                    tiles.next_growth[i] = NO_GROWTH
+                    self.mature.add(key)
+                self.notify(GREW, row, col)
+
+    def next_event_time(self):
+        """回傳下一個種子生成或作物成長的時間（毫秒）。"""
+        return self.scheduler.next_time()
+
+    # === 查詢 ===
+    def mature_tiles(self):
+        """回傳所有可收穫作物的 (row, col)，依列、行排序。"""
+        return sorted(self.mature)
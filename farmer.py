@@ -1,13 +1,17 @@
 # farmer.py
 
 import pygame
+from assets import assets
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT
 
+# 農夫走路的精靈圖（4 個方向 x 8 幀）
+FARMER_SPRITESHEET = "./img/Farmer/Walk-Sheet.png"
+
 
 class Farmer:
     def __init__(self):
-        # 農夫精靈圖
-        self.spritesheet = pygame.image.load("./img/Farmer/Walk-Sheet.png")
+        # 農夫精靈圖（轉換成顯示格式，縮放後的每一幀也會沿用該格式）
+        self.spritesheet = assets.get(FARMER_SPRITESHEET)
         self.frame_width = 21
         self.frame_height = 17
         self.rows = 4
@@ -67,5 +71,9 @@ class Farmer:
             self.current_frame = (self.current_frame + 1) % self.cols
             self.frame_counter = 0
 
-    def draw(self, screen):
-        screen.blit(self.frames[self.direction][self.current_frame], (self.x, self.y))
+    def draw(self, screen, offset=(0, 0)):
+        # 農夫的座標為世界座標，offset 為攝影機位移
+        screen.blit(
+            self.frames[self.direction][self.current_frame],
+            (self.x + offset[0], self.y + offset[1]),
+        )
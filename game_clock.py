@@ -0,0 +1,38 @@
+# game_clock.py
+
+import time
+
+
+class GameClock:
+    """
+    遊戲時鐘：作物成長、種子生成、金幣動畫與計時器都從這裡取得
+    目前的遊戲時間（毫秒），而不是各自呼叫 pygame.time.get_ticks()。
+
+    - 一般模式：跟著真實時間前進，並乘上 speed_multiplier。
+    - 虛擬模式 (virtual=True)：只有呼叫 advance() 時才會前進，
+      讓 AutoGame 可以不受 FPS 限制、盡可能快速地模擬。
+    """
+
+    def __init__(self, speed_multiplier=1.0, virtual=False):
+        self.speed_multiplier = speed_multiplier
+        self.virtual = virtual
+        self.ticks = 0.0  # 目前的遊戲時間（毫秒）
+        self.last_real_time = time.perf_counter()
+
+    def get_ticks(self):
+        """回傳遊戲開始至今經過的遊戲時間（毫秒）。"""
+        if not self.virtual:
+            now = time.perf_counter()
+            self.ticks += (now - self.last_real_time) * 1000 * self.speed_multiplier
+            self.last_real_time = now
+        return self.ticks
+
+    def advance(self, milliseconds):
+        """虛擬模式下讓遊戲時間前進指定毫秒數。"""
+        self.ticks += milliseconds
+        return self.ticks
+
+    def advance_to(self, milliseconds):
+        """虛擬模式下直接跳到指定的遊戲時間（不會倒退）。"""
+        self.ticks = max(self.ticks, milliseconds)
+        return self.ticks
@@ -0,0 +1,196 @@
+# game_log.py
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+# 遊戲中所有訊息都使用 "farm" 底下的 logger，例如 get_logger("dirt") -> "farm.dirt"
+ROOT_NAME = "farm"
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+# 同一則訊息在幾秒內重複出現時只輸出第一次
+DEFAULT_RATE_LIMIT = 5.0
+
+root = logging.getLogger(ROOT_NAME)
+root.propagate = False
+root.setLevel(logging.INFO)
+
+
+def get_logger(name):
+    return logging.getLogger(f"{ROOT_NAME}.{name}")
+
+
+def instance_extra(instance_id):
+    """給 logger 的 extra：訊息前面會加上 [Instance N]。"""
+    return {"instance": instance_id}
+
+
+class InstanceFormatter(logging.Formatter):
+    """
+    有 instance 屬性的紀錄加上 [Instance N] 前綴，INFO 以外的等級再加上等級名稱，
+    INFO 訊息的輸出與原本的 print() 相同。
+    """
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno != logging.INFO:
+            message = f"{record.levelname}: {message}"
+        instance = record.__dict__.get("instance")
+        if instance is not None:
+            message = f"[Instance {instance}] {message}"
+        return message
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    同一個實例、同一等級的相同訊息在 interval 秒內只通過一次；
+    之後再通過時附上期間被略過的次數。
+    """
+
+    def __init__(self, interval=DEFAULT_RATE_LIMIT):
+        super().__init__()
+        self.interval = interval
+        self.seen = {}  # (實例, 等級, 訊息) -> [上次輸出的時間, 被略過的次數]
+
+    def filter(self, record):
+        message = record.getMessage()
+        key = (record.__dict__.get("instance"), record.levelno, message)
+        now = time.monotonic()
+        entry = self.seen.get(key)
+        if entry is not None and now - entry[0] < self.interval:
+            entry[1] += 1
+            return False
+        if entry is not None and entry[1]:
+            record.msg = f"{message}（{self.interval:g} 秒內另有 {entry[1]} 則相同訊息被略過）"
+            record.args = None
+        self.seen[key] = [now, 0]
+        return True
+
+
+class LogState:
+    """目前進程的設定：等級、是否靜音，以及（單一寫入者所在的進程）背景的 QueueListener。"""
+
+    def __init__(self):
+        self.configured = False  # 是否已呼叫過 configure()
+        self.level = logging.INFO
+        self.silent = False
+        self.shared_queue = None
+        self.listener = None
+        self.lock = threading.Lock()
+
+
+state = LogState()
+
+
+class DefaultHandler(logging.Handler):
+    """
+    尚未呼叫 configure() 時掛在 root 上的 handler：第一次有紀錄要輸出時才以預設設定
+    （INFO、在這個進程以背景執行緒輸出）呼叫 configure()，再把這筆紀錄交給新的 handler。
+    只 import 而沒有輸出任何訊息的進程（headless 批次、vector_sim 的工作進程、測試）
+    不會啟動寫入執行緒。
+    """
+
+    def emit(self, record):
+        with state.lock:
+            if not state.configured:
+                configure()
+        root.handle(record)
+
+
+def writer_handler(rate_limit=DEFAULT_RATE_LIMIT):
+    # 唯一實際寫入終端機的 handler，只在 QueueListener 的執行緒中使用
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(InstanceFormatter("%(message)s"))
+    if rate_limit:
+        handler.addFilter(RateLimitFilter(rate_limit))
+    return handler
+
+
+def stop_listener():
+    # 把佇列中剩下的紀錄全部寫出
+    if state.listener is not None:
+        state.listener.stop()
+        state.listener = None
+
+
+def configure(level=logging.INFO, silent=False, log_queue=None, rate_limit=DEFAULT_RATE_LIMIT):
+    """
+    設定目前進程的紀錄方式：
+    - 所有紀錄都先放進佇列，由單一的寫入者依序輸出，呼叫端不會被終端機 I/O 卡住；
+    - log_queue 為 None 時在這個進程啟動背景寫入執行緒，否則把紀錄交給
+      start_shared_writer() 建立的跨進程佇列，由主進程統一輸出；
+    - silent=True 時不處理任何紀錄（批次模式），呼叫成本只剩一次等級檢查。
+    """
+    state.configured = True
+    stop_listener()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    state.level = level
+    state.silent = silent
+    state.shared_queue = log_queue
+    if silent:
+        root.setLevel(logging.CRITICAL + 1)
+        root.addHandler(logging.NullHandler())
+        return
+
+    root.setLevel(level)
+    if log_queue is None:
+        log_queue = queue.SimpleQueue()
+        start_writer(log_queue, rate_limit)
+    root.addHandler(QueueHandler(log_queue))
+
+
+def start_writer(log_queue, rate_limit=DEFAULT_RATE_LIMIT):
+    state.listener = QueueListener(log_queue, writer_handler(rate_limit))
+    state.listener.start()
+
+
+def start_shared_writer(level=logging.INFO, rate_limit=DEFAULT_RATE_LIMIT):
+    """
+    在主進程建立跨進程的紀錄佇列與唯一的寫入者，回傳佇列；
+    子進程以 configure(log_queue=佇列) 把紀錄送到這裡。
+    """
+    # multiprocessing 只在多進程模式才需要，不在 import 時載入
+    import multiprocessing
+    from multiprocessing.util import Finalize
+
+    log_queue = multiprocessing.Queue()
+    configure(level, log_queue=log_queue)
+    start_writer(log_queue, rate_limit)
+    # 結束時要在 multiprocessing 關閉佇列之前寫完剩下的紀錄
+    Finalize(log_queue, stop_listener, exitpriority=100)
+    return log_queue
+
+
+class quiet:
+    """暫時不輸出任何紀錄（例如效能測試或重播時）。"""
+
+    def __enter__(self):
+        self.level = root.level
+        root.setLevel(logging.CRITICAL + 1)
+        return self
+
+    def __exit__(self, *exc):
+        root.setLevel(self.level)
+
+
+def after_fork():
+    # fork 出來的子進程沒有父進程的寫入執行緒，以相同設定重新建立（還沒設定過時維持延後設定）
+    state.listener = None
+    state.lock = threading.Lock()
+    if state.configured:
+        configure(state.level, state.silent, state.shared_queue)
+
+
+# 預設：INFO 等級，第一次輸出訊息時才在這個進程啟動背景寫入執行緒
+root.addHandler(DefaultHandler())
+atexit.register(stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=after_fork)
@@ -0,0 +1,292 @@
+# headless_game.py
+
+import random
+import datetime
+import uuid
+
+from farm_model import FarmModel, PLACED, UPGRADED, PLANTED, HARVESTED, NOT_ENOUGH_COINS
+from game_clock import GameClock
+from policy import FarmView, RandomPolicy, PLACE, UPGRADE, PLANT, HARVEST, WAIT, DEFAULT_WAIT
+from scheduler import EventScheduler
+from settings import FPS
+from game_log import get_logger, instance_extra
+
+log = get_logger("session")
+
+# 排程器中代表「下一次隨機動作」的 key
+AUTO_ACTION = "auto_action"
+
+
+def episode_name(instance_id, seed=None, start=None):
+    """
+    一局的名稱，用於 log/ 中的檔名：開始時間、實例ID、亂數種子（有指定時），
+    最後加上一段隨機字元，同一秒內重複使用同一個實例ID（例如連續的批次）也不會互相覆蓋。
+    """
+    start = start or datetime.datetime.now()
+    name = f"{start.strftime('%Y%m%d_%H%M%S')}_instance{instance_id}"
+    if seed is not None:
+        name += f"_seed{seed}"
+    return f"{name}_{uuid.uuid4().hex[:6]}"
+
+
+class HeadlessGame:
+    """
+    不需要 pygame 的自動遊玩流程：直接驅動 FarmModel，
+    依策略 (policy，預設為原本的隨機行為 RandomPolicy) 執行動作並每秒記錄一次狀態。
+    AutoGame 在畫面上執行時也是透過它來決定動作。
+    """
+
+    def __init__(
+        self,
+        instance_id=1,
+        total_time=60,
+        farm=None,
+        game_clock=None,
+        seed=None,
+        on_move=None,
+        log_format="csv",
+        policy=None,
+        name=None,
+    ):
+        # 遊戲時鐘：預設為虛擬時鐘，每次 run() 迴圈前進一幀
+        self.game_clock = game_clock if game_clock is not None else GameClock(virtual=True)
+        self.farm = farm if farm is not None else FarmModel(start_time=self.game_clock.get_ticks())
+
+        # 總遊戲時間（秒）
+        self.total_time = total_time
+        # 每一幀的遊戲時間（毫秒）
+        self.frame_time = 1000 / FPS
+
+        # 決定動作的策略
+        self.policy = policy if policy is not None else RandomPolicy()
+
+        # 以遊戲時間（秒）排程的事件：下一次執行動作的時間點
+        self.scheduler = EventScheduler()
+        self.scheduler.schedule(AUTO_ACTION, 0)
+        # 獨立的亂數產生器，指定 seed 可重現同一局
+        self.rng = random.Random(seed)
+        # 動作前會呼叫 on_move(row, col)，讓畫面上的農夫走到目標格子
+        self.on_move = on_move
+
+        # 紀錄遊戲開始的實際時間，與實例ID、亂數種子一起用於命名檔案（name 可由呼叫方指定，例如 AutoGame）
+        self.game_start_datetime = datetime.datetime.now()
+        self.name = name or episode_name(instance_id, seed, self.game_start_datetime)
+        self.log_format = log_format
+        self.log_filename = f"log/game_{self.name}"
+
+        # 數據收集：每秒的遊戲狀態寫入固定大小的緩衝區，滿了就寫入檔案；
+        # delta 格式則只記錄有變化的格子（由 FarmModel 事件得知），
+        # log_format 為 "none" 時不記錄（批次模式只需要最終結果），
+        # 也就不必載入紀錄模組與 NumPy
+        if log_format == "none":
+            self.recorder = None
+        else:
+            from recorder import GameRecorder, EXTENSIONS
+
+            self.log_filename += EXTENSIONS.get(log_format, "")
+            if log_format == "delta":
+                from delta_log import DeltaLogWriter
+
+                self.recorder = DeltaLogWriter(
+                    self.log_filename, self.farm.rows, self.farm.cols, instance_id=instance_id
+                )
+                self.changed_tiles = set()
+                self.farm.add_listener(self.on_farm_event)
+            else:
+                self.recorder = GameRecorder(
+                    self.log_filename,
+                    self.farm.rows,
+                    self.farm.cols,
+                    instance_id=instance_id,
+                    format=log_format,
+                )
+        self.last_record_second = -1  # 上一次記錄的秒數
+
+        self.game_time = 0  # in seconds
+        self.instance_id = instance_id
+        # 訊息前面加上 [Instance N]
+        self.log_extra = instance_extra(instance_id)
+
+    def run(self, fast_forward=False):
+        """
+        以虛擬時鐘模擬到 total_time，回傳最終金幣數。
+
+        預設逐幀前進（與 AutoGame 相同的經濟結果）；fast_forward=True 時
+        直接跳到下一個事件（動作、種子、成長或每秒紀錄），事件會在
+        精確的到期時間發生，而不是下一幀。
+        """
+        while True:
+            if fast_forward:
+                self.game_time = self.advance_to_next_event()
+            else:
+                self.game_clock.advance(self.frame_time)
+                self.game_time = self.game_clock.get_ticks() / 1000.0
+            if self.game_time >= self.total_time:
+                return self.finish()
+            self.update(self.game_time)
+
+    def advance_to_next_event(self):
+        """
+        讓時鐘跳到下一個事件的時間，回傳對應的遊戲時間（秒）。
+        """
+        next_second = min(
+            self.scheduler.next_time(), self.last_record_second + 1, self.total_time
+        )
+        farm_next = self.farm.next_event_time()
+        if farm_next is not None and farm_next < next_second * 1000:
+            self.game_clock.advance_to(farm_next)
+            return farm_next / 1000.0
+        self.game_clock.advance_to(next_second * 1000)
+        return next_second
+
+    def update(self, game_time):
+        """
+        推進到 game_time：先處理到期的種子與作物成長，到時間再讓策略決定並執行動作，最後記錄狀態。
+        同一時間點成熟的作物與生成的種子在決策時就看得到，逐幀與 fast_forward 的結果相同。
+        """
+        self.game_time = game_time
+        self.farm.update(self.game_clock.get_ticks())
+
+        for _ in self.scheduler.pop_due(game_time):
+            actions = self.policy.decide(FarmView(self.farm, game_time), self.rng)
+            delay = self.perform_actions(actions)
+            # 設定下一次決策的時間點
+            self.scheduler.schedule(AUTO_ACTION, game_time + delay)
+
+        self.record_game_state(game_time)
+
+    def finish(self):
+        """
+        遊戲結束：記錄最後一秒的狀態並儲存數據，回傳最終金幣數。
+        """
+        self.record_game_state(self.game_time)
+        final_coin = self.farm.coin.get_amount()
+        log.info("Time's up! Final coin count = %s", final_coin, extra=self.log_extra)
+        self.save_game_data()
+        return final_coin
+
+    def perform_actions(self, actions):
+        """
+        依序執行策略回傳的動作，回傳到下一次決策的秒數（必須大於 0，否則 ValueError）。
+        """
+        delay = DEFAULT_WAIT
+        for action in actions:
+            kind = action[0]
+            if kind == WAIT:
+                delay = action[1]
+                # 等待 0 秒或負數會在同一時間點一直重新決策，fast_forward 永遠不會前進
+                if not delay > 0:
+                    policy = f"{type(self.policy).__module__}:{type(self.policy).__name__}"
+                    raise ValueError(f"Policy {policy} returned a non-positive wait: {action}")
+                continue
+            r, c = action[1], action[2]
+            self.move_farmer_to(r, c)
+            if kind == PLACE or kind == UPGRADE:
+                self.place_soil(r, c)
+            elif kind == PLANT:
+                self.plant_seed(r, c, action[3])
+            elif kind == HARVEST:
+                self.harvest(r, c)
+            else:
+                raise ValueError(f"Unknown action: {action}")
+        return delay
+
+    def move_farmer_to(self, r, c):
+        if self.on_move is not None:
+            self.on_move(r, c)
+
+    def place_soil(self, r, c):
+        """
+        在指定農地放置泥土，若已有泥土則嘗試升級。
+        """
+        result = self.farm.place_or_upgrade(r, c)
+        if result == PLACED:
+            log.info("Placed dirt at (%d, %d).", r, c, extra=self.log_extra)
+        elif result == UPGRADED:
+            level = self.farm.tiles.level(r, c)
+            log.info("Upgraded dirt at (%d, %d) to level %d.", r, c, level, extra=self.log_extra)
+        elif result == NOT_ENOUGH_COINS:
+            if not self.farm.tiles.has_dirt(r, c):
+                log.debug("Insufficient coins to place dirt.", extra=self.log_extra)
+            else:
+                log.debug("Insufficient coins to upgrade dirt.", extra=self.log_extra)
+        else:
+            log.debug("Dirt at (%d, %d) is already at maximum level.", r, c, extra=self.log_extra)
+
+    def plant_seed(self, r, c, slot):
+        """
+        用庫存第 slot 格的種子在指定農地種植作物，若該格有泥土且無作物且有種子。
+        """
+        tiles = self.farm.tiles
+        if tiles.has_dirt(r, c) and not tiles.stage(r, c):
+            seed_name = self.farm.seeds.items[slot]
+            if self.farm.plant(r, c, slot, self.game_clock.get_ticks()) == PLANTED:
+                log.info("Planted %s at (%d, %d).", seed_name, r, c, extra=self.log_extra)
+            else:
+                log.debug("No seeds available to plant.", extra=self.log_extra)
+        else:
+            log.debug(
+                "Cannot plant at (%d, %d). Either no dirt or already has a plant.", r, c, extra=self.log_extra
+            )
+
+    def harvest(self, r, c):
+        """
+        收穫指定農地的作物，若該作物已到達第5階段。
+        """
+        if self.farm.harvest(r, c) == HARVESTED:
+            log.info("Harvested plant at (%d, %d) and gained 50 coins.", r, c, extra=self.log_extra)
+        else:
+            log.debug("No mature plant to harvest at (%d, %d).", r, c, extra=self.log_extra)
+
+    def record_game_state(self, game_time):
+        """
+        每秒記錄一次遊戲狀態。
+        包括每個土壤位置的資訊（座標、土壤等級、植物等級）、時間（秒數）、金幣數量。
+        """
+        elapsed_seconds = int(game_time)
+
+        # 確保每秒只記錄一次
+        if elapsed_seconds > self.last_record_second:
+            self.last_record_second = elapsed_seconds
+            if self.recorder is None:
+                return
+            coins = self.farm.coin.get_amount()
+
+            if self.log_format == "delta":
+                if not self.recorder.keyframe_due(elapsed_seconds):
+                    tiles = self.farm.tiles
+                    changes = [
+                        (r, c, tiles.level(r, c) + 1, tiles.stage(r, c)) for r, c in sorted(self.changed_tiles)
+                    ]
+                    self.changed_tiles.clear()
+                    self.recorder.record_changes(elapsed_seconds, changes, coins)
+                    return
+                self.changed_tiles.clear()
+
+            import numpy as np
+
+            # 直接讀取 TileStore 的陣列：土壤 0 表示沒有泥土，1~4 對應 DIRT_LEVELS；植物 2~5 或 0
+            tiles = self.farm.tiles
+            soil_levels = np.frombuffer(tiles.levels, dtype=np.int8) + 1
+            plant_levels = np.frombuffer(tiles.stages, dtype=np.int8)
+
+            if self.log_format == "delta":
+                self.recorder.record_keyframe(elapsed_seconds, soil_levels, plant_levels, coins)
+            else:
+                self.recorder.record_snapshot(elapsed_seconds, soil_levels, plant_levels, coins)
+
+    def on_farm_event(self, event, row, col):
+        # delta 格式：記下這一秒狀態有變化的格子
+        self.changed_tiles.add((row, col))
+
+    def save_game_data(self):
+        """
+        把尚未寫入的遊戲數據寫入檔案並關閉。
+        檔名包含遊戲開始時的時間和實例ID。
+        """
+        if self.recorder is None:
+            return
+        if not self.recorder.close():
+            log.info("No game data to save.", extra=self.log_extra)
+            return
+        log.info("Game data saved to %s.", self.log_filename, extra=self.log_extra)
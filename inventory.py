@@ -1,19 +1,23 @@
 # inventory.py
 
 import pygame
+from assets import assets
+from farm_model import SeedStore
+from seed import create_seed
+from text_cache import text_cache
+
+# 道具欄與格子數字的圖片
+INVENTORY_IMAGE = "./img/SeedInv.png"
+NUMBER_IMAGES = [f"./img/Num{i}.png" for i in range(1, 6)]
 
 
 class Inventory:
-    def __init__(self, x_position, slot_count, quantity_font):
+    def __init__(self, x_position, slot_count, quantity_font, store=None):
         # 載入道具欄圖片
-        self.inventory_image = pygame.image.load("./img/SeedInv.png").convert_alpha()
+        original = assets.get(INVENTORY_IMAGE)
         # 縮小道具欄圖片大小
-        self.inventory_image = pygame.transform.scale(
-            self.inventory_image,
-            (
-                self.inventory_image.get_width() // 2,
-                self.inventory_image.get_height() // 2,
-            ),
+        self.inventory_image = assets.get(
+            INVENTORY_IMAGE, (original.get_width() // 2, original.get_height() // 2)
         )
         # 儲存圖片尺寸
         self.width = self.inventory_image.get_width()
@@ -27,29 +31,54 @@ class Inventory:
         self.slot_width = self.width // self.slot_count  # 每個格子的寬度
         self.slot_height = self.height  # 格子的高度
 
-        # 物品和數量
-        self.items = [None] * self.slot_count  # 每個格子存放的物品
-        self.quantities = [0] * self.slot_count  # 每個格子的物品數量
+        # 物品和數量存放在不含繪圖的 SeedStore（通常是 FarmModel.seeds）
+        self.store = store if store is not None else SeedStore(slot_count)
+        # 物品名稱對應的圖片物件（Seed），需要繪製時才建立
+        self.item_sprites = {}
 
         # 字體，用於顯示數量
         self.quantity_font = quantity_font
 
-        # 載入數字圖片
+        # 載入數字圖片（只有 1 ~ 5 的圖片，之後的格子以字體繪製數字）
         self.number_images = []
-        for i in range(1, slot_count + 1):
-            num_image = pygame.image.load(f"./img/Num{i}.png").convert_alpha()
-            num_image = pygame.transform.scale(
-                num_image,
-                (num_image.get_width() // 2, num_image.get_height() // 2),
-            )
+        for i in range(slot_count):
+            if i < len(NUMBER_IMAGES):
+                original = assets.get(NUMBER_IMAGES[i])
+                num_image = assets.get(
+                    NUMBER_IMAGES[i], (original.get_width() // 2, original.get_height() // 2)
+                )
+            else:
+                num_image = text_cache.render(quantity_font, str(i + 1), True, (255, 255, 255))
             self.number_images.append(num_image)
 
         # 高亮顏色
         self.highlight_color = (255, 255, 0, 100)  # 黃色，透明度 100
+        self.highlight_image = None
 
         self.show_numbers = False  # 控制數字圖片的顯示和隱藏
         self.selected_slot = None  # 當前選中的格子（0 到 slot_count - 1），None 表示未選中
 
+        # 上一次繪製的 (Surface, 位置) 清單與對應的狀態
+        self.draw_list = []
+        self.draw_key = None
+
+    @property
+    def items(self):
+        # 每個格子存放的物品名稱
+        return self.store.items
+
+    @property
+    def quantities(self):
+        # 每個格子的物品數量
+        return self.store.quantities
+
+    def get_item_sprite(self, name):
+        sprite = self.item_sprites.get(name)
+        if sprite is None:
+            sprite = create_seed(name)
+            self.item_sprites[name] = sprite
+        return sprite
+
     def toggle_numbers(self):
         # 切換數字圖片的顯示狀態
         self.show_numbers = not self.show_numbers
@@ -66,28 +95,29 @@ class Inventory:
         self.selected_slot = None
 
     def add_item(self, item, quantity=1):
-        # 將物品添加到庫存中
-        for i in range(self.slot_count):
-            if self.items[i] is None:
-                # 如果格子是空的，添加物品
-                self.items[i] = item
-                self.quantities[i] = quantity
-                return
-            elif self.items[i].name == item.name:
-                # 如果格子中已有相同的物品，增加數量
-                self.quantities[i] += quantity
-                return
-        # 如果庫存已滿，無法添加
-        print("庫存已滿，無法添加物品！")
+        # 將物品添加到庫存中，並記住它的圖片供繪製使用
+        self.item_sprites.setdefault(item.name, item)
+        return self.store.add(item.name, quantity)
 
     def draw(self, screen):
-        # 繪製道具欄
-        screen.blit(self.inventory_image, (self.x, self.y))
-
-        # 繪製物品圖片和數量
+        # 道具欄、物品、數量、數字與高亮依序以一次 Surface.blits 繪製，
+        # 清單只在庫存內容、數字顯示或選擇改變時重建
+        key = (self.store.version, self.show_numbers, self.selected_slot, self.x, self.y)
+        if key != self.draw_key:
+            self.draw_list = self.build_draw_list()
+            self.draw_key = key
+        screen.blits(self.draw_list, doreturn=False)
+
+    def build_draw_list(self):
+        """回傳整個庫存的 (Surface, 位置) 清單，順序即繪製順序。"""
+        # 道具欄
+        draw_list = [(self.inventory_image, (self.x, self.y))]
+
+        # 物品圖片和數量
         for i in range(self.slot_count):
-            item = self.items[i]
-            if item:
+            name = self.items[i]
+            if name:
+                item = self.get_item_sprite(name)
                 # 計算物品圖片的位置
                 slot_x = self.x + i * self.slot_width
                 slot_y = self.y
@@ -98,18 +128,20 @@ class Inventory:
                         slot_y + self.slot_height // 2,
                     )
                 )
-                screen.blit(item.image, item_rect)
+                draw_list.append((item.image, item_rect))
 
                 # 在物品圖片的右下角繪製數量
                 quantity_text = f"x{self.quantities[i]}"
-                quantity_surface = self.quantity_font.render(quantity_text, True, (255, 255, 255))
+                quantity_surface = text_cache.render(
+                    self.quantity_font, quantity_text, True, (255, 255, 255)
+                )
                 quantity_rect = quantity_surface.get_rect(
                     bottomright=(
                         slot_x + self.slot_width - 5,
                         slot_y + self.slot_height - 5,
                     )
                 )
-                screen.blit(quantity_surface, quantity_rect)
+                draw_list.append((quantity_surface, quantity_rect))
 
         if self.show_numbers:
             # 在每個格子中間繪製數字圖片
@@ -120,13 +152,15 @@ class Inventory:
                 slot_center_x = slot_x + self.slot_width // 2
                 slot_center_y = self.y + self.slot_height
                 num_rect = num_image.get_rect(center=(slot_center_x, slot_center_y))
-                screen.blit(num_image, num_rect)
+                draw_list.append((num_image, num_rect))
 
             if self.selected_slot is not None:
-                # 在選中的格子上繪製高亮效果
+                # 在選中的格子上繪製高亮效果（高亮圖片只建立一次）
+                if self.highlight_image is None:
+                    self.highlight_image = pygame.Surface(
+                        (self.slot_width, self.slot_height), pygame.SRCALPHA
+                    )
+                    self.highlight_image.fill(self.highlight_color)
                 slot_x = self.x + self.selected_slot * self.slot_width
-                highlight_rect = pygame.Surface(
-                    (self.slot_width, self.slot_height), pygame.SRCALPHA
-                )
-                highlight_rect.fill(self.highlight_color)
-                screen.blit(highlight_rect, (slot_x, self.y))
+                draw_list.append((self.highlight_image, (slot_x, self.y)))
+        return draw_list
@@ -0,0 +1,304 @@
+# log_analytics.py
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from recorder import read_binary
+from delta_log import DeltaLogReader
+
+# 讀取 CSV 時每次處理的列數
+CHUNK_ROWS = 200_000
+# 快取檔（放在紀錄資料夾中）
+CACHE_NAME = "analytics_cache.npz"
+LOG_PATTERNS = ("game_*.csv", "game_*.bin", "game_*.delta")
+# 同一局有多種格式時（例如 delta_log.py 轉出的同名 CSV）只讀取一個，依序優先
+FORMAT_PRIORITY = (".delta", ".bin", ".csv")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# 快取中每個紀錄檔的索引：檔案資訊、每秒數據在合併陣列中的位置與整局的統計
+INDEX_DTYPE = np.dtype(
+    [
+        ("path", "U256"),
+        ("size", "i8"),
+        ("mtime", "f8"),
+        ("instance", "i4"),
+        ("cells", "i4"),
+        ("start", "i8"),
+        ("length", "i4"),
+        ("final_coins", "i8"),
+        ("first_harvest", "i4"),  # 第一次收穫的秒數，沒有收穫為 -1
+        ("harvests", "i4"),
+    ]
+)
+# 每秒數據：時間、金幣、有泥土的格數、有作物的格數
+CURVE_FIELDS = ("time", "coins", "soil_tiles", "plant_tiles")
+
+
+def per_second_frame(frame):
+    """把逐格紀錄（CSV 欄位）彙總成每秒一列。"""
+    return frame.assign(
+        soil=frame["Soil Level"] > 0,
+        plant=frame["Plant Level"] > 0,
+    ).groupby("Time (s)").agg(
+        coins=("Coins", "first"),
+        soil_tiles=("soil", "sum"),
+        plant_tiles=("plant", "sum"),
+        cells=("Grid Row", "size"),
+        instance=("Instance ID", "first"),
+    )
+
+
+def summarize_file(path):
+    """
+    讀取一個紀錄檔（csv / bin / delta），回傳每秒的金幣與格子使用量，
+    以及網格大小與實例ID。CSV 以 CHUNK_ROWS 為單位分段讀取，記憶體用量固定。
+    """
+    path = Path(path)
+    if path.suffix == ".delta":
+        reader = DeltaLogReader(path)
+        rows = []
+        for time, soil, plant, coins in reader.iter_snapshots():
+            rows.append((time, coins, np.count_nonzero(soil), np.count_nonzero(plant)))
+        curve = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        return curve, reader.rows * reader.cols, reader.instance_id
+
+    if path.suffix == ".bin":
+        parts = [per_second_frame(pd.DataFrame(read_binary(path)))]
+    else:
+        chunks = pd.read_csv(
+            path,
+            encoding="utf-8-sig",
+            dtype="int64",
+            chunksize=CHUNK_ROWS,
+        )
+        parts = [per_second_frame(chunk) for chunk in chunks]
+
+    # 同一秒可能被分在兩段，合併時再彙總一次
+    seconds = pd.concat(parts).groupby(level=0).agg(
+        coins=("coins", "first"),
+        soil_tiles=("soil_tiles", "sum"),
+        plant_tiles=("plant_tiles", "sum"),
+        cells=("cells", "sum"),
+        instance=("instance", "first"),
+    )
+    curve = np.column_stack(
+        [seconds.index.to_numpy(), seconds["coins"], seconds["soil_tiles"], seconds["plant_tiles"]]
+    ).astype(np.int64)
+    cells = int(seconds["cells"].iloc[0]) if len(seconds) else 0
+    instance = int(seconds["instance"].iloc[0]) if len(seconds) else 0
+    return curve, cells, instance
+
+
+def summarize_task(path):
+    # 給進程池使用的包裝，讀取失敗時回傳錯誤訊息而不是中斷整批
+    try:
+        return str(path), summarize_file(path), None
+    except Exception as error:
+        return str(path), None, f"{type(error).__name__}: {error}"
+
+
+def episode_files(paths):
+    """每局（檔名主體）只保留一個紀錄檔，優先順序見 FORMAT_PRIORITY，依檔名排序回傳。"""
+    chosen = {}
+    for path in paths:
+        current = chosen.get(path.stem)
+        if current is None or FORMAT_PRIORITY.index(path.suffix) < FORMAT_PRIORITY.index(current.suffix):
+            chosen[path.stem] = path
+    return sorted(chosen.values())
+
+
+class LogIndex:
+    """
+    紀錄資料夾的精簡索引：每個紀錄檔整理成每秒的金幣與格子使用量，
+    全部串接後存成一個 .npz 快取；之後查詢只讀快取，只有新增或修改過的檔案才會重新解析。
+    """
+
+    def __init__(self, index, curves):
+        self.index = index
+        self.curves = curves  # 欄位名稱 -> 串接後的每秒數據
+
+    @classmethod
+    def load(cls, log_dir, workers=None, rebuild=False):
+        log_dir = Path(log_dir)
+        cache_path = log_dir / CACHE_NAME
+        files = episode_files(path for pattern in LOG_PATTERNS for path in log_dir.glob(pattern))
+
+        cached = {}
+        if cache_path.exists() and not rebuild:
+            with np.load(cache_path) as data:
+                index = data["index"]
+                curves = {name: data[name] for name in CURVE_FIELDS}
+            for entry in index:
+                start, length = entry["start"], entry["length"]
+                cached[entry["path"]] = (
+                    entry,
+                    np.column_stack([curves[name][start : start + length] for name in CURVE_FIELDS]),
+                )
+
+        # 找出新增或修改過的檔案
+        results = {}
+        pending = []
+        for path in files:
+            stat = path.stat()
+            entry = cached.get(str(path))
+            if entry is not None and entry[0]["size"] == stat.st_size and entry[0]["mtime"] == stat.st_mtime:
+                results[str(path)] = (entry[1], int(entry[0]["cells"]), int(entry[0]["instance"]))
+            else:
+                pending.append(path)
+
+        if pending:
+            print(f"解析 {len(pending)} 個紀錄檔（已快取 {len(results)} 個）...", file=sys.stderr)
+            workers = workers or os.cpu_count()
+            if workers > 1 and len(pending) > 1:
+                with ProcessPoolExecutor(workers) as pool:
+                    parsed = list(pool.map(summarize_task, pending, chunksize=max(1, len(pending) // (workers * 4))))
+            else:
+                parsed = [summarize_task(path) for path in pending]
+            for path, summary, error in parsed:
+                if error is not None:
+                    print(f"略過 {path}：{error}", file=sys.stderr)
+                    continue
+                results[path] = summary
+
+        log_index = cls.build(files, results)
+        if pending or len(cached) != len(log_index.index):
+            log_index.save(cache_path)
+        return log_index
+
+    @classmethod
+    def build(cls, files, results):
+        index = np.zeros(len(results), dtype=INDEX_DTYPE)
+        parts = []
+        start = 0
+        i = 0
+        for path in files:
+            if str(path) not in results:
+                continue
+            curve, cells, instance = results[str(path)]
+            stat = path.stat()
+            coins = curve[:, 1]
+            gains = np.flatnonzero(np.diff(coins) > 0) + 1
+            entry = index[i]
+            entry["path"] = str(path)
+            entry["size"] = stat.st_size
+            entry["mtime"] = stat.st_mtime
+            entry["instance"] = instance
+            entry["cells"] = cells
+            entry["start"] = start
+            entry["length"] = len(curve)
+            entry["final_coins"] = coins[-1] if len(coins) else 0
+            # 金幣只會因為收穫而增加
+            entry["first_harvest"] = curve[gains[0], 0] if len(gains) else -1
+            entry["harvests"] = len(gains)
+            parts.append(curve)
+            start += len(curve)
+            i += 1
+
+        stacked = np.concatenate(parts) if parts else np.zeros((0, len(CURVE_FIELDS)), dtype=np.int64)
+        curves = {name: stacked[:, column].copy() for column, name in enumerate(CURVE_FIELDS)}
+        return cls(index, curves)
+
+    def save(self, cache_path):
+        np.savez(cache_path, index=self.index, **self.curves)
+
+    def __len__(self):
+        return len(self.index)
+
+    def curve(self, i, name):
+        entry = self.index[i]
+        return self.curves[name][entry["start"] : entry["start"] + entry["length"]]
+
+    # === 查詢 ===
+    def instances(self):
+        """每局一列：實例、檔案、最終金幣、第一次收穫、收穫次數與平均格子使用率。"""
+        rows = []
+        for i, entry in enumerate(self.index):
+            cells = max(int(entry["cells"]), 1)
+            rows.append(
+                {
+                    "instance": int(entry["instance"]),
+                    "file": Path(entry["path"]).name,
+                    "final_coins": int(entry["final_coins"]),
+                    "first_harvest_s": int(entry["first_harvest"]),
+                    "harvests": int(entry["harvests"]),
+                    "soil_utilisation": self.curve(i, "soil_tiles").mean() / cells,
+                    "plant_utilisation": self.curve(i, "plant_tiles").mean() / cells,
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def coin_curves(self):
+        """所有局每一秒的金幣平均值與百分位數。"""
+        frame = pd.DataFrame({"time": self.curves["time"], "coins": self.curves["coins"]})
+        grouped = frame.groupby("time")["coins"]
+        result = grouped.agg(["count", "mean", "min", "max"])
+        for p in PERCENTILES:
+            result[f"p{p}"] = grouped.quantile(p / 100)
+        return result
+
+    def summary(self):
+        """跨局的彙總：最終金幣分佈、第一次收穫時間與格子使用率。"""
+        table = self.instances()
+        final = table["final_coins"].to_numpy()
+        harvested = table["first_harvest_s"][table["first_harvest_s"] >= 0].to_numpy()
+        lines = [f"局數：{len(table)}"]
+        if len(table) == 0:
+            return "\n".join(lines)
+        lines.append(
+            f"最終金幣：平均 {final.mean():.1f}，標準差 {final.std():.1f}，最小 {final.min()}，最大 {final.max()}"
+        )
+        lines.append(
+            "最終金幣百分位數："
+            + "，".join(f"p{p} {np.percentile(final, p):.0f}" for p in PERCENTILES)
+        )
+        if len(harvested):
+            lines.append(
+                f"第一次收穫：{len(harvested)}/{len(table)} 局有收穫，"
+                f"平均第 {harvested.mean():.1f} 秒，中位數第 {np.median(harvested):.0f} 秒"
+            )
+        else:
+            lines.append("第一次收穫：沒有任何一局收穫")
+        lines.append(
+            f"平均格子使用率：泥土 {table['soil_utilisation'].mean():.1%}，作物 {table['plant_utilisation'].mean():.1%}"
+        )
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="分析 log/ 中的遊戲紀錄（csv / bin / delta）。")
+    parser.add_argument(
+        "query",
+        nargs="?",
+        default="summary",
+        choices=["summary", "instances", "curve"],
+        help="summary：跨局彙總（預設）；instances：每局一列；curve：每秒金幣曲線。",
+    )
+    parser.add_argument("--log_dir", default="log", help="紀錄資料夾（預設為 log）。")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="解析紀錄檔的進程數量。")
+    parser.add_argument("--rebuild", action="store_true", help="忽略快取，重新解析所有紀錄檔。")
+    parser.add_argument("-o", "--output", default=None, help="把 instances / curve 的結果寫入 CSV。")
+    args = parser.parse_args()
+
+    log_index = LogIndex.load(args.log_dir, workers=args.workers, rebuild=args.rebuild)
+
+    if args.query == "summary":
+        print(log_index.summary())
+        return
+
+    table = log_index.instances() if args.query == "instances" else log_index.coin_curves()
+    if args.output:
+        table.to_csv(args.output, encoding="utf-8-sig")
+        print(f"結果已儲存至 {args.output}。")
+    else:
+        with pd.option_context("display.max_rows", None, "display.max_columns", None, "display.width", 200):
+            print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,86 @@
 # main_game.py
 
 import os
+import argparse
+import datetime
 import pygame
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, GRID_ROWS, GRID_COLS, FPS
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, GRID_ROWS, GRID_COLS, FPS, DIRT_LEVELS
 from background import Background
 from inventory import Inventory
 from farmer import Farmer
 from farm_grid import FarmGrid
 from event_handler import EventHandler
-from coin import Coin
-from coin_animation import CoinAnimation  # 重新啟用 CoinAnimation
-from seed import WheatSeed, AppleSeed
+from particles import ParticlePool
+from dirt import DIRT_IMAGE_SIZE, TileBatch
+from game_clock import GameClock
+from assets import preload_game_assets
+from farm_model import FarmModel, UPGRADED, HARVESTED
+from camera import Camera
+from renderer import DirtyRectRenderer
+from text_cache import text_cache
+from profiler import FrameProfiler, NullProfiler
+from game_log import get_logger, configure as configure_logging, LEVELS
+from savegame import AutoSaver, DEFAULT_AUTOSAVE_INTERVAL, take_snapshot, restore_snapshot, read_save, write_save
+
+log = get_logger("game")
 
 
 class Game:
-    def __init__(self):
+    def __init__(
+        self,
+        game_clock=None,
+        rows=GRID_ROWS,
+        cols=GRID_COLS,
+        dirty_rects=False,
+        profile_path=None,
+        save_path=None,
+        autosave_interval=DEFAULT_AUTOSAVE_INTERVAL,
+    ):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Farm Game")
 
+        # 建立視窗後預先載入所有精靈圖，之後的每一幀都不需要讀取硬碟
+        preload_game_assets()
+
         # 遊戲物件
         self.background = Background()
         self.farmer = Farmer()
-        self.farm_grid = FarmGrid(self.background)
+        self.farm_grid = FarmGrid(self.background, rows=rows, cols=cols)
+
+        # 攝影機：農場超出視窗時跟著農夫捲動，只繪製畫面中可見的區塊
+        self.camera = Camera()
+        self.camera.set_world_size(
+            self.farm_grid.farm_grid_x * 2 + self.farm_grid.width,
+            WINDOW_HEIGHT
+            - self.background.farm_grid.get_height()
+            + self.farm_grid.height,
+        )
 
-        # 指定字體檔案的路徑
+        # 指定字體檔案的路徑（每種大小只載入一次）
         font_path = "./fonts/zpix.ttf"
         self.font = pygame.font.Font(font_path, 48)  # 金幣大字體
-        self.timer_font = pygame.font.Font(font_path, 48)
+        self.timer_font = self.font  # 計時器與金幣使用相同的字體與大小
         self.quantity_font = pygame.font.Font(font_path, 24)
 
-        temp_inventory = Inventory(0, slot_count=5, quantity_font=self.quantity_font)
-        inventory_width = temp_inventory.width
+        # 遊戲時鐘：所有計時相關的子系統都從這裡取得時間
+        self.game_clock = game_clock if game_clock is not None else GameClock()
+
+        # 農場狀態與規則（不依賴 pygame），Game 只負責把它畫出來
+        self.farm = FarmModel(rows=rows, cols=cols, start_time=self.game_clock.get_ticks())
+        self.farm.add_listener(self.on_farm_event)
+        # 泥土與作物的繪製清單（格子改變時才重建）
+        self.tile_batch = TileBatch(self.farm, self.farm_grid)
+
         left_inventory_x = 50
-        # right_inventory_x = WINDOW_WIDTH - inventory_width - 50  # 被註解掉
+        # right_inventory_x = WINDOW_WIDTH - self.seed_inventory.width - 50  # 被註解掉
 
         # 建立左側庫存 (seed_inventory)
         self.seed_inventory = Inventory(
-            left_inventory_x, slot_count=5, quantity_font=self.quantity_font
+            left_inventory_x,
+            slot_count=5,
+            quantity_font=self.quantity_font,
+            store=self.farm.seeds,
         )
 
         # [註解開始] 暫時關閉右側庫存
@@ -46,17 +89,14 @@ class Game:
         # )
         # [註解結束]
 
-        # 初始化泥土網格
-        self.dirt_grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
-
         # 初始化事件處理器
         self.event_handler = EventHandler(self)
 
-        # 初始化金幣
-        self.coin = Coin(initial_amount=100)
+        # 金幣由 FarmModel 管理
+        self.coin = self.farm.coin
 
-        # coin_animations 用於 +50 浮動動畫
-        self.coin_animations = []
+        # 特效池：收穫時的 +50 浮動文字等
+        self.effects = ParticlePool()
 
         # [註解開始] 原本每秒增加金幣的測試功能
         # self.coin_timer = pygame.time.get_ticks()
@@ -64,69 +104,123 @@ class Game:
         # [註解結束]
 
         # 初始化遊戲開始時間
-        self.start_time = pygame.time.get_ticks()
-
-        # 設置每秒增加小麥種子的計時器（若需要關閉也可註解）
-        self.seed_timer = pygame.time.get_ticks()
-        self.seed_interval = 1000
+        self.start_time = self.game_clock.get_ticks()
 
         self.clock = pygame.time.Clock()
 
+        # 預先畫好的除錯網格圖層（農場或畫面大小改變時重建）
+        self.grid_lines_layer = None
+        self.grid_lines_span = None
+
+        # 可選的髒矩形繪製模式：只重畫並更新有變化的區域
+        self.renderer = DirtyRectRenderer(self) if dirty_rects else None
+
+        # 每幀各階段耗時的分析器（指定 profile_path 時開啟，並把每幀耗時寫入該檔案）
+        if profile_path is not None:
+            self.profiler = FrameProfiler(self.quantity_font, csv_path=profile_path)
+        else:
+            self.profiler = NullProfiler()
+
+        # 存檔：指定 save_path 時先讀取既有的存檔，之後在背景執行緒定期自動存檔
+        self.autosaver = None
+        if save_path is not None:
+            if os.path.exists(save_path):
+                self.load_game(save_path)
+            self.autosaver = AutoSaver(save_path, autosave_interval)
+
     def run(self):
+        profiler = self.profiler
         while True:
+            profiler.begin_frame()
+
             # 處理事件
             self.event_handler.handle_events()
+            profiler.mark("events")
 
             # 更新遊戲狀態
             keys = pygame.key.get_pressed()
             self.farmer.update(keys)
+            profiler.mark("farmer")
 
             # [註解開始] 每秒自動增加金幣
             # self.update_coins()
             # [註解結束]
 
-            # 仍保留：每秒增加一顆小麥種子（測試用）
-            self.update_seeds()
+            # 每秒增加一顆小麥種子，並讓到期的作物成長（不同泥土有不同速度）
+            self.update_farm()
+            profiler.mark("farm")
+
+            # 到時間就擷取快照交給背景執行緒存檔
+            self.update_autosave()
+            profiler.mark("autosave")
+
+            # (1) 更新所有特效
+            self.update_effects()
+            profiler.mark("animations")
+
+            # (2) 繪製畫面
+            self.update_camera()
+            profiler.mark("camera")
+            if self.renderer is not None:
+                self.renderer.render()
+            else:
+                self.draw_frame()
+                pygame.display.flip()
+            profiler.mark("flip")
+            self.clock.tick(FPS)
+            profiler.mark("tick")
+            profiler.end_frame()
 
-            # 每幀都檢查是否要讓作物成長（不同泥土有不同速度）
-            self.update_plants_growth()
+    def update_effects(self):
+        self.effects.update(self.game_clock.get_ticks())
 
-            # (1) 更新所有 coin_animations
-            for animation in self.coin_animations[:]:
-                animation.update()
-                if animation.alpha <= 0:
-                    self.coin_animations.remove(animation)
+    def update_camera(self):
+        # 攝影機跟著農夫（農場比視窗小時固定不動）
+        self.camera.follow(
+            self.farmer.x + self.farmer.image_width // 2,
+            self.farmer.y + self.farmer.image_height // 2,
+        )
 
-            # (2) 繪製順序開始
-            self.background.draw(self.screen)
-            self.seed_inventory.draw(self.screen)
+    def draw_frame(self):
+        """
+        依序繪製背景、庫存、泥土與作物、農夫、HUD、除錯網格與特效。
+        農場部分只繪製攝影機可見的區塊。
+        """
+        offset = self.camera.offset
+        profiler = self.profiler
 
-            # [註解開始] 暫時關閉右側庫存
-            # self.tool_inventory.draw(self.screen)
-            # [註解結束]
+        self.background.draw(self.screen, self.farm_grid, self.camera)
+        profiler.mark("draw_bg")
+        self.seed_inventory.draw(self.screen)
+        profiler.mark("draw_inventory")
 
-            for row in self.dirt_grid:
-                for dirt in row:
-                    if dirt:
-                        dirt.draw(self.screen)
+        # [註解開始] 暫時關閉右側庫存
+        # self.tool_inventory.draw(self.screen)
+        # [註解結束]
 
-            self.farmer.draw(self.screen)
+        visible = self.farm_grid.visible_range(self.camera)
+        if visible is not None:
+            self.tile_batch.draw(self.screen, visible, offset)
+        profiler.mark("draw_farm")
 
-            # 先繪製金幣文字
-            self.draw_coins()
+        self.farmer.draw(self.screen, offset)
+        profiler.mark("draw_farmer")
 
-            # 繪製計時器
-            self.draw_timer()
+        # 先繪製金幣文字
+        self.draw_coins()
 
-            # 畫出網格(除錯用)
-            self.draw_grid_lines()
+        # 繪製計時器
+        self.draw_timer()
+        profiler.mark("draw_hud")
 
-            # (3) 確保最後再把動畫畫在最上層
-            for animation in self.coin_animations:
-                animation.draw(self.screen)
+        # 畫出網格(除錯用)與各階段耗時
+        self.draw_grid_lines()
+        profiler.draw_overlay(self.screen)
+        profiler.mark("draw_debug")
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        # 確保最後再把特效畫在最上層
+        self.effects.draw(self.screen)
+        profiler.mark("draw_anims")
 
     # [註解開始] 原本「每秒增加金幣」的測試功能
     # def update_coins(self):
@@ -137,82 +231,199 @@ class Game:
     #         # 這裡本來也會產生 +50 動畫
     # [註解結束]
 
-    def update_seeds(self):
-        """每 1 秒增加一顆小麥種子。"""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.seed_timer >= self.seed_interval:
-            self.seed_timer = current_time
-            wheat_seed = WheatSeed()
-            self.seed_inventory.add_item(wheat_seed, quantity=1)
+    def update_farm(self):
+        """
+        讓 FarmModel 處理所有到期的事件：每 1 秒增加一顆小麥種子，以及符合
+        『基準成長時間 (2秒) * (1 - growth_speed_bonus)』的植物長一階。
+        種子生成與作物成長共用同一個排程器，因此是同一個步驟。
+        """
+        self.farm.update(self.game_clock.get_ticks())
+
+    def on_farm_event(self, event, row, col):
+        """FarmModel 狀態改變時的畫面回饋（泥土與作物的圖片每幀直接依 FarmModel.tiles 繪製）。"""
+        if event == UPGRADED:
+            log.info("泥土升級到 %s 等級！", DIRT_LEVELS[self.farm.tiles.level(row, col)]["name"])
+        elif event == HARVESTED:
+            self.show_harvest_animation()
+
+    # === 存檔 ===
+    def snapshot(self):
+        """擷取目前遊戲狀態的不可變快照（泥土、作物與成長計時、庫存、金幣、經過時間）。"""
+        return take_snapshot(self.farm, self.game_clock.get_ticks(), self.start_time)
 
-    def update_plants_growth(self):
+    def save_game(self, path):
+        """立即寫入存檔（會等待寫入完成）。"""
+        write_save(path, self.snapshot())
+
+    def load_game(self, path):
         """
-        每幀都檢查所有已種下的植物，如果符合
-        『基準成長時間 (2秒) * (1 - growth_speed_bonus)』的條件，
-        就讓植物長一階 (stage + 1)。
+        讀取存檔：只需要還原 FarmModel 的陣列，不必為每一格建立任何繪圖物件。
         """
-        current_time = pygame.time.get_ticks()
-        base_grow_time = 2000  # 2 秒 = 2000 毫秒
-
-        for row in self.dirt_grid:
-            for dirt in row:
-                if dirt and dirt.plant and dirt.plant.stage < 5:
-                    # 計算此泥土的實際成長間隔
-                    grow_interval = base_grow_time * (1 - dirt.growth_speed_bonus)
-                    # 判斷是否達到成長間隔
-                    if current_time - dirt.last_growth_time >= grow_interval:
-                        dirt.plant.grow()
-                        dirt.last_growth_time = current_time
+        self.start_time = restore_snapshot(self.farm, read_save(path), self.game_clock.get_ticks())
+        self.tile_batch.invalidate()
+        self.effects.clear()
+        if self.renderer is not None:
+            self.renderer.mark_all()
+        log.info("已讀取存檔 %s。", path)
+
+    def update_autosave(self):
+        if self.autosaver is None:
+            return
+        now = self.game_clock.get_ticks()
+        if self.autosaver.due(now):
+            self.autosaver.submit(self.snapshot(), now)
+
+    def close(self):
+        """關閉遊戲前呼叫：輸出每幀耗時，並寫入最後一次存檔。"""
+        self.profiler.close()
+        if self.autosaver is not None:
+            self.autosaver.close(self.snapshot())
+            log.info("遊戲已儲存至 %s。", self.autosaver.path)
+
+    def show_harvest_animation(self):
+        """在金幣數字後方生成 +50 浮動動畫。"""
+        coin_text = f"金幣：{self.coin.get_amount()}"
+        coin_text_width, _ = self.font.size(coin_text)
+
+        # x 座標略靠右（在金幣數字後面 10px）
+        anim_x = 10 + coin_text_width + 10
+        anim_y = 10  # 與金幣顯示同高度
+
+        self.show_floating_text(
+            x=anim_x,
+            y=anim_y,
+            text="+50",
+            color="#FF3E3E",
+            duration=2000,  # 可改 2000 或更久，以免太快消失
+        )
 
     def draw_coins(self):
         coin_text = f"金幣：{self.coin.get_amount()}"
-        text_surface = self.font.render(coin_text, True, "#FADE51", "#006666")
+        # 金幣數字只有變動時才重新 render
+        text_surface = text_cache.render(self.font, coin_text, True, "#FADE51", "#006666")
         self.screen.blit(text_surface, (10, 10))
 
+    def coins_rect(self):
+        """金幣文字在畫面上的範圍。"""
+        width, height = self.font.size(f"金幣：{self.coin.get_amount()}")
+        return pygame.Rect(10, 10, width, height)
+
+    def timer_text(self):
+        elapsed_time_ms = self.game_clock.get_ticks() - self.start_time
+        elapsed_seconds = int(elapsed_time_ms // 1000)  # 轉成整數秒
+        minutes = elapsed_seconds // 60
+        seconds = elapsed_seconds % 60
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def timer_rect(self):
+        """計時器文字在畫面上的範圍（置中於視窗上方）。"""
+        width, height = self.timer_font.size(self.timer_text())
+        return pygame.Rect((WINDOW_WIDTH - width) // 2, 10, width, height)
+
     def draw_timer(self):
         # elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
         # minutes = elapsed_time // 60
         # seconds = elapsed_time % 60
         # time_text = f"{minutes:02d}:{seconds:02d}"
         # text_surface = self.timer_font.render(time_text, True, "#FFFFFF", "#E1D9B5")
-        elapsed_time_ms = pygame.time.get_ticks() - self.start_time
-        elapsed_seconds = elapsed_time_ms // 1000  # 轉成整數秒
-        minutes = elapsed_seconds // 60
-        seconds = elapsed_seconds % 60
-        time_text = f"{minutes:02d}:{seconds:02d}"
-        text_surface = self.timer_font.render(time_text, True, "#FFFFFF", "#E1D9B5")
+        time_text = self.timer_text()
+        text_surface = text_cache.render(self.timer_font, time_text, True, "#FFFFFF", "#E1D9B5")
         text_rect = text_surface.get_rect()
         text_x = (WINDOW_WIDTH - text_rect.width) // 2
         text_y = 10
         self.screen.blit(text_surface, (text_x, text_y))
 
+    def tile_screen_rect(self, row, col):
+        """指定格子的泥土圖片（含作物）在畫面上的範圍。"""
+        width, height = DIRT_IMAGE_SIZE
+        x = self.background.farm_grid_x + col * self.farm_grid.block_width - self.camera.x
+        y = self.background.farm_grid_y + row * self.farm_grid.block_height - self.camera.y
+        x += (self.farm_grid.block_width - width) // 2
+        y += (self.farm_grid.block_height - height) // 2
+        return pygame.Rect(x, y, width, height)
+
     def draw_grid_lines(self):
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS):
-                x = self.background.farm_grid_x + col * self.farm_grid.block_width
-                y = self.background.farm_grid_y + row * self.farm_grid.block_height
+        # 紅色除錯網格預先畫在一張 colorkey 圖層上，每幀只貼一次；
+        # 圖層涵蓋畫面最多可能看到的格數，每幀只貼出可見列數、行數的部分，位置依攝影機計算
+        visible = self.farm_grid.visible_range(self.camera)
+        if visible is None:
+            return
+        block_width = self.farm_grid.block_width
+        block_height = self.farm_grid.block_height
+        span = (
+            min(self.farm_grid.rows, self.camera.height // block_height + 2),
+            min(self.farm_grid.cols, self.camera.width // block_width + 2),
+        )
+        if span != self.grid_lines_span:
+            self.grid_lines_layer = self.bake_grid_lines(*span)
+            self.grid_lines_span = span
+        first_row, last_row, first_col, last_col = visible
+        left = self.background.farm_grid_x + first_col * block_width - self.camera.x
+        top = self.background.farm_grid_y + first_row * block_height - self.camera.y
+        area = (0, 0, (last_col - first_col + 1) * block_width, (last_row - first_row + 1) * block_height)
+        self.screen.blit(self.grid_lines_layer, (left, top), area)
+
+    def bake_grid_lines(self, rows, cols):
+        """把 rows x cols 個格子的紅色外框畫到一張透明（colorkey）圖層。"""
+        block_width = self.farm_grid.block_width
+        block_height = self.farm_grid.block_height
+        layer = pygame.Surface((cols * block_width, rows * block_height)).convert()
+        layer.fill((0, 0, 0))
+        layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        for row in range(rows):
+            for col in range(cols):
                 pygame.draw.rect(
-                    self.screen,
+                    layer,
                     (255, 0, 0),
-                    (x, y, self.farm_grid.block_width, self.farm_grid.block_height),
+                    (col * block_width, row * block_height, block_width, block_height),
                     1,
                 )
+        return layer
 
-    # === 建立 coin 動畫物件的便利方法 ===
-    def create_coin_animation(self, x, y, text="+50", color="#FF3E3E", duration=2000):
+    # === 浮動文字特效的便利方法 ===
+    def show_floating_text(self, x, y, text="+50", color="#FF3E3E", duration=2000):
         """
-        回傳一個 CoinAnimation 物件，讓呼叫方直接加入 self.coin_animations。
+        在 (x, y) 產生往上飄並淡出的文字（文字圖片只 render 一次，之後重複使用）。
         """
-        return CoinAnimation(
-            x=x,
-            y=y,
-            text=text,
-            font=self.font,  # 若想小字體可換 self.quantity_font
-            color=color,
-            duration=duration,
-        )
+        sprite = self.effects.text_sprite(self.font, text, color)  # 若想小字體可換 self.quantity_font
+        self.effects.emit(sprite, x, y, self.game_clock.get_ticks(), duration)
 
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Farm Game")
+    parser.add_argument(
+        "--dirty_rects",
+        action="store_true",
+        help="只重畫並更新有變化的畫面區域，降低每幀的 CPU 與填充成本。",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="量測每幀各階段的耗時，在畫面上顯示百分位數（F3 切換），並寫入 log/profile_*.csv。",
+    )
+    parser.add_argument(
+        "--save",
+        default=None,
+        metavar="PATH",
+        help="從 PATH 讀取存檔（存在時），並在背景定期自動存檔到 PATH（F5 立即存檔）。",
+    )
+    parser.add_argument(
+        "--autosave_interval",
+        type=float,
+        default=DEFAULT_AUTOSAVE_INTERVAL / 1000,
+        help=f"自動存檔的間隔秒數（預設為 {DEFAULT_AUTOSAVE_INTERVAL // 1000}）。",
+    )
+    parser.add_argument("--log_level", choices=LEVELS, default="INFO", help="輸出訊息的最低等級（預設為 INFO）。")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    profile_path = None
+    if args.profile:
+        profile_path = f"log/profile_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    game = Game(
+        dirty_rects=args.dirty_rects,
+        profile_path=profile_path,
+        save_path=args.save,
+        autosave_interval=args.autosave_interval * 1000,
+    )
     game.run()
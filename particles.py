@@ -0,0 +1,139 @@
+# particles.py
+
+from array import array
+
+import pygame
+
+from text_cache import text_cache
+
+# 預設最多同時存在的特效數量（所有格子一開始就配置好）
+DEFAULT_CAPACITY = 512
+# 淡出時預先 render 好的透明度階段數
+ALPHA_STEPS = 32
+# 浮動文字往上飄的速度（像素 / 毫秒），與原本 60 FPS 下每幀 1 像素相同
+RISE_SPEED = 60 / 1000
+
+
+class ParticlePool:
+    """
+    固定容量的特效池（收穫時的 +50 浮動文字，以及之後的其他特效）：
+    - 每個特效的起點、速度、開始時間、持續時間與圖片編號放在預先配置好的平行 array 中，
+      產生特效時不建立任何物件；
+    - 位置與透明度依經過的遊戲時間計算，與 FPS 無關；
+    - 圖片在 add_sprite() / text_sprite() 時就準備好每一個透明度階段，
+      每幀只需選出對應的階段，所有特效以一次 Surface.blits 繪製；
+    - 到期的特效由最後一個特效補上它的位置（swap-remove），不必搬移其他特效。
+    池子滿了時新的特效會被略過，dropped 記錄被略過的次數。
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.count = 0  # 目前存在的特效數量，有效的格子為 0 ~ count - 1
+        self.x = array("d", bytes(8 * capacity))
+        self.y = array("d", bytes(8 * capacity))
+        self.vx = array("d", bytes(8 * capacity))  # 像素 / 毫秒
+        self.vy = array("d", bytes(8 * capacity))
+        self.start = array("d", bytes(8 * capacity))  # 開始時間（毫秒）
+        self.duration = array("d", bytes(8 * capacity))  # 持續時間（毫秒）
+        self.sprite = array("i", bytes(4 * capacity))  # 圖片編號
+
+        self.sprites = []  # 圖片編號 -> 各透明度階段的 Surface（索引越大越不透明）
+        self.text_sprites = {}  # (字體, 文字, 顏色) -> 圖片編號
+        self.dropped = 0
+
+        # update() 算好的繪製清單與所有特效的外框（沒有特效時為 None）
+        self.draw_list = []
+        self.bounds = None
+
+    def __len__(self):
+        return self.count
+
+    # === 圖片 ===
+    def add_sprite(self, surface):
+        """
+        準備一張圖片的所有透明度階段，回傳圖片編號。
+        透明度直接乘進每個像素的 alpha（而不是 set_alpha），繪製時走一般的 per-pixel alpha blit，
+        比每次混合整張圖片的透明度快得多。
+        """
+        if not surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        frames = []
+        for step in range(ALPHA_STEPS):
+            frame = surface.copy()
+            alpha = round(255 * (step + 1) / ALPHA_STEPS)
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            frames.append(frame)
+        self.sprites.append(frames)
+        return len(self.sprites) - 1
+
+    def text_sprite(self, font, text, color):
+        """文字圖片的編號，同樣的字體、文字與顏色只 render 一次。"""
+        key = (font, text, color)
+        sprite = self.text_sprites.get(key)
+        if sprite is None:
+            sprite = self.text_sprites[key] = self.add_sprite(text_cache.render(font, text, True, color))
+        return sprite
+
+    # === 特效 ===
+    def emit(self, sprite, x, y, now, duration=1000, velocity=(0, -RISE_SPEED)):
+        """在 (x, y) 產生一個特效，回傳是否成功（池子已滿時為 False）。"""
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i], self.vy[i] = velocity
+        self.start[i] = now
+        self.duration[i] = duration
+        self.sprite[i] = sprite
+        self.count += 1
+        return True
+
+    def remove(self, i):
+        # 以最後一個特效覆蓋第 i 個
+        last = self.count - 1
+        if i != last:
+            for values in (self.x, self.y, self.vx, self.vy, self.start, self.duration, self.sprite):
+                values[i] = values[last]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
+        self.draw_list = []
+        self.bounds = None
+
+    def update(self, now):
+        """移除到期的特效，並算出這一幀每個特效的圖片與位置。"""
+        draw_list = []
+        left = top = right = bottom = None
+        i = 0
+        while i < self.count:
+            elapsed = max(0.0, now - self.start[i])
+            duration = self.duration[i]
+            if elapsed >= duration:
+                self.remove(i)
+                continue
+            # 剩下的時間比例決定透明度階段
+            step = min(int((1 - elapsed / duration) * ALPHA_STEPS), ALPHA_STEPS - 1)
+            image = self.sprites[self.sprite[i]][step]
+            x = int(self.x[i] + self.vx[i] * elapsed)
+            y = int(self.y[i] + self.vy[i] * elapsed)
+            draw_list.append((image, (x, y)))
+
+            width, height = image.get_size()
+            if left is None:
+                left, top, right, bottom = x, y, x + width, y + height
+            else:
+                left = min(left, x)
+                top = min(top, y)
+                right = max(right, x + width)
+                bottom = max(bottom, y + height)
+            i += 1
+
+        self.draw_list = draw_list
+        self.bounds = None if left is None else (left, top, right - left, bottom - top)
+
+    def draw(self, screen):
+        if self.draw_list:
+            screen.blits(self.draw_list, doreturn=False)
@@ -0,0 +1,338 @@
+# planner.py
+
+import argparse
+import heapq
+import time
+
+from settings import (
+    GRID_ROWS,
+    GRID_COLS,
+    DIRT_LEVELS,
+    INITIAL_COINS,
+    PLACE_DIRT_COST,
+    HARVEST_REWARD,
+    BASE_GROW_TIME,
+    SEED_INTERVAL,
+    PLANT_START_STAGE,
+    MAX_PLANT_STAGE,
+    EPISODE_TIME,
+)
+from policy import Policy, place, upgrade, plant, harvest, wait
+from game_log import quiet
+
+DEFAULT_BEAM_WIDTH = 200
+
+# 每個泥土等級的成長間隔（毫秒）與升級費用
+GROW_INTERVALS = [BASE_GROW_TIME * (1 - level["growth_speed_bonus"]) for level in DIRT_LEVELS]
+UPGRADE_COSTS = [level["upgrade_cost"] for level in DIRT_LEVELS]
+MAX_LEVEL = len(DIRT_LEVELS) - 1
+
+
+def grow_due(level, last_growth, now):
+    # 與 FarmModel.schedule_growth 相同；到期時間已過時在目前時間立即成長
+    return max(last_growth + GROW_INTERVALS[level], now)
+
+
+class FarmPlanner:
+    """
+    在完全已知的經濟規則下搜尋最終金幣盡可能多的動作排程。
+
+    格子之間沒有位置上的差異，所以狀態只記錄「每種格子狀態各有幾格」：
+    每格以 (等級, 作物階段, 最後成長時間, 下一次成長時間) 表示（沒有作物時後兩項為 0），排序後的 tuple
+    就是標準化的網格，交換任意兩格得到的都是同一個狀態（對稱的格子只會被展開一次）。
+
+    以事件時間（種子生成、作物成長）為步驟做 beam search：
+    - 置換表 (transposition table) 以 (種子數, 標準化網格) 為 key，只保留金幣最多的一條路徑；
+    - 每一步依樂觀估計的最終金幣只保留 beam_width 個狀態。
+    收穫與種植是支配性的動作（立刻收穫、優先種在等級高的空地），每次決策只分支
+    「升級哪一種格子」與「放置幾塊新泥土」。
+
+    beam search 只保證找到一個可行的排程：它的最終金幣是最佳解的下界（beam_width 越大通常越接近最佳解），
+    可作為評估 AutoGame 策略的參考基準。
+    """
+
+    def __init__(self, rows=GRID_ROWS, cols=GRID_COLS, horizon=EPISODE_TIME * 1000, beam_width=DEFAULT_BEAM_WIDTH):
+        self.tiles = rows * cols
+        self.horizon = horizon
+        self.beam_width = beam_width
+        self.expanded = 0
+        self.table_hits = 0
+
+    # === 狀態轉移 ===
+    def apply_events(self, now, seeds, grid):
+        """處理 now 時間點到期的種子生成與作物成長，回傳 (seeds, grid, 是否有變化)。"""
+        changed = False
+        if now % SEED_INTERVAL == 0:
+            seeds += 1
+            changed = True
+        tiles = []
+        for level, stage, last, due in grid:
+            if stage and due == now:
+                stage += 1
+                last = now
+                due = grow_due(level, last, now) if stage < MAX_PLANT_STAGE else 0
+                changed = True
+            tiles.append((level, stage, last, due))
+        return seeds, tuple(sorted(tiles)), changed
+
+    def decisions(self, now, coins, seeds, grid):
+        """
+        列出 now 時間點所有值得考慮的決策，產生 (金幣, 種子, 網格, 動作)。
+        動作以標準化的形式記錄，重播時再對應到實際的格子。
+        """
+        # 收穫所有成熟的作物
+        tiles = []
+        actions = []
+        for tile in grid:
+            if tile[1] == MAX_PLANT_STAGE:
+                coins += HARVEST_REWARD
+                actions.append(("harvest", tile))
+                tiles.append((tile[0], 0, 0, 0))
+            else:
+                tiles.append(tile)
+
+        # 分支：不升級，或升級某一種格子。等級與作物階段相同的格子升級後的效果相同
+        # （剩下的每一次成長都縮短同樣的時間），每組只考慮一格
+        upgrade_options = {}
+        for tile in tiles:
+            if tile[0] < MAX_LEVEL and UPGRADE_COSTS[tile[0]] <= coins:
+                upgrade_options.setdefault(tile[:2], tile)
+        idle_count = sum(1 for tile in tiles if not tile[1])
+
+        for target in [None, *upgrade_options.values()]:
+            upgraded = list(tiles)
+            budget = coins
+            steps = list(actions)
+            if target is not None:
+                level, stage, last, due = target
+                budget -= UPGRADE_COSTS[level]
+                if stage:
+                    due = grow_due(level + 1, last, now)
+                upgraded[upgraded.index(target)] = (level + 1, stage, last, due)
+                steps.append(("upgrade", target))
+
+            # 分支：放置 0 ~ 能負擔的泥土數量；沒有種子可種的泥土晚點再放也一樣，不必考慮
+            empty = self.tiles - len(upgraded)
+            for count in range(min(empty, budget // PLACE_DIRT_COST, max(0, seeds - idle_count)) + 1):
+                new_tiles = upgraded + [(0, 0, 0, 0)] * count
+                new_steps = steps + [("place", count)] if count else list(steps)
+                yield self.plant_idle(now, budget - count * PLACE_DIRT_COST, seeds, new_tiles, new_steps)
+
+    def plant_idle(self, now, coins, seeds, tiles, steps):
+        # 有種子就種，優先種在等級高的空地
+        idle = sorted((i for i, tile in enumerate(tiles) if not tile[1]), key=lambda i: -tiles[i][0])
+        for i in idle[:seeds]:
+            level = tiles[i][0]
+            tiles[i] = (level, PLANT_START_STAGE, now, grow_due(level, now, now))
+            steps.append(("plant", level))
+        seeds -= min(seeds, len(idle))
+        return coins, seeds, tuple(sorted(tiles)), steps
+
+    def estimate(self, now, coins, seeds, grid):
+        """樂觀估計的最終金幣：成長中的作物都能收穫，每塊泥土持續種植到時間結束。"""
+        remaining_seeds = seeds + max(0, (self.horizon - now) // SEED_INTERVAL)
+        value = coins
+        for level, stage, last, due in grid:
+            cycle = GROW_INTERVALS[level] * (MAX_PLANT_STAGE - PLANT_START_STAGE)
+            ready = now
+            if stage:
+                ready = due + GROW_INTERVALS[level] * (MAX_PLANT_STAGE - 1 - stage)
+                if ready < self.horizon:
+                    value += HARVEST_REWARD
+            harvests = int(max(0, self.horizon - ready) // cycle)
+            harvests = min(harvests, remaining_seeds)
+            remaining_seeds -= harvests
+            value += harvests * HARVEST_REWARD
+        return value
+
+    # === 搜尋 ===
+    def search(self):
+        """
+        回傳 (最終金幣, 排程)；排程為 [(決策時間毫秒, 標準化動作清單)]。
+        """
+        # 置換表：(種子數, 網格) -> (金幣, 排程)；排程以 (上一段, (時間, 動作)) 串起來避免複製
+        frontier = {}
+        self.expand(frontier, 0, INITIAL_COINS, 0, (), None)
+        frontier = self.prune(frontier, 0)
+
+        now = 0
+        while True:
+            now = self.next_event_time(frontier, now)
+            if now >= self.horizon:
+                break
+            table = {}
+            for (seeds, grid), (coins, plan) in frontier.items():
+                # HeadlessGame 在同一時間點先處理事件、再決策
+                seeds, grid, changed = self.apply_events(now, seeds, grid)
+                if changed:
+                    self.expand(table, now, coins, seeds, grid, plan)
+                else:
+                    self.store(table, (seeds, grid), coins, plan)
+            frontier = self.prune(table, now)
+
+        coins, plan = max(frontier.values(), key=lambda entry: entry[0])
+        schedule = []
+        while plan is not None:
+            plan, step = plan
+            schedule.append(step)
+        schedule.reverse()
+        return coins, schedule
+
+    def next_event_time(self, frontier, now):
+        """所有狀態中在 now 之後最早發生的事件（下一次種子生成或任一作物成長）。"""
+        times = [(now // SEED_INTERVAL + 1) * SEED_INTERVAL]
+        for _, grid in frontier:
+            times.extend(due for _, stage, _, due in grid if due)
+        return min(times)
+
+    def expand(self, table, now, coins, seeds, grid, plan):
+        for new_coins, new_seeds, new_grid, steps in self.decisions(now, coins, seeds, grid):
+            self.expanded += 1
+            new_plan = (plan, (now, steps)) if steps else plan
+            self.store(table, (new_seeds, new_grid), new_coins, new_plan)
+
+    def store(self, table, key, coins, plan):
+        entry = table.get(key)
+        if entry is not None:
+            self.table_hits += 1
+            if entry[0] >= coins:
+                return
+        table[key] = (coins, plan)
+
+    def prune(self, table, now):
+        if len(table) <= self.beam_width:
+            return table
+        ranked = heapq.nlargest(
+            self.beam_width,
+            table.items(),
+            key=lambda item: self.estimate(now, item[1][0], item[0][0], item[0][1]),
+        )
+        return dict(ranked)
+
+
+class PlannedPolicy(Policy):
+    """
+    依 FarmPlanner 的排程在 HeadlessGame 中重播：在每個決策時間把標準化的動作
+    對應到實際的格子，並等待到下一個決策時間。
+    """
+
+    name = "planned"
+
+    def __init__(self, schedule, horizon=EPISODE_TIME * 1000):
+        self.schedule = schedule
+        self.horizon = horizon  # 遊戲時間（毫秒），最後一次決策後一直等到結束
+        self.index = 0
+
+    def decide(self, view, rng):
+        now = round(view.time * 1000)
+        actions = []
+        while self.index < len(self.schedule) and self.schedule[self.index][0] <= now:
+            actions.extend(self.concrete_actions(view, self.schedule[self.index][1]))
+            self.index += 1
+        if self.index < len(self.schedule):
+            actions.append(wait(self.schedule[self.index][0] / 1000 - view.time))
+        else:
+            actions.append(wait(self.horizon / 1000))
+        return actions
+
+    def concrete_actions(self, view, steps):
+        actions = []
+        harvested = set()  # 這次決策已經收穫、升級過的格子
+        upgraded = set()
+        placed = []
+        for kind, value in steps:
+            if kind == "harvest":
+                r, c = self.find_tile(view, harvested, value[0] + 1, MAX_PLANT_STAGE, value[2])
+                actions.append(harvest(r, c))
+            elif kind == "upgrade":
+                level, stage, last, _ = value
+                r, c = self.find_tile(view, upgraded, level + 1, stage, last, harvested)
+                actions.append(upgrade(r, c))
+            elif kind == "place":
+                for r, c in view.empty_tiles()[:value]:
+                    actions.append(place(r, c))
+                    placed.append((r, c))
+            elif kind == "plant":
+                r, c = self.find_idle(view, value, actions, placed)
+                slot = view.available_slots()[0]
+                actions.append(plant(r, c, slot))
+        return actions
+
+    def find_tile(self, view, used, soil, stage, last, harvested=()):
+        # 找出等級與作物階段相同、最後成長時間最接近的格子（時鐘以浮點數計算，可能有些微誤差）
+        best = None
+        for r in range(view.rows):
+            for c in range(view.cols):
+                if (r, c) in used:
+                    continue
+                current_stage = 0 if (r, c) in harvested else view.plant_stage(r, c)
+                if view.soil(r, c) != soil or current_stage != stage:
+                    continue
+                distance = abs(view.last_growth_time(r, c) - last)
+                if best is None or distance < best[0]:
+                    best = (distance, r, c)
+        used.add((best[1], best[2]))
+        return best[1], best[2]
+
+    def find_idle(self, view, level, actions, placed):
+        # 種植：等級相同、沒有作物（或這次剛收穫、剛放置）的格子
+        harvested = {(a[1], a[2]) for a in actions if a[0] == "harvest"}
+        upgraded = [(a[1], a[2]) for a in actions if a[0] == "upgrade"]
+        planted = {(a[1], a[2]) for a in actions if a[0] == "plant"}
+        for r in range(view.rows):
+            for c in range(view.cols):
+                if (r, c) in planted:
+                    continue
+                soil = view.soil(r, c) + upgraded.count((r, c))
+                if (r, c) in placed:
+                    soil = 1
+                if soil != level + 1:
+                    continue
+                if view.plant_stage(r, c) and (r, c) not in harvested:
+                    continue
+                return r, c
+        raise ValueError(f"No idle tile of level {level} to plant")
+
+
+def replay(schedule, rows=GRID_ROWS, cols=GRID_COLS, horizon=EPISODE_TIME * 1000):
+    """在 HeadlessGame（事件跳躍模式）中重播 horizon 毫秒的排程，回傳最終金幣。"""
+    from farm_model import FarmModel
+    from headless_game import HeadlessGame
+
+    game = HeadlessGame(
+        total_time=horizon / 1000,
+        farm=FarmModel(rows=rows, cols=cols),
+        log_format="none",
+        policy=PlannedPolicy(schedule, horizon),
+    )
+    with quiet():
+        return game.run(fast_forward=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="以 beam search 搜尋最終金幣盡可能多的動作排程（策略評估的參考基準，為最佳解的下界）。")
+    parser.add_argument("-w", "--beam_width", type=int, default=DEFAULT_BEAM_WIDTH, help=f"每一步保留的狀態數（預設為 {DEFAULT_BEAM_WIDTH}）。")
+    parser.add_argument("-t", "--time", type=int, default=EPISODE_TIME, help=f"遊戲時間（秒，預設為 {EPISODE_TIME}）。")
+    parser.add_argument("--rows", type=int, default=GRID_ROWS, help=f"農場列數（預設為 {GRID_ROWS}）。")
+    parser.add_argument("--cols", type=int, default=GRID_COLS, help=f"農場行數（預設為 {GRID_COLS}）。")
+    parser.add_argument("--verify", action="store_true", help="在 HeadlessGame 中重播排程，確認最終金幣相同。")
+    parser.add_argument("--show", action="store_true", help="印出完整的動作排程。")
+    args = parser.parse_args()
+
+    planner = FarmPlanner(args.rows, args.cols, horizon=args.time * 1000, beam_width=args.beam_width)
+    start = time.perf_counter()
+    coins, schedule = planner.search()
+    elapsed = time.perf_counter() - start
+    print(
+        f"搜尋到的排程最終金幣：{coins}（{len(schedule)} 次決策，展開 {planner.expanded} 個狀態，"
+        f"置換表命中 {planner.table_hits} 次，耗時 {elapsed:.2f} 秒）"
+    )
+    if args.show:
+        for decide_at, steps in schedule:
+            print(f"{decide_at / 1000:7.3f}s  {steps}")
+    if args.verify:
+        print(f"HeadlessGame 重播的最終金幣：{replay(schedule, args.rows, args.cols, args.time * 1000)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# policy.py
+
+import importlib
+
+from farm_model import EMPTY
+from settings import DIRT_LEVELS, PLACE_DIRT_COST, HARVEST_REWARD
+
+# 動作種類
+PLACE = "place"  # (PLACE, row, col)：在空地放置泥土
+UPGRADE = "upgrade"  # (UPGRADE, row, col)：升級泥土
+PLANT = "plant"  # (PLANT, row, col, slot)：用庫存第 slot 格的種子種植
+HARVEST = "harvest"  # (HARVEST, row, col)：收穫成熟的作物
+WAIT = "wait"  # (WAIT, seconds)：幾秒後再做下一次決策
+
+# 沒有回傳 WAIT 時，下一次決策的間隔（秒）
+DEFAULT_WAIT = 1
+
+
+def place(row, col):
+    return (PLACE, row, col)
+
+
+def upgrade(row, col):
+    return (UPGRADE, row, col)
+
+
+def plant(row, col, slot):
+    return (PLANT, row, col, slot)
+
+
+def harvest(row, col):
+    return (HARVEST, row, col)
+
+
+def wait(seconds):
+    return (WAIT, seconds)
+
+
+class FarmView:
+    """
+    提供給策略的唯讀農場資訊：只能查詢，不能修改 FarmModel。
+    土壤等級 0 表示沒有泥土，1~4 對應 DIRT_LEVELS；作物階段 0 表示沒有作物。
+    """
+
+    __slots__ = ("_farm", "time")
+
+    def __init__(self, farm, time):
+        self._farm = farm
+        self.time = time  # 目前的遊戲時間（秒）
+
+    @property
+    def rows(self):
+        return self._farm.rows
+
+    @property
+    def cols(self):
+        return self._farm.cols
+
+    @property
+    def coins(self):
+        return self._farm.coin.get_amount()
+
+    def soil(self, row, col):
+        return self._farm.tiles.level(row, col) + 1
+
+    def plant_stage(self, row, col):
+        return self._farm.tiles.stage(row, col)
+
+    def last_growth_time(self, row, col):
+        """作物最後一次成長（或種下）的時間（毫秒），沒有泥土時為 None。"""
+        tiles = self._farm.tiles
+        return tiles.last_growth_time(row, col) if tiles.has_dirt(row, col) else None
+
+    def upgrade_cost(self, row, col):
+        """升級該格泥土的費用；沒有泥土時為放置費用，已達最高等級時為 None。"""
+        tiles = self._farm.tiles
+        if not tiles.has_dirt(row, col):
+            return PLACE_DIRT_COST
+        level = tiles.level(row, col)
+        if level >= len(DIRT_LEVELS) - 1:
+            return None
+        return DIRT_LEVELS[level]["upgrade_cost"]
+
+    def mature_tiles(self):
+        """所有可收穫作物的 (row, col)，依列、行排序。"""
+        return self._farm.mature_tiles()
+
+    def empty_tiles(self):
+        """還沒有泥土的格子。"""
+        cols = self._farm.cols
+        return [divmod(i, cols) for i, level in enumerate(self._farm.tiles.levels) if level == EMPTY]
+
+    def idle_tiles(self):
+        """有泥土但沒有作物的格子。"""
+        tiles = self._farm.tiles
+        cols = self._farm.cols
+        return [
+            divmod(i, cols)
+            for i, level in enumerate(tiles.levels)
+            if level != EMPTY and not tiles.stages[i]
+        ]
+
+    def seed_slots(self):
+        """庫存每一格的 (種子名稱, 數量)，空格為 (None, 0)。"""
+        seeds = self._farm.seeds
+        return tuple(zip(seeds.items, seeds.quantities))
+
+    def available_slots(self):
+        """有種子的庫存格子。"""
+        return self._farm.seeds.available_slots()
+
+
+class Policy:
+    """
+    自動遊玩策略的介面：decide() 收到 FarmView 與亂數產生器，
+    回傳依序執行的動作清單（place / upgrade / plant / harvest），
+    可在清單中加入 wait(seconds) 指定下一次決策的時間。
+    """
+
+    name = "policy"
+
+    def decide(self, view, rng):
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """
+    原本 AutoGame 的隨機行為：有成熟作物就隨機收穫一株，
+    否則隨機選一格放土（或升級）並種植，之後等待 2~5 秒。
+    """
+
+    name = "random"
+
+    def decide(self, view, rng):
+        actions = []
+        candidates = view.mature_tiles()
+        if candidates:
+            r, c = rng.choice(candidates)
+            actions.append(harvest(r, c))
+        else:
+            r = rng.randint(0, view.rows - 1)
+            c = rng.randint(0, view.cols - 1)
+            has_dirt = view.soil(r, c) > 0
+            actions.append(upgrade(r, c) if has_dirt else place(r, c))
+            # 放土成功（或本來就有泥土）且沒有作物時才種植
+            if (has_dirt or view.coins >= PLACE_DIRT_COST) and not view.plant_stage(r, c):
+                available_slots = view.available_slots()
+                if available_slots:
+                    actions.append(plant(r, c, rng.choice(available_slots)))
+        actions.append(wait(rng.randint(2, 5)))
+        return actions
+
+
+class GreedyPolicy(Policy):
+    """
+    簡單的貪婪策略：每秒收穫所有成熟作物、在空著的泥土上種植，
+    還有金幣時再放置新的泥土並種植，不升級泥土。
+    """
+
+    name = "greedy"
+
+    def decide(self, view, rng):
+        actions = [harvest(r, c) for r, c in view.mature_tiles()]
+        coins = view.coins + len(actions) * HARVEST_REWARD
+        slots = [slot for slot in view.available_slots() for _ in range(view.seed_slots()[slot][1])]
+
+        for r, c in view.idle_tiles():
+            if not slots:
+                break
+            actions.append(plant(r, c, slots.pop()))
+        for r, c in view.empty_tiles():
+            if not slots or coins < PLACE_DIRT_COST:
+                break
+            coins -= PLACE_DIRT_COST
+            actions.append(place(r, c))
+            actions.append(plant(r, c, slots.pop()))
+        actions.append(wait(DEFAULT_WAIT))
+        return actions
+
+
+# 可用名稱選擇的策略
+POLICIES = {policy.name: policy for policy in (RandomPolicy, GreedyPolicy)}
+
+
+def create_policy(name):
+    """
+    依名稱建立策略：POLICIES 中的名稱，或以 "模組:類別" 指定自訂的 Policy 子類別。
+    """
+    if name in POLICIES:
+        return POLICIES[name]()
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown policy: {name}")
+    return getattr(importlib.import_module(module_name), class_name)()
@@ -0,0 +1,198 @@
+# profiler.py
+
+import csv
+import time
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+from game_log import get_logger
+from settings import WINDOW_WIDTH
+from text_cache import text_cache
+
+log = get_logger("profiler")
+
+# 百分位數使用最近幾幀的資料
+DEFAULT_WINDOW = 300
+# 覆蓋層每隔幾幀重新計算並繪製一次
+OVERLAY_REFRESH = 30
+PERCENTILES = (50, 95, 99)
+
+
+class NullProfiler:
+    """
+    關閉時使用的分析器：所有方法都不做任何事，
+    讓遊戲迴圈不需要判斷是否開啟，每幀只多出幾次空的方法呼叫。
+    """
+
+    enabled = False
+    show_overlay = False
+    overlay_version = 0
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def draw_overlay(self, screen):
+        pass
+
+    def overlay_rect(self):
+        return None
+
+    def close(self):
+        pass
+
+
+class FrameProfiler:
+    """
+    每幀各階段耗時的分析器：begin_frame() 開始一幀，之後每個階段結束時呼叫
+    mark(階段名稱)，記錄從上一次 mark 到現在經過的時間（perf_counter_ns）；
+    同一幀中同名的階段會累加（例如髒矩形模式會重畫多次）。
+
+    - 保留最近 window 幀的資料，可查詢每個階段的 p50 / p95 / p99。
+    - show_overlay 時在畫面右上角顯示各階段的百分位數與文字快取每秒省下的 render 次數（F3 切換）。
+    - 指定 csv_path 時把每一幀各階段的耗時（奈秒）寫入 CSV；欄位為所有出現過的階段，
+      較晚才出現的階段（例如只在部分幀繪製時）在之前的幀記為 0。
+    """
+
+    enabled = True
+
+    def __init__(self, font, csv_path=None, window=DEFAULT_WINDOW, show_overlay=True):
+        self.font = font
+        self.csv_path = Path(csv_path) if csv_path is not None else None
+        self.window = window
+        self.show_overlay = show_overlay
+
+        self.samples = {}  # 階段名稱 -> 最近 window 幀的耗時（奈秒）
+        self.frame = 0
+        self.frame_start = 0
+        self.last_mark = 0
+        self.current = {}  # 這一幀各階段的耗時
+
+        self.file = None
+        self.writer = None
+        self.columns = None
+
+        self.overlay = None
+        self.overlay_version = 0  # 覆蓋層內容改變時遞增（髒矩形模式用來判斷是否重畫）
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter_ns()
+        self.current = {}
+
+    def mark(self, phase):
+        now = time.perf_counter_ns()
+        self.current[phase] = self.current.get(phase, 0) + now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        self.current["total"] = self.last_mark - self.frame_start
+        for phase, elapsed in self.current.items():
+            samples = self.samples.get(phase)
+            if samples is None:
+                samples = self.samples[phase] = deque(maxlen=self.window)
+            samples.append(elapsed)
+
+        if self.csv_path is not None:
+            self.write_row()
+        self.frame += 1
+        # 覆蓋層在幀與幀之間更新，不計入任何階段
+        if self.show_overlay and (self.overlay is None or self.frame % OVERLAY_REFRESH == 0):
+            self.overlay = self.build_overlay()
+
+    @property
+    def part_path(self):
+        # 執行中寫入的暫存檔（沒有標題列）
+        return self.csv_path.with_name(self.csv_path.name + ".part")
+
+    def write_row(self):
+        if self.file is None:
+            # 每幀先寫入暫存檔，新的階段出現時加在欄位最後；
+            # close() 時再加上完整的標題列並補齊較早幀缺少的欄位
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.part_path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.file, lineterminator="\n")
+            self.columns = []
+        for phase in self.current:
+            if phase not in self.columns:
+                self.columns.append(phase)
+        self.writer.writerow([self.frame] + [self.current.get(phase, 0) for phase in self.columns])
+
+    def finish_csv(self):
+        """把暫存檔加上標題列寫成最後的 CSV，每一列都補齊到所有階段。"""
+        self.file.close()
+        self.file = None
+        width = len(self.columns) + 1
+        with open(self.part_path, newline="", encoding="utf-8") as source, open(
+            self.csv_path, "w", newline="", encoding="utf-8-sig"
+        ) as target:
+            writer = csv.writer(target, lineterminator="\n")
+            writer.writerow(["frame"] + [f"{phase}_ns" for phase in self.columns])
+            for row in csv.reader(source):
+                writer.writerow(row + ["0"] * (width - len(row)))
+        self.part_path.unlink()
+
+    def percentiles(self, phase):
+        """回傳指定階段最近 window 幀的 (p50, p95, p99)，單位為奈秒。"""
+        samples = sorted(self.samples.get(phase, ()))
+        if not samples:
+            return (0, 0, 0)
+        last = len(samples) - 1
+        return tuple(samples[round(last * p / 100)] for p in PERCENTILES)
+
+    def summary(self):
+        """回傳 {階段: (p50, p95, p99)}，單位為奈秒。"""
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+    def overlay_lines(self):
+        lines = ["phase            p50    p95    p99 (ms)"]
+        for phase, (p50, p95, p99) in self.summary().items():
+            lines.append(f"{phase:<14}{p50 / 1e6:7.2f}{p95 / 1e6:7.2f}{p99 / 1e6:7.2f}")
+        # 自上次更新覆蓋層以來，文字快取平均每秒省下的 font.render 次數
+        hit_rate = text_cache.stats()["hit_rate"]
+        lines.append(f"text cache {text_cache.saved_per_second():7.0f}/s  hit {hit_rate:4.0%}")
+        return lines
+
+    def build_overlay(self):
+        lines = self.overlay_lines()
+        rendered = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 10
+        line_height = self.font.get_linesize()
+        overlay = pygame.Surface((width, line_height * len(rendered) + 10))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(180)
+        for i, surface in enumerate(rendered):
+            overlay.blit(surface, (5, 5 + i * line_height))
+        self.overlay_version += 1
+        return overlay
+
+    def overlay_rect(self):
+        if not self.show_overlay or self.overlay is None:
+            return None
+        return self.overlay.get_rect(topright=(WINDOW_WIDTH - 10, 80))
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay = None
+
+    def draw_overlay(self, screen):
+        rect = self.overlay_rect()
+        if rect is not None:
+            screen.blit(self.overlay, rect)
+
+    def close(self):
+        """關閉 CSV 並以 logger 輸出各階段的百分位數。"""
+        if self.file is not None:
+            self.finish_csv()
+            log.info("每幀耗時已儲存至 %s。", self.csv_path)
+        for phase, (p50, p95, p99) in self.summary().items():
+            log.info("%-16s p50 %7.3f ms  p95 %7.3f ms  p99 %7.3f ms", phase, p50 / 1e6, p95 / 1e6, p99 / 1e6)
@@ -0,0 +1,155 @@
+# recorder.py
+
+import csv
+from pathlib import Path
+
+import numpy as np
+
+# 欄位名稱（CSV 標題）與對應的型別
+COLUMNS = [
+    ("Time (s)", np.int32),
+    ("Grid Row", np.int32),
+    ("Grid Column", np.int32),
+    ("Soil Level", np.int8),
+    ("Plant Level", np.int8),
+    ("Coins", np.int64),
+    ("Instance ID", np.int32),
+]
+
+RECORD_DTYPE = np.dtype(COLUMNS)
+
+# 二進位紀錄檔：檔頭（BINARY_MAGIC + 實例ID）之後直接接著固定長度的紀錄（little-endian），
+# 實例ID 整個檔案都相同，所以只存在檔頭
+BINARY_MAGIC = b"FARMREC1"
+BINARY_HEADER = np.dtype("<i4")
+BINARY_DTYPE = np.dtype(
+    [
+        ("Time (s)", "<i4"),
+        ("Grid Row", "<u2"),
+        ("Grid Column", "<u2"),
+        ("Soil Level", "i1"),
+        ("Plant Level", "i1"),
+        ("Coins", "<i4"),
+    ]
+)
+
+# 每累積多少筆紀錄就寫入檔案一次
+DEFAULT_CHUNK_ROWS = 4096
+
+FORMATS = ("csv", "binary")
+# 各紀錄格式的副檔名（delta 格式見 delta_log.py）
+EXTENSIONS = {"csv": ".csv", "binary": ".bin", "delta": ".delta"}
+
+
+class GameRecorder:
+    """
+    以預先配置的固定型別欄位收集每秒的遊戲狀態，
+    每累積 chunk_rows 筆就寫入檔案並清空緩衝區，記憶體用量不隨遊戲長度增加；
+    程式中途結束時，已寫入的部分仍保留在檔案中。
+
+    format 為 "csv"（與原本相同的 utf-8-sig CSV）或 "binary"（每筆 14 bytes 的
+    BINARY_DTYPE 紀錄，可用 read_binary() 讀回）。
+    檔案在第一次寫入時才建立。
+    """
+
+    def __init__(self, path, rows, cols, instance_id=1, format="csv", chunk_rows=DEFAULT_CHUNK_ROWS):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown log format: {format}")
+        self.path = Path(path)
+        self.rows = rows
+        self.cols = cols
+        self.instance_id = instance_id
+        self.format = format
+        self.chunk_rows = chunk_rows
+
+        self.buffer = np.zeros(chunk_rows, dtype=RECORD_DTYPE)
+        self.buffer["Instance ID"] = instance_id
+        self.size = 0  # 緩衝區中尚未寫入的筆數
+        self.rows_written = 0
+        self.file = None
+        self.writer = None
+
+    def __len__(self):
+        return self.rows_written + self.size
+
+    def record_snapshot(self, time, soil_levels, plant_levels, coins):
+        """
+        記錄某一秒整個網格的狀態。soil_levels 與 plant_levels 為依列優先排列的
+        每格數值，Grid Row / Grid Column 由順序推算。
+        """
+        soil_levels = np.asarray(soil_levels, dtype=np.int8).ravel()
+        plant_levels = np.asarray(plant_levels, dtype=np.int8).ravel()
+        count = len(soil_levels)
+        cells = np.arange(count)
+
+        start = 0
+        while start < count:
+            if self.size == self.chunk_rows:
+                self.flush()
+            end = min(count, start + self.chunk_rows - self.size)
+            block = self.buffer[self.size : self.size + end - start]
+            block["Time (s)"] = time
+            block["Grid Row"] = cells[start:end] // self.cols
+            block["Grid Column"] = cells[start:end] % self.cols
+            block["Soil Level"] = soil_levels[start:end]
+            block["Plant Level"] = plant_levels[start:end]
+            block["Coins"] = coins
+            self.size += end - start
+            start = end
+
+    def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "csv":
+            self.file = open(self.path, "w", newline="", encoding="utf-8-sig")
+            self.writer = csv.writer(self.file, lineterminator="\n")
+            self.writer.writerow([name for name, _ in COLUMNS])
+        else:
+            self.file = open(self.path, "wb")
+            self.file.write(BINARY_MAGIC)
+            self.file.write(np.array(self.instance_id, dtype=BINARY_HEADER).tobytes())
+
+    def flush(self):
+        """把緩衝區中的紀錄寫入檔案。"""
+        if self.size == 0:
+            return
+        if self.file is None:
+            self.open()
+        records = self.buffer[: self.size]
+        if self.format == "csv":
+            self.writer.writerows(zip(*(records[name].tolist() for name, _ in COLUMNS)))
+        else:
+            packed = np.empty(self.size, dtype=BINARY_DTYPE)
+            for name in BINARY_DTYPE.names:
+                packed[name] = records[name]
+            self.file.write(packed.tobytes())
+        self.file.flush()
+        self.rows_written += self.size
+        self.size = 0
+
+    def close(self):
+        """寫入剩餘的紀錄並關閉檔案，回傳總筆數。"""
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+        return self.rows_written
+
+
+def read_binary(path):
+    """
+    讀取 GameRecorder 產生的二進位紀錄檔，回傳與 CSV 欄位相同的 RECORD_DTYPE 結構化陣列。
+    檔案尾端不完整的紀錄（例如寫入途中被中斷）會被忽略。
+    """
+    with open(path, "rb") as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a game record file")
+        instance_id = int(np.frombuffer(f.read(BINARY_HEADER.itemsize), dtype=BINARY_HEADER)[0])
+        data = f.read()
+    packed = np.frombuffer(data, dtype=BINARY_DTYPE, count=len(data) // BINARY_DTYPE.itemsize)
+
+    records = np.empty(len(packed), dtype=RECORD_DTYPE)
+    for name in BINARY_DTYPE.names:
+        records[name] = packed[name]
+    records["Instance ID"] = instance_id
+    return records
@@ -0,0 +1,125 @@
+# renderer.py
+
+import pygame
+
+# 髒矩形超過這個數量時，直接合併成一個外框矩形重畫
+MAX_DIRTY_RECTS = 8
+
+
+class DirtyRectRenderer:
+    """
+    只重畫有變化的區域：每幀比對農夫、金幣、計時器、庫存與特效的
+    位置與內容，再加上 FarmModel 事件中改變的格子，把這些區域設為 clip
+    重新繪製，最後只以 pygame.display.update(rects) 更新這些區域。
+    攝影機移動或視窗需要重畫時，改為整個畫面重畫一次。
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.dirty = []  # 這一幀需要重畫的區域
+        self.tracked = {}  # 名稱 -> (上一幀的範圍, 內容)
+        self.full_redraw = True  # 第一幀一定要整個畫面重畫
+        self.last_camera = None
+        game.farm.add_listener(self.on_farm_event)
+
+    def mark(self, rect):
+        self.dirty.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self.full_redraw = True
+
+    def track(self, name, rect, content=None):
+        """
+        記錄動態物件的範圍與內容，和上一幀不同時把新舊範圍都標記為需要重畫。
+        """
+        previous = self.tracked.get(name)
+        if previous is not None and previous == (rect, content):
+            return
+        if previous is not None:
+            self.mark(previous[0])
+        self.mark(rect)
+        self.tracked[name] = (rect, content)
+
+    def on_farm_event(self, event, row, col):
+        # 格子狀態改變（放土、升級、種植、成長、收穫）時重畫該格
+        self.mark(self.game.tile_screen_rect(row, col))
+
+    def collect(self):
+        """比對所有動態物件，收集這一幀的髒矩形。"""
+        game = self.game
+
+        camera = (game.camera.x, game.camera.y)
+        if camera != self.last_camera:
+            self.last_camera = camera
+            self.full_redraw = True
+
+        farmer = game.farmer
+        offset_x, offset_y = game.camera.offset
+        self.track(
+            "farmer",
+            (farmer.x + offset_x, farmer.y + offset_y, farmer.image_width, farmer.image_height),
+            (farmer.direction, farmer.current_frame),
+        )
+        self.track("coins", game.coins_rect(), game.coin.get_amount())
+        self.track("timer", game.timer_rect(), game.timer_text())
+
+        inventory = game.seed_inventory
+        self.track(
+            "inventory",
+            (inventory.x, inventory.y, inventory.width, inventory.height * 2),
+            (inventory.store.version, inventory.show_numbers, inventory.selected_slot),
+        )
+
+        # 每幀耗時的覆蓋層（每隔幾幀更新一次內容）
+        overlay = game.profiler.overlay_rect()
+        if overlay is not None:
+            self.track("profiler", overlay, game.profiler.overlay_version)
+
+        # 特效：以所有特效的外框重畫，上一幀的外框也要擦掉（特效每幀都會移動）
+        previous = self.tracked.pop("effects", None)
+        if previous is not None:
+            self.mark(previous[0])
+        bounds = game.effects.bounds
+        if bounds is not None:
+            self.mark(bounds)
+            self.tracked["effects"] = (bounds, None)
+
+    def merge(self, rects):
+        """合併互相重疊的矩形，太多時改用單一外框矩形。"""
+        merged = []
+        for rect in rects:
+            rect = rect.clip(self.game.screen.get_rect())
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        if len(merged) > MAX_DIRTY_RECTS:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+
+    def render(self):
+        """繪製並更新畫面，回傳這一幀實際更新的矩形（整個畫面重畫時為 None）。"""
+        game = self.game
+        self.collect()
+        game.profiler.mark("dirty_collect")
+
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty = []
+            game.draw_frame()
+            pygame.display.flip()
+            return None
+
+        rects = self.merge(self.dirty)
+        self.dirty = []
+        screen = game.screen
+        for rect in rects:
+            screen.set_clip(rect)
+            game.draw_frame()
+        screen.set_clip(None)
+        if rects:
+            pygame.display.update(rects)
+        return rects
@@ -0,0 +1,221 @@
+# savegame.py
+
+import os
+import struct
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from farm_model import TileStore, SEED_SPAWN, CROP_IDS
+from game_log import get_logger
+from scheduler import EventScheduler
+from settings import MAX_PLANT_STAGE, WHEAT_SEED_NAME
+
+log = get_logger("save")
+
+# 檔頭：SAVE_MAGIC 與版本之後接著列數、行數、金幣、經過時間（毫秒）、
+# 距離下一次生成種子的時間（毫秒）、庫存格數、有泥土的格數
+SAVE_MAGIC = b"FARMSAVE"
+SAVE_VERSION = 1
+HEADER = struct.Struct("<8sHHHqddBI")
+# 有泥土的格子：列、行、泥土等級、作物階段、最後成長時間（相對於遊戲開始，毫秒）
+TILE_DTYPE = np.dtype(
+    [("row", "<u2"), ("col", "<u2"), ("level", "u1"), ("stage", "u1"), ("last_growth", "<f8")]
+)
+# 庫存格子：名稱長度（UTF-8 位元組）、數量，之後接著名稱
+SLOT = struct.Struct("<BI")
+
+# 預設每隔幾毫秒自動存檔一次
+DEFAULT_AUTOSAVE_INTERVAL = 30_000
+
+# 某一時間點的完整遊戲狀態，所有欄位都是不可變的（tuple / 數字），
+# 可以直接交給背景執行緒寫入，不會受到之後的遊戲狀態影響。
+# 時間皆相對於遊戲開始（毫秒）；tiles 為 (row, col, level, stage, last_growth)，slots 為 (名稱, 數量)。
+GameSnapshot = namedtuple(
+    "GameSnapshot", ["rows", "cols", "coins", "elapsed", "next_seed", "tiles", "slots"]
+)
+
+
+def take_snapshot(farm, now, start_time):
+    """在主執行緒擷取 FarmModel 的狀態（只複製數值，不做任何編碼或 I/O）。"""
+    tiles = tuple(
+        (r, c, level, stage, last_growth - start_time)
+        for r, c, level, stage, last_growth in farm.tiles.dirt_tiles()
+    )
+    items, quantities = farm.seeds.snapshot()
+    slots = tuple(zip(items, quantities))
+    next_seed = farm.scheduler.deadline(SEED_SPAWN)
+    return GameSnapshot(
+        rows=farm.rows,
+        cols=farm.cols,
+        coins=farm.coin.get_amount(),
+        elapsed=now - start_time,
+        next_seed=(next_seed if next_seed is not None else now) - now,
+        tiles=tiles,
+        slots=slots,
+    )
+
+
+def restore_snapshot(farm, snapshot, now):
+    """
+    把存檔狀態套用到 FarmModel（不通知 listener），回傳對應的遊戲開始時間，
+    讓計時器與所有成長計時從存檔時的進度繼續。
+    """
+    if (snapshot.rows, snapshot.cols) != (farm.rows, farm.cols):
+        raise ValueError(
+            f"Save is for a {snapshot.rows}x{snapshot.cols} farm, not {farm.rows}x{farm.cols}"
+        )
+    start_time = now - snapshot.elapsed
+
+    farm.tiles = tiles = TileStore(farm.rows, farm.cols)
+    farm.mature = set()
+    farm.scheduler = EventScheduler()
+    for r, c, level, stage, last_growth in snapshot.tiles:
+        i = tiles.index(r, c)
+        tiles.levels[i] = level
+        tiles.stages[i] = stage
+        # 目前只有小麥一種作物，存檔不記錄作物種類
+        tiles.crops[i] = CROP_IDS[WHEAT_SEED_NAME] if stage else 0
+        tiles.last_growth[i] = start_time + last_growth
+        if stage >= MAX_PLANT_STAGE:
+            farm.mature.add((r, c))
+        elif stage:
+            farm.schedule_growth(r, c)
+
+    farm.coin.amount = snapshot.coins
+    farm.seeds.restore(snapshot.slots)
+    farm.seed_timer = now
+    farm.scheduler.schedule(SEED_SPAWN, now + snapshot.next_seed)
+    return start_time
+
+
+def encode(snapshot):
+    """把狀態編碼成存檔格式的 bytes。"""
+    tiles = np.array(list(snapshot.tiles), dtype=TILE_DTYPE)
+    data = bytearray(
+        HEADER.pack(
+            SAVE_MAGIC,
+            SAVE_VERSION,
+            snapshot.rows,
+            snapshot.cols,
+            snapshot.coins,
+            snapshot.elapsed,
+            snapshot.next_seed,
+            len(snapshot.slots),
+            len(tiles),
+        )
+    )
+    data += tiles.tobytes()
+    for name, quantity in snapshot.slots:
+        encoded = name.encode("utf-8") if name is not None else b""
+        data += SLOT.pack(len(encoded), quantity)
+        data += encoded
+    return bytes(data)
+
+
+def decode(data):
+    """解析存檔格式的 bytes，回傳 GameSnapshot。"""
+    if len(data) < HEADER.size or data[:8] != SAVE_MAGIC:
+        raise ValueError("Not a farm save file")
+    magic, version, rows, cols, coins, elapsed, next_seed, slot_count, tile_count = HEADER.unpack_from(
+        data
+    )
+    if version > SAVE_VERSION:
+        raise ValueError(f"Unsupported save version {version} (newest supported is {SAVE_VERSION})")
+
+    offset = HEADER.size
+    tiles = np.frombuffer(data, dtype=TILE_DTYPE, count=tile_count, offset=offset)
+    offset += tiles.nbytes
+    slots = []
+    for _ in range(slot_count):
+        length, quantity = SLOT.unpack_from(data, offset)
+        offset += SLOT.size
+        name = bytes(data[offset : offset + length]).decode("utf-8") if length else None
+        offset += length
+        slots.append((name, quantity))
+
+    return GameSnapshot(
+        rows=rows,
+        cols=cols,
+        coins=coins,
+        elapsed=elapsed,
+        next_seed=next_seed,
+        tiles=tuple(
+            (int(t["row"]), int(t["col"]), int(t["level"]), int(t["stage"]), float(t["last_growth"]))
+            for t in tiles
+        ),
+        slots=tuple(slots),
+    )
+
+
+def write_save(path, snapshot):
+    """寫入存檔：先寫到暫存檔再取代，寫到一半中斷也不會留下損壞的存檔。"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(encode(snapshot))
+    os.replace(temp_path, path)
+
+
+def read_save(path):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+class AutoSaver:
+    """
+    在背景執行緒寫入存檔：主執行緒每隔 interval 毫秒擷取一次不可變的 GameSnapshot
+    交給 submit()，編碼與寫檔都在背景完成，不會拖慢任何一幀。
+    背景還在寫入時又有新的快照，只會保留最新的一個。
+    """
+
+    def __init__(self, path, interval=DEFAULT_AUTOSAVE_INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self.last_save = None  # 上一次擷取快照的遊戲時間（毫秒）
+        self.saves = 0  # 已完成的寫入次數
+
+        self.pending = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.worker, name="autosave", daemon=True)
+        self.thread.start()
+
+    def due(self, now):
+        if self.last_save is None:
+            self.last_save = now
+        return now - self.last_save >= self.interval
+
+    def submit(self, snapshot, now=None):
+        """把快照交給背景執行緒寫入。"""
+        if now is not None:
+            self.last_save = now
+        with self.condition:
+            self.pending = snapshot
+            self.condition.notify()
+
+    def worker(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                snapshot, self.pending = self.pending, None
+            if snapshot is None:
+                return
+            try:
+                write_save(self.path, snapshot)
+                self.saves += 1
+            except OSError as error:
+                log.error("自動存檔失敗：%s", error)
+
+    def close(self, snapshot=None):
+        """（可選）寫入最後一個快照，等待背景執行緒結束。"""
+        with self.condition:
+            if snapshot is not None:
+                self.pending = snapshot
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
@@ -0,0 +1,57 @@
+# scheduler.py
+
+import heapq
+import itertools
+
+
+class EventScheduler:
+    """
+    以 heap 實作的事件排程器：每個 key 只保留一個有效的到期時間。
+    重新排程或取消時不從 heap 刪除舊資料，而是在取出時略過已失效的項目，
+    因此 schedule / cancel 為 O(log n)，每幀的成本只跟到期事件數量有關。
+    """
+
+    def __init__(self):
+        self.queue = []  # (到期時間, 序號, key)
+        self.deadlines = {}  # key -> 目前有效的到期時間
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def __contains__(self, key):
+        return key in self.deadlines
+
+    def schedule(self, key, due_time):
+        """設定 key 的到期時間（已排程的 key 會被覆蓋）。"""
+        self.deadlines[key] = due_time
+        heapq.heappush(self.queue, (due_time, next(self.counter), key))
+
+    def cancel(self, key):
+        self.deadlines.pop(key, None)
+
+    def deadline(self, key):
+        return self.deadlines.get(key)
+
+    def discard_stale(self):
+        # 移除 heap 頂端已被取消或重新排程的項目
+        queue = self.queue
+        while queue and self.deadlines.get(queue[0][2]) != queue[0][0]:
+            heapq.heappop(queue)
+
+    def next_time(self):
+        """回傳最近一個事件的到期時間，沒有事件時回傳 None。"""
+        self.discard_stale()
+        return self.queue[0][0] if self.queue else None
+
+    def pop_due(self, current_time):
+        """依到期時間順序取出所有 current_time 之前到期的 key。"""
+        due = []
+        queue = self.queue
+        while True:
+            self.discard_stale()
+            if not queue or queue[0][0] > current_time:
+                return due
+            _, _, key = heapq.heappop(queue)
+            del self.deadlines[key]
+            due.append(key)
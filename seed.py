@@ -1,22 +1,39 @@
 # seed.py
 
-import pygame
+from assets import assets
+from settings import WHEAT_SEED_NAME
+
+# 種子圖片縮放後的大小，以適應庫存格子的尺寸
+SEED_IMAGE_SIZE = (64, 64)
 
 
 class Seed:
     def __init__(self, name, image_path):
         self.name = name
         self.image_path = image_path
-        self.image = pygame.image.load(self.image_path).convert_alpha()
-        # 縮放圖片大小，以適應庫存格子的尺寸
-        self.image = pygame.transform.scale(self.image, (64, 64))  # 根據實際需求調整尺寸
+        # 縮放後的圖片由 AssetManager 共用，不會每次都從硬碟解碼
+        self.image = assets.get(self.image_path, SEED_IMAGE_SIZE)
 
 
 class WheatSeed(Seed):
+    NAME = WHEAT_SEED_NAME
+    IMAGE_PATH = "./img/CropSeed1.png"
+
     def __init__(self):
-        super().__init__(name="小麥種子", image_path="./img/CropSeed1.png")
+        super().__init__(name=self.NAME, image_path=self.IMAGE_PATH)
 
 
 class AppleSeed(Seed):
+    NAME = "蘋果種子"
+    IMAGE_PATH = "./img/CropSeed2.png"
+
     def __init__(self):
-        super().__init__(name="蘋果種子", image_path="./img/CropSeed2.png")
+        super().__init__(name=self.NAME, image_path=self.IMAGE_PATH)
+
+
+# 依種子名稱建立對應的 Seed 物件（供庫存以名稱繪製圖片）
+SEED_TYPES = {seed_type.NAME: seed_type for seed_type in (WheatSeed, AppleSeed)}
+
+
+def create_seed(name):
+    return SEED_TYPES[name]()
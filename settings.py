@@ -41,3 +41,20 @@ DIRT_LEVELS = [
         "growth_speed_bonus": 0.20,
     },
 ]
+
+# 遊戲經濟參數
+INITIAL_COINS = 100  # 開局金幣
+PLACE_DIRT_COST = 50  # 放置一塊泥土的費用
+HARVEST_REWARD = 50  # 收穫一株成熟作物獲得的金幣
+BASE_GROW_TIME = 2000  # 作物每成長一階的基準時間（毫秒）
+SEED_INTERVAL = 1000  # 每隔多久自動獲得一顆小麥種子（毫秒）
+PLANT_START_STAGE = 2  # 剛種下的作物階段（CropSeed2.png）
+MAX_PLANT_STAGE = 5  # 作物成熟、可收穫的階段
+WHEAT_SEED_NAME = "小麥種子"
+
+# 自動遊玩每一局的遊戲時間（秒）
+EPISODE_TIME = 60
+
+# AutoGame 繪製畫面的模式：every 每 N 個模擬步驟繪製一次、changes 只在畫面上的遊戲狀態改變時繪製、
+# none 完全不繪製（只跑遊戲邏輯）
+RENDER_MODES = ("every", "changes", "none")
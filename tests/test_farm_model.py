@@ -0,0 +1,108 @@
+# tests/test_farm_model.py
+
+from farm_model import (
+    FarmModel,
+    GROW_INTERVALS,
+    GREW,
+    HARVESTED,
+    MAX_LEVEL,
+    NO_DIRT,
+    NO_SEEDS,
+    NOT_ENOUGH_COINS,
+    NOT_MATURE,
+    OCCUPIED,
+    PLACED,
+    PLANTED,
+    UPGRADED,
+)
+from settings import (
+    DIRT_LEVELS,
+    HARVEST_REWARD,
+    INITIAL_COINS,
+    MAX_PLANT_STAGE,
+    PLACE_DIRT_COST,
+    PLANT_START_STAGE,
+    SEED_INTERVAL,
+    WHEAT_SEED_NAME,
+)
+
+
+def recording_farm(**kwargs):
+    farm = FarmModel(rows=2, cols=2, **kwargs)
+    events = []
+    farm.add_listener(lambda event, row, col: events.append((event, row, col)))
+    return farm, events
+
+
+def test_seed_spawns_through_scheduler():
+    farm, _ = recording_farm()
+    assert farm.next_event_time() == SEED_INTERVAL
+    farm.update(SEED_INTERVAL - 1)
+    assert farm.seeds.count(WHEAT_SEED_NAME) == 0
+    farm.update(SEED_INTERVAL)
+    assert farm.seeds.count(WHEAT_SEED_NAME) == 1
+    assert farm.next_event_time() == 2 * SEED_INTERVAL
+
+
+def test_plant_grow_and_harvest():
+    farm, events = recording_farm()
+    assert farm.place_or_upgrade(0, 0) == PLACED
+    assert farm.coin.get_amount() == INITIAL_COINS - PLACE_DIRT_COST
+    assert farm.plant(0, 0, 0, 0) == NO_SEEDS
+
+    farm.update(SEED_INTERVAL)
+    slot = farm.seeds.slot_of[WHEAT_SEED_NAME]
+    assert farm.plant(0, 0, slot, SEED_INTERVAL) == PLANTED
+    assert farm.tiles.stage(0, 0) == PLANT_START_STAGE
+    assert farm.seeds.count(WHEAT_SEED_NAME) == 0
+    assert farm.harvest(0, 0) == NOT_MATURE
+
+    # 每一階在上一次成長後 GROW_INTERVALS[等級] 毫秒到期
+    now = SEED_INTERVAL
+    for stage in range(PLANT_START_STAGE + 1, MAX_PLANT_STAGE + 1):
+        now += GROW_INTERVALS[0]
+        farm.update(now - 1)
+        assert farm.tiles.stage(0, 0) == stage - 1
+        farm.update(now)
+        assert farm.tiles.stage(0, 0) == stage
+    assert farm.mature_tiles() == [(0, 0)]
+
+    assert farm.harvest(0, 0) == HARVESTED
+    assert farm.coin.get_amount() == INITIAL_COINS - PLACE_DIRT_COST + HARVEST_REWARD
+    assert farm.tiles.stage(0, 0) == 0
+    assert farm.mature_tiles() == []
+    assert [event for event in events if event[0] != GREW] == [
+        (PLACED, 0, 0),
+        (PLANTED, 0, 0),
+        (HARVESTED, 0, 0),
+    ]
+    assert events.count((GREW, 0, 0)) == MAX_PLANT_STAGE - PLANT_START_STAGE
+
+
+def test_upgrade_reschedules_growth():
+    farm, _ = recording_farm()
+    farm.place_or_upgrade(0, 0)
+    farm.seeds.add(WHEAT_SEED_NAME)
+    farm.plant(0, 0, farm.seeds.slot_of[WHEAT_SEED_NAME], 0)
+    assert farm.place_or_upgrade(0, 0) == UPGRADED
+    assert farm.coin.get_amount() == INITIAL_COINS - PLACE_DIRT_COST - DIRT_LEVELS[0]["upgrade_cost"]
+    # 成長間隔改用新等級，從最後一次成長的時間算起
+    farm.update(GROW_INTERVALS[1])
+    assert farm.tiles.stage(0, 0) == PLANT_START_STAGE + 1
+
+
+def test_rejected_actions():
+    farm, events = recording_farm(initial_coins=PLACE_DIRT_COST)
+    assert farm.plant(1, 1, 0, 0) == NO_DIRT
+    assert farm.harvest(1, 1) == NO_DIRT
+    assert farm.place_or_upgrade(0, 0) == PLACED
+    assert farm.place_or_upgrade(0, 1) == NOT_ENOUGH_COINS
+    assert farm.place_or_upgrade(0, 0) == NOT_ENOUGH_COINS
+
+    farm.seeds.add(WHEAT_SEED_NAME, 2)
+    farm.plant(0, 0, 0, 0)
+    assert farm.plant(0, 0, 0, 0) == OCCUPIED
+
+    farm.tiles.levels[farm.tiles.index(0, 0)] = len(DIRT_LEVELS) - 1
+    assert farm.place_or_upgrade(0, 0) == MAX_LEVEL
+    assert events == [(PLACED, 0, 0), (PLANTED, 0, 0)]
@@ -0,0 +1,96 @@
+# tests/test_game_logs.py
+
+import csv
+
+import numpy as np
+import pytest
+
+from delta_log import DeltaLogReader, DeltaLogWriter
+from game_log import quiet
+from headless_game import HeadlessGame
+from recorder import COLUMNS, GameRecorder, read_binary
+
+NAMES = [name for name, _ in COLUMNS]
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        assert next(reader) == NAMES
+        return np.array([[int(value) for value in row] for row in reader], dtype=np.int64)
+
+
+def as_table(records):
+    return np.column_stack([records[name].astype(np.int64) for name in NAMES])
+
+
+def play(log_format, tmp_path, monkeypatch):
+    # 紀錄檔寫在 log/ 之下，換到暫存資料夾執行
+    tmp_path.mkdir()
+    monkeypatch.chdir(tmp_path)
+    game = HeadlessGame(instance_id=3, total_time=75, seed=7, log_format=log_format)
+    with quiet():
+        game.run()
+    return tmp_path / game.log_filename
+
+
+def test_csv_binary_and_delta_logs_hold_the_same_data(tmp_path, monkeypatch):
+    table = read_csv(play("csv", tmp_path / "csv", monkeypatch))
+    binary = as_table(read_binary(play("binary", tmp_path / "binary", monkeypatch)))
+    reader = DeltaLogReader(play("delta", tmp_path / "delta", monkeypatch))
+    delta = as_table(reader.to_records())
+
+    assert len(table) == 76 * 18
+    assert np.array_equal(binary, table)
+    assert np.array_equal(delta, table)
+    assert set(table[:, NAMES.index("Instance ID")]) == {3}
+    # 0、30、60 秒是關鍵影格，其餘都是變化影格
+    assert [kind for kind, *_ in reader.frames].count(b"K") == 3
+
+
+@pytest.mark.parametrize("format", ["csv", "binary"])
+def test_recorder_round_trip_across_chunks(tmp_path, format):
+    path = tmp_path / f"game.{format}"
+    recorder = GameRecorder(path, rows=2, cols=3, instance_id=5, format=format, chunk_rows=4)
+    soil = np.array([[0, 1, 2], [3, 4, 0]])
+    for second in range(3):
+        recorder.record_snapshot(second, soil, (soil > 0) * (second + 2), 100 + second)
+    assert recorder.close() == 18
+
+    records = read_csv(path) if format == "csv" else as_table(read_binary(path))
+    assert records[:, 0].tolist() == [0] * 6 + [1] * 6 + [2] * 6
+    assert records[:6, 1].tolist() == [0, 0, 0, 1, 1, 1]
+    assert records[:6, 2].tolist() == [0, 1, 2, 0, 1, 2]
+    assert records[6:12, 3].tolist() == soil.ravel().tolist()
+    assert records[12:, 4].tolist() == [0, 4, 4, 4, 4, 0]
+    assert records[-1, 5] == 102
+    assert set(records[:, 6]) == {5}
+
+
+def test_delta_snapshot_restores_any_second(tmp_path):
+    path = tmp_path / "game.delta"
+    writer = DeltaLogWriter(path, rows=2, cols=2, instance_id=1, keyframe_interval=2)
+    soil = np.zeros((2, 2), dtype=np.int8)
+    plant = np.zeros((2, 2), dtype=np.int8)
+    expected = {}
+    for second in range(5):
+        # 每秒改變一格
+        row, col = divmod(second % 4, 2)
+        soil[row, col] = 1 + second % 4
+        plant[row, col] = 2 + second % 4
+        coins = 100 + 10 * second
+        if writer.keyframe_due(second):
+            writer.record_keyframe(second, soil, plant, coins)
+        else:
+            writer.record_changes(second, [(row, col, soil[row, col], plant[row, col])], coins)
+        expected[second] = (soil.copy(), plant.copy(), coins)
+    writer.close()
+
+    reader = DeltaLogReader(path)
+    assert reader.seconds() == list(range(5))
+    for second in (4, 1, 3, 0, 2):
+        restored_soil, restored_plant, restored_coins = reader.snapshot(second)
+        soil, plant, coins = expected[second]
+        assert np.array_equal(restored_soil, soil)
+        assert np.array_equal(restored_plant, plant)
+        assert restored_coins == coins
@@ -0,0 +1,55 @@
+# tests/test_headless_game.py
+
+import pytest
+
+from farm_model import FarmModel
+from game_log import quiet
+from headless_game import HeadlessGame
+from policy import GreedyPolicy, Policy, wait
+
+
+def play(policy, fast_forward, seed=0, total_time=60):
+    game = HeadlessGame(total_time=total_time, seed=seed, log_format="none", policy=policy)
+    with quiet():
+        return game.run(fast_forward=fast_forward)
+
+
+@pytest.mark.parametrize("total_time", [30, 60])
+def test_greedy_same_score_in_both_stepping_modes(total_time):
+    # 同一時間點成熟的作物與生成的種子，兩種模式下策略都要在決策時看得到
+    frame_stepped = play(GreedyPolicy(), fast_forward=False, total_time=total_time)
+    fast_forward = play(GreedyPolicy(), fast_forward=True, total_time=total_time)
+    assert fast_forward == frame_stepped
+    assert fast_forward > 0
+
+
+@pytest.mark.parametrize("rows, cols", [(2, 2), (3, 6), (5, 8)])
+def test_greedy_same_final_farm_in_both_stepping_modes(rows, cols):
+    farms = []
+    for fast_forward in (False, True):
+        game = HeadlessGame(
+            total_time=90, farm=FarmModel(rows, cols), log_format="none", policy=GreedyPolicy()
+        )
+        with quiet():
+            coins = game.run(fast_forward=fast_forward)
+        tiles = game.farm.tiles
+        farms.append((coins, list(tiles.levels), list(tiles.stages), game.farm.seeds.snapshot()))
+    assert farms[0] == farms[1]
+
+
+class StallingPolicy(Policy):
+    # 每次都要求 seconds 秒後再決策（0 或負數）
+    name = "stalling"
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def decide(self, view, rng):
+        return [wait(self.seconds)]
+
+
+@pytest.mark.parametrize("seconds", [0, -1])
+@pytest.mark.parametrize("fast_forward", [False, True])
+def test_non_positive_wait_is_rejected(seconds, fast_forward):
+    with pytest.raises(ValueError, match="StallingPolicy"):
+        play(StallingPolicy(seconds), fast_forward=fast_forward)
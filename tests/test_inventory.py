@@ -0,0 +1,36 @@
+# tests/test_inventory.py
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import pytest
+
+from inventory import Inventory, NUMBER_IMAGES
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    yield surface
+    pygame.quit()
+
+
+def test_numbers_beyond_images(screen):
+    # 格子數比數字圖片多時，多出來的格子改用字體繪製數字
+    font = pygame.font.Font(None, 24)
+    inventory = Inventory(50, 8, font)
+    assert len(inventory.number_images) == 8
+    assert len(NUMBER_IMAGES) < 8
+
+    inventory.toggle_numbers()
+    inventory.select_slot(7)
+    assert inventory.selected_slot == 7
+    inventory.draw(screen)
+    number_surfaces = {id(image) for image in inventory.number_images}
+    drawn = [surface for surface, _ in inventory.draw_list if id(surface) in number_surfaces]
+    assert len(drawn) == 8
@@ -0,0 +1,35 @@
+# tests/test_log_analytics.py
+
+from delta_log import DeltaLogReader
+from game_log import quiet
+from headless_game import HeadlessGame
+from log_analytics import LogIndex
+
+
+def play(instance_id, log_format, seed=None):
+    game = HeadlessGame(instance_id=instance_id, total_time=10, seed=seed, log_format=log_format)
+    with quiet():
+        game.run()
+    return game
+
+
+def test_reused_instance_id_gets_its_own_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # 同一秒內以相同的實例ID（沒有亂數種子）連續執行兩局
+    first = play(1, "csv")
+    second = play(1, "csv")
+    assert first.log_filename != second.log_filename
+    assert len(list((tmp_path / "log").glob("game_*_instance1_*.csv"))) == 2
+    assert "_seed7_" in play(1, "csv", seed=7).log_filename
+
+
+def test_one_episode_per_stem(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    delta = play(1, "delta", seed=1)
+    play(2, "binary", seed=2)
+    # 轉出同名的 CSV：同一局的兩種格式只算一局
+    DeltaLogReader(delta.log_filename).to_csv(delta.log_filename.replace(".delta", ".csv"))
+
+    log_index = LogIndex.load(tmp_path / "log", workers=1)
+    assert len(log_index) == 2
+    assert sorted(log_index.instances()["file"].str.rsplit(".", n=1).str[-1]) == ["bin", "delta"]
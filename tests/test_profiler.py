@@ -0,0 +1,44 @@
+# tests/test_profiler.py
+
+import csv
+
+import pygame
+
+from profiler import FrameProfiler
+from text_cache import text_cache
+
+
+def test_phase_first_seen_later_is_exported(tmp_path):
+    path = tmp_path / "profile.csv"
+    profiler = FrameProfiler(font=None, csv_path=path, show_overlay=False)
+    # 第 1 幀只有 update，第 2 幀才出現 draw（例如跳過繪製的幀之後）
+    for phases in (["update"], ["update", "draw"], ["update"]):
+        profiler.begin_frame()
+        for phase in phases:
+            profiler.mark(phase)
+        profiler.end_frame()
+    profiler.close()
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ["frame", "update_ns", "total_ns", "draw_ns"]
+    assert [row["frame"] for row in rows] == ["0", "1", "2"]
+    assert rows[0]["draw_ns"] == "0"
+    assert int(rows[1]["draw_ns"]) >= 0
+    assert rows[2]["draw_ns"] == "0"
+    assert not (tmp_path / "profile.csv.part").exists()
+
+
+def test_overlay_reports_text_cache_savings():
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    profiler = FrameProfiler(font=font, show_overlay=False)
+    text_cache.saved_per_second()  # 開始新的統計區間
+    for _ in range(3):
+        text_cache.render(font, "+50", True, (255, 255, 255))
+
+    line = profiler.overlay_lines()[-1]
+    assert line.startswith("text cache")
+    assert float(line.split()[2].rstrip("/s")) > 0
+    # 每次更新覆蓋層都開始新的統計區間
+    assert float(profiler.overlay_lines()[-1].split()[2].rstrip("/s")) == 0
@@ -0,0 +1,66 @@
+# tests/test_savegame.py
+
+import pytest
+
+from farm_model import FarmModel
+from savegame import decode, encode, restore_snapshot, take_snapshot
+from settings import WHEAT_SEED_NAME
+
+START = 1_000
+SAVED_AT = 9_500
+
+
+def played_farm():
+    # 泥土不同等級、作物不同階段（包含已成熟）與庫存
+    farm = FarmModel(rows=2, cols=3, initial_coins=1000, start_time=START)
+    for col in range(3):
+        farm.place_or_upgrade(0, col)
+    farm.place_or_upgrade(0, 1)
+    farm.seeds.add(WHEAT_SEED_NAME, 5)
+    now = START
+    for col in range(3):
+        farm.plant(0, col, farm.seeds.slot_of[WHEAT_SEED_NAME], now)
+        now += 1_500
+        farm.update(now)
+    while now < SAVED_AT:
+        now += 250
+        farm.update(now)
+    farm.seeds.add("corn", 2)
+    return farm
+
+
+def test_encode_decode_round_trip():
+    snapshot = take_snapshot(played_farm(), SAVED_AT, START)
+    assert snapshot.tiles and snapshot.slots
+    assert decode(encode(snapshot)) == snapshot
+
+
+def test_decode_rejects_other_files():
+    with pytest.raises(ValueError):
+        decode(b"not a save file at all")
+
+
+def test_restore_continues_from_saved_progress():
+    farm = played_farm()
+    snapshot = decode(encode(take_snapshot(farm, SAVED_AT, START)))
+
+    # 在另一個時間點讀檔，之後的發展要與沒有存讀檔的農場相同
+    loaded_at = 50_000
+    restored = FarmModel(rows=2, cols=3)
+    start = restore_snapshot(restored, snapshot, loaded_at)
+    assert start == loaded_at - (SAVED_AT - START)
+    assert take_snapshot(restored, loaded_at, start) == snapshot
+    assert restored.mature_tiles() == farm.mature_tiles()
+
+    for step in range(1, 41):
+        farm.update(SAVED_AT + step * 250)
+        restored.update(loaded_at + step * 250)
+        assert take_snapshot(restored, loaded_at + step * 250, start) == take_snapshot(
+            farm, SAVED_AT + step * 250, START
+        )
+
+
+def test_restore_rejects_other_farm_size():
+    snapshot = take_snapshot(played_farm(), SAVED_AT, START)
+    with pytest.raises(ValueError):
+        restore_snapshot(FarmModel(rows=3, cols=3), snapshot, 0)
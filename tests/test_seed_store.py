@@ -0,0 +1,99 @@
+# tests/test_seed_store.py
+
+from farm_model import SeedStore
+
+
+def filled_store():
+    store = SeedStore(3)
+    store.add("wheat", 5)
+    store.add("corn", 2)
+    return store
+
+
+def test_add_stacks_same_seed_in_one_slot():
+    store = filled_store()
+    assert store.add("wheat", 3)
+    assert store.count("wheat") == 8
+    assert store.count("corn") == 2
+    assert store.count("rice") == 0
+    assert store.available_slots() == [0, 1]
+
+
+def test_add_many_adds_every_seed():
+    store = filled_store()
+    assert store.add_many({"wheat": 1, "rice": 4})
+    assert store.count("wheat") == 6
+    assert store.count("rice") == 4
+    assert store.available_slots() == [0, 1, 2]
+
+
+def test_add_many_is_all_or_nothing_when_full():
+    store = filled_store()
+    version = store.version
+    # 只剩一個空格子，放不下兩種新的種子
+    assert not store.add_many([("wheat", 1), ("rice", 1), ("bean", 1)])
+    assert store.count("wheat") == 5
+    assert "rice" not in store
+    assert "bean" not in store
+    assert store.version == version
+
+
+def test_add_many_counts_repeated_new_seed_once():
+    store = filled_store()
+    assert store.add_many([("rice", 1), ("rice", 2)])
+    assert store.count("rice") == 3
+
+
+def test_remove_item_and_remove():
+    store = filled_store()
+    assert store.remove_item("wheat", 2)
+    assert store.count("wheat") == 3
+    assert not store.remove_item("wheat", 4)
+    assert not store.remove_item("rice")
+    assert store.remove(1, 2)
+    assert "corn" not in store
+    assert not store.remove(1)
+
+
+def test_remove_many_is_all_or_nothing():
+    store = filled_store()
+    assert not store.remove_many({"wheat": 1, "corn": 3})
+    assert store.count("wheat") == 5
+    assert store.count("corn") == 2
+    assert store.remove_many({"wheat": 1, "corn": 2})
+    assert store.count("wheat") == 4
+    assert "corn" not in store
+
+
+def test_emptied_slot_is_reused():
+    store = filled_store()
+    store.remove_item("wheat", 5)
+    assert store.available_slots() == [1]
+    # 新的種子放進編號最小的空格子
+    store.add("rice")
+    assert store.items[0] == "rice"
+    assert store.available_slots() == [0, 1]
+
+
+def test_snapshot_and_restore():
+    store = filled_store()
+    items, quantities = store.snapshot()
+    assert items == ("wheat", "corn", None)
+    assert list(quantities) == [5, 2, 0]
+    # 快照是複本，之後的修改不影響它
+    store.add("wheat")
+    assert list(quantities) == [5, 2, 0]
+
+    restored = SeedStore(3)
+    restored.restore(list(zip(items, quantities)))
+    assert restored.snapshot() == (items, quantities)
+    assert restored.count("corn") == 2
+    assert restored.add("rice")
+    assert restored.items[2] == "rice"
+
+
+def test_restore_merges_split_stacks():
+    store = SeedStore(3)
+    store.restore([("wheat", 2), ("corn", 1), ("wheat", 3)])
+    assert store.count("wheat") == 5
+    assert store.available_slots() == [0, 1]
@@ -0,0 +1,72 @@
+# tests/test_vector_sim.py
+
+import numpy as np
+
+from farm_model import FarmModel
+from settings import BASE_GROW_TIME, WHEAT_SEED_NAME
+from vector_sim import GROWTH_BONUSES, VectorFarmSim
+
+TOTAL_TIME = 60_000
+
+
+def frames(sim):
+    # 與 VectorFarmSim.run 相同的時間軸
+    current_time = 0.0
+    while True:
+        current_time += sim.frame_time
+        if current_time >= TOTAL_TIME:
+            return
+        yield current_time
+
+
+def random_action(farm, now):
+    # VectorFarmSim 的動作在 1x1 的農場上沒有隨機的選擇：有成熟作物就收穫，否則放土 / 升級並種植
+    if farm.mature_tiles():
+        farm.harvest(0, 0)
+        return
+    farm.place_or_upgrade(0, 0)
+    slot = farm.seeds.slot_of.get(WHEAT_SEED_NAME)
+    if slot is not None:
+        farm.plant(0, 0, slot, now)
+
+
+def test_random_actions_agree_with_farm_model():
+    sim = VectorFarmSim(8, rows=1, cols=1, seed=0)
+    farms = [FarmModel(rows=1, cols=1) for _ in range(sim.num_farms)]
+    for now in frames(sim):
+        # 動作時間由固定的亂數種子決定，FarmModel 在同一幀執行同樣的規則
+        acting = now / 1000 >= sim.next_action_time
+        sim.step(now)
+        for i, farm in enumerate(farms):
+            farm.update(now)
+            if acting[i]:
+                random_action(farm, now)
+            assert sim.coins[i] == farm.coin.get_amount()
+            assert sim.seeds[i] == farm.seeds.count(WHEAT_SEED_NAME)
+            assert sim.levels[i, 0, 0] == farm.tiles.level(0, 0)
+            assert sim.stages[i, 0, 0] == farm.tiles.stage(0, 0)
+    assert all(farm.coin.get_amount() > 0 for farm in farms)
+    assert sim.coins.max() > sim.coins.min()
+
+
+def test_growth_and_seeds_agree_with_farm_model():
+    # 各等級的泥土上同時種下作物，不執行任何動作
+    sim = VectorFarmSim(1, rows=2, cols=2, seed=0)
+    sim.next_action_time[:] = np.inf
+    levels = np.array([[0, 1], [2, 3]])
+    sim.levels[0] = levels
+    sim.stages[0] = 2
+    sim.grow_interval[0] = BASE_GROW_TIME * (1 - GROWTH_BONUSES[levels])
+
+    farm = FarmModel(rows=2, cols=2)
+    farm.seeds.add(WHEAT_SEED_NAME, 4)
+    for (row, col), level in np.ndenumerate(levels):
+        farm.tiles.levels[farm.tiles.index(row, col)] = level
+        farm.plant(row, col, farm.seeds.slot_of[WHEAT_SEED_NAME], 0)
+
+    for now in frames(sim):
+        sim.step(now)
+        farm.update(now)
+        stages = [[farm.tiles.stage(row, col) for col in range(2)] for row in range(2)]
+        assert sim.stages[0].tolist() == stages
+        assert sim.seeds[0] == farm.seeds.count(WHEAT_SEED_NAME)
@@ -0,0 +1,70 @@
+# text_cache.py
+
+import time
+from collections import OrderedDict
+
+# 快取最多保留的文字圖片數量
+DEFAULT_CAPACITY = 256
+
+
+class TextCache:
+    """
+    文字圖片快取：以 (字體, 文字, 反鋸齒, 文字顏色, 背景顏色) 為 key，
+    內容沒變時直接回傳上次 font.render 的結果，超過容量時淘汰最久沒用到的項目 (LRU)。
+    回傳的 Surface 是共用的，需要修改（例如 set_alpha）時請先 copy()。
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 用來計算「每秒省下幾次 render」的統計區間
+        self.window_start = time.perf_counter()
+        self.window_hits = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, color, background)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            self.window_hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def saved_per_second(self):
+        """
+        回傳自上次呼叫以來，平均每秒省下的 font.render 次數，並開始新的統計區間。
+        """
+        now = time.perf_counter()
+        elapsed = now - self.window_start
+        saved = self.window_hits / elapsed if elapsed > 0 else 0.0
+        self.window_start = now
+        self.window_hits = 0
+        return saved
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self.surfaces),
+        }
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# 整個程式共用的文字快取
+text_cache = TextCache()
@@ -0,0 +1,191 @@
+# vector_sim.py
+
+import argparse
+import time
+
+import numpy as np
+
+from settings import (
+    FPS,
+    GRID_ROWS,
+    GRID_COLS,
+    DIRT_LEVELS,
+    INITIAL_COINS,
+    PLACE_DIRT_COST,
+    HARVEST_REWARD,
+    BASE_GROW_TIME,
+    SEED_INTERVAL,
+    PLANT_START_STAGE,
+    MAX_PLANT_STAGE,
+)
+
+# 各泥土等級的升級費用與成長加成（以等級為索引）
+UPGRADE_COSTS = np.array([level["upgrade_cost"] for level in DIRT_LEVELS], dtype=np.int64)
+GROWTH_BONUSES = np.array([level["growth_speed_bonus"] for level in DIRT_LEVELS], dtype=np.float64)
+MAX_LEVEL = len(DIRT_LEVELS) - 1
+
+
+class VectorFarmSim:
+    """
+    以 NumPy 陣列同時模擬大量農場，規則與 FarmModel / HeadlessGame 相同：
+    每一幀先執行到期的隨機動作（先收穫，否則隨機放土 / 升級並種植），
+    再生成種子、讓作物成長。所有農場共用同一條時間軸，逐幀批次更新。
+
+    狀態陣列：
+    - levels：泥土等級 (farms, rows, cols)，-1 表示沒有泥土
+    - stages：作物階段 (farms, rows, cols)，0 表示沒有作物
+    - last_growth：最後一次成長的時間（毫秒）
+    - coins / seeds / next_action_time：每個農場一個值
+    """
+
+    def __init__(self, num_farms, rows=GRID_ROWS, cols=GRID_COLS, seed=None):
+        self.num_farms = num_farms
+        self.rows = rows
+        self.cols = cols
+        self.rng = np.random.default_rng(seed)
+
+        shape = (num_farms, rows, cols)
+        self.levels = np.full(shape, -1, dtype=np.int8)
+        self.stages = np.zeros(shape, dtype=np.int8)
+        self.last_growth = np.zeros(shape, dtype=np.float64)
+        # 每格的成長間隔（毫秒），只在放土 / 升級時更新，不必每幀重算
+        self.grow_interval = np.full(shape, BASE_GROW_TIME * (1 - GROWTH_BONUSES[0]))
+
+        self.coins = np.full(num_farms, INITIAL_COINS, dtype=np.int64)
+        self.seeds = np.zeros(num_farms, dtype=np.int64)
+        self.next_action_time = np.zeros(num_farms, dtype=np.float64)  # 秒
+
+        # 所有農場同時生成種子，計時器只需要一個
+        self.seed_timer = 0.0
+        self.current_time = 0.0  # 毫秒
+        self.frame_time = 1000 / FPS
+
+    def step(self, current_time):
+        """推進到 current_time（毫秒）這一幀。"""
+        self.current_time = current_time
+        game_time = current_time / 1000.0
+
+        # 與 HeadlessGame 相同：先處理種子與成長，同一幀的動作就看得到這些變化
+        self.update_seeds(current_time)
+        self.update_growth(current_time)
+
+        acting = np.flatnonzero(game_time >= self.next_action_time)
+        if acting.size:
+            self.do_random_actions(acting, current_time)
+            # 設定下一次動作的時間點（隨機 2~5 秒後）
+            self.next_action_time[acting] = game_time + self.rng.integers(2, 6, size=acting.size)
+
+    def do_random_actions(self, farms, current_time):
+        """
+        對 farms 中的每個農場執行一次隨機動作：
+        有成熟作物就隨機收穫一株，否則隨機選一格放土（或升級）並種植。
+        """
+        tiles = self.rows * self.cols
+        stages = self.stages[farms].reshape(len(farms), tiles)
+        mature = stages == MAX_PLANT_STAGE
+        has_mature = mature.any(axis=1)
+
+        # 收穫：在成熟的格子中均勻隨機挑一格
+        harvesters = farms[has_mature]
+        if harvesters.size:
+            keys = self.rng.random((harvesters.size, tiles))
+            keys[~mature[has_mature]] = -1.0
+            tile = keys.argmax(axis=1)
+            r, c = np.divmod(tile, self.cols)
+            self.stages[harvesters, r, c] = 0
+            self.coins[harvesters] += HARVEST_REWARD
+
+        # 放土 / 升級並種植：隨機挑一格
+        builders = farms[~has_mature]
+        if builders.size:
+            tile = self.rng.integers(0, tiles, size=builders.size)
+            r, c = np.divmod(tile, self.cols)
+            levels = self.levels[builders, r, c].astype(np.int64)
+            coins = self.coins[builders]
+
+            place = (levels < 0) & (coins >= PLACE_DIRT_COST)
+            upgradable = (levels >= 0) & (levels < MAX_LEVEL)
+            costs = UPGRADE_COSTS[np.clip(levels, 0, MAX_LEVEL)]
+            upgrade = upgradable & (coins >= costs)
+
+            coins = coins - np.where(place, PLACE_DIRT_COST, 0) - np.where(upgrade, costs, 0)
+            levels = np.where(place, 0, levels + upgrade)
+            self.coins[builders] = coins
+            self.levels[builders, r, c] = levels
+            changed = place | upgrade
+            self.grow_interval[builders[changed], r[changed], c[changed]] = BASE_GROW_TIME * (
+                1 - GROWTH_BONUSES[levels[changed]]
+            )
+
+            plant = (
+                (levels >= 0)
+                & (self.stages[builders, r, c] == 0)
+                & (self.seeds[builders] > 0)
+            )
+            planters = builders[plant]
+            self.stages[planters, r[plant], c[plant]] = PLANT_START_STAGE
+            self.last_growth[planters, r[plant], c[plant]] = current_time
+            self.seeds[planters] -= 1
+
+    def update_seeds(self, current_time):
+        """每 SEED_INTERVAL 毫秒所有農場各增加一顆小麥種子。"""
+        if current_time >= self.seed_timer + SEED_INTERVAL:
+            self.seed_timer = current_time
+            self.seeds += 1
+
+    def update_growth(self, current_time):
+        """成長間隔到了的作物長一階。"""
+        growing = (self.stages > 0) & (self.stages < MAX_PLANT_STAGE)
+        if not growing.any():
+            return
+        due = growing & (current_time >= self.last_growth + self.grow_interval)
+        self.stages[due] += 1
+        self.last_growth[due] = current_time
+
+    def run(self, total_time=60, history=False):
+        """
+        逐幀模擬 total_time 秒，回傳每個農場的最終金幣。
+        history=True 時另外回傳每秒的金幣紀錄，形狀為 (seconds + 1, farms)。
+        """
+        coin_history = []
+        last_second = -1
+        current_time = 0.0
+        while True:
+            current_time += self.frame_time
+            game_time = current_time / 1000.0
+            if game_time >= total_time:
+                break
+            self.step(current_time)
+            if history and int(game_time) > last_second:
+                last_second = int(game_time)
+                coin_history.append(self.coins.copy())
+
+        if history:
+            # 與 HeadlessGame 相同，結束時再記錄最後一秒
+            if int(game_time) > last_second:
+                coin_history.append(self.coins.copy())
+            return self.coins.copy(), np.stack(coin_history)
+        return self.coins.copy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="以 NumPy 同時模擬大量農場（蒙地卡羅）。")
+    parser.add_argument("-n", "--num_farms", type=int, default=10000, help="農場數量（預設 10000）。")
+    parser.add_argument("-t", "--total_time", type=float, default=60, help="每局秒數（預設 60）。")
+    parser.add_argument("--seed", type=int, default=None, help="亂數種子。")
+    args = parser.parse_args()
+
+    sim = VectorFarmSim(args.num_farms, seed=args.seed)
+    start = time.perf_counter()
+    coins = sim.run(args.total_time)
+    elapsed = time.perf_counter() - start
+
+    p5, p50, p95 = np.percentile(coins, [5, 50, 95])
+    print(f"農場數量：{args.num_farms}，每局 {args.total_time:g} 秒，耗時 {elapsed:.2f} 秒")
+    print(f"最終金幣 平均 {coins.mean():.1f}，標準差 {coins.std():.1f}")
+    print(f"最終金幣 P5 / P50 / P95：{p5:.0f} / {p50:.0f} / {p95:.0f}")
+    print(f"吞吐量：{args.num_farms / elapsed:.0f} 局/秒")
+
+
+if __name__ == "__main__":
+    main()